@@ -0,0 +1,16 @@
+"""Benchmarks."""
+
+import subprocess
+
+
+def git_commit() -> str | None:
+    """Return the current commit, if inside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
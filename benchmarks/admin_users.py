@@ -0,0 +1,271 @@
+"""Check and benchmark the keyset-paginated admin user listing.
+
+Seeds ``--users`` synthetic users, walks every page of
+``GET /api/v1/admin/users`` for several filters and checks the pages
+together return exactly the users SQL finds, in order, and that
+tampered cursors are rejected with 422. Then times the first and the
+last page through ``find_page`` next to the equivalent ``OFFSET``
+query: keyset pages cost the same however deep they are.
+Requires a migrated Postgres configured through the usual ``DB_*``
+environment variables::
+
+    PYTHONPATH=src python -m benchmarks.admin_users --users 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+from backend.domain.repositories.user import UserFilter, UserPosition
+from backend.domain.value_objects.user import UserId
+from backend.infrastructure.database.user_copy import UserCopy
+from benchmarks.telegram import sign_init_data, synthetic_user
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    import httpx
+
+    from backend.infrastructure.repositories.user_asyncpg import (
+        AsyncpgUserRepository,
+    )
+
+# far above real Telegram IDs and the users of the other benchmarks
+ID_OFFSET = 8_000_000_000_000
+ADMIN_ID = ID_OFFSET - 1
+LANGUAGES = ("en", "ru", "de", None)
+PAGE_SIZE = 1000
+# tampered cursors, each must be rejected with 422 rather than fail in SQL
+BAD_CURSORS = (
+    "not a cursor",
+    f"2024-01-01T00:00:00+00:00|{ID_OFFSET}",
+    f"2024-01-01T00:00:00|{2**63}",
+    "2024-01-01T00:00:00|",
+)
+# several users share each creation time, ordered by ID among themselves
+SEED_STARTED = datetime(2024, 1, 1)
+FILTERS = (
+    UserFilter(),
+    UserFilter(language_code="ru"),
+    UserFilter(username_prefix="SEED_1"),
+    UserFilter(language_code="de", username_prefix="seed_2"),
+)
+
+
+def seed_record(index: int) -> tuple[Any, ...]:
+    """Return the ``COPY`` record of a synthetic user."""
+    return (
+        ID_OFFSET + index,
+        f"seed_{index}",
+        f"Seed {index}",
+        None,
+        LANGUAGES[index % len(LANGUAGES)],
+        None,
+        SEED_STARTED + timedelta(seconds=(index * 7919 % 100_003) // 3),
+    )
+
+
+async def seed(connection: asyncpg.Connection, users: int) -> None:
+    """Insert the synthetic users in batches."""
+    copier = UserCopy(connection)
+    for start in range(0, users, 10_000):
+        await copier.import_batch(
+            [seed_record(i) for i in range(start, min(users, start + 10_000))],
+        )
+    await connection.execute("ANALYZE users")
+
+
+def where(user_filter: UserFilter) -> tuple[str, list[str]]:
+    """Return the SQL condition of ``user_filter`` and its arguments."""
+    conditions, args = ["true"], []
+    if user_filter.language_code:
+        args.append(user_filter.language_code)
+        conditions.append(f"language_code = ${len(args)}")
+    if user_filter.username_prefix:
+        args.append(user_filter.username_prefix.lower())
+        conditions.append(f"starts_with(lower(username), ${len(args)})")
+    return " AND ".join(conditions), args
+
+
+async def expected_ids(
+    connection: asyncpg.Connection,
+    user_filter: UserFilter,
+) -> list[int]:
+    """Return the IDs of every user matching ``user_filter``, in order."""
+    condition, args = where(user_filter)
+    rows = await connection.fetch(
+        f"SELECT id FROM users WHERE {condition} "  # noqa: S608
+        "ORDER BY created_at, id",
+        *args,
+    )
+    return [row["id"] for row in rows]
+
+
+async def walk(
+    client: httpx.AsyncClient, user_filter: UserFilter
+) -> list[int]:
+    """Return the IDs of every page of the listing."""
+    params: dict[str, Any] = {"limit": PAGE_SIZE}
+    if user_filter.language_code:
+        params["language_code"] = user_filter.language_code
+    if user_filter.username_prefix:
+        params["username_prefix"] = user_filter.username_prefix
+
+    ids: list[int] = []
+    while True:
+        response = await client.get("/api/v1/admin/users", params=params)
+        response.raise_for_status()
+        page = response.json()
+        ids += [user["id"] for user in page["users"]]
+        if page["next_cursor"] is None:
+            return ids
+        params["cursor"] = page["next_cursor"]
+
+
+async def check_pages(connection: asyncpg.Connection) -> int:
+    """Walk the listing through the API, return the failures."""
+    from benchmarks.load import asgi_client
+
+    failures = 0
+    async with asgi_client() as (client, _):
+        response = await client.post(
+            "/api/v1/auth/telegram",
+            json={
+                "init_data": sign_init_data(
+                    os.environ["BOT_TOKEN"],
+                    synthetic_user(ADMIN_ID),
+                ),
+            },
+        )
+        client.cookies.set("token", response.cookies["token"])
+
+        for user_filter in FILTERS:
+            listed = await walk(client, user_filter)
+            expected = await expected_ids(connection, user_filter)
+            passed = listed == expected
+            failures += not passed
+            print(  # noqa: T201
+                f"{'ok' if passed else 'FAIL':<4} {user_filter}: "
+                f"{len(listed)} listed, {len(expected)} expected",
+            )
+
+        for raw in BAD_CURSORS:
+            cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+            response = await client.get(
+                "/api/v1/admin/users",
+                params={"cursor": cursor},
+            )
+            passed = response.status_code == 422
+            failures += not passed
+            print(  # noqa: T201
+                f"{'ok' if passed else 'FAIL':<4} cursor {raw!r}: "
+                f"{response.status_code}",
+            )
+
+        client.cookies.clear()
+        forbidden = await client.get("/api/v1/admin/users")
+        failures += forbidden.status_code != 401
+    return failures
+
+
+async def time_call(call: Callable[[], Awaitable[object]]) -> float:
+    """Return the median wall time of ``call`` in milliseconds."""
+    timings: list[float] = []
+    for _ in range(30):
+        started = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings[5:])
+
+
+async def bench_depth(
+    connection: asyncpg.Connection,
+    repository: AsyncpgUserRepository,
+) -> None:
+    """Time the first and the last page, keyset against ``OFFSET``."""
+    for user_filter in FILTERS:
+        ids = await expected_ids(connection, user_filter)
+        if len(ids) <= PAGE_SIZE:
+            continue
+
+        # position of the user before the last page
+        offset = len(ids) - PAGE_SIZE
+        row = await connection.fetchrow(
+            "SELECT created_at, id FROM users WHERE id = $1",
+            ids[offset - 1],
+        )
+        last = UserPosition(row["created_at"], UserId(row["id"]))
+
+        def page(after: UserPosition | None, f: UserFilter = user_filter):
+            return lambda: repository.find_page(after, PAGE_SIZE, f)
+
+        first_ms = await time_call(page(None))
+        last_ms = await time_call(page(last))
+        condition, args = where(user_filter)
+        offset_query = (
+            f"SELECT * FROM users WHERE {condition} "  # noqa: S608
+            f"ORDER BY created_at, id LIMIT {PAGE_SIZE} OFFSET {offset}"
+        )
+        offset_ms = await time_call(
+            lambda query=offset_query, args=args: connection.fetch(
+                query,
+                *args,
+            ),
+        )
+        print(  # noqa: T201
+            f"{user_filter}: {len(ids)} users, page 1 {first_ms:.1f}ms, "
+            f"last page {last_ms:.1f}ms, OFFSET last page {offset_ms:.1f}ms",
+        )
+
+
+async def main(users: int) -> int:
+    """Seed, check and time the listing."""
+    # read by the settings on import: the admin signs in like any user,
+    # init_data is only verified in production and limits would throttle
+    # the walk
+    os.environ["ENVIRONMENT"] = "production"
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["ADMIN_USER_IDS"] = str(ADMIN_ID)
+    from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
+    from backend.infrastructure.repositories.user_asyncpg import (
+        AsyncpgUserRepository,
+    )
+    from backend.shared import config
+
+    connection = await asyncpg.connect(config.db.dsn)
+    pool = AsyncpgPool(config.db.dsn, max_size=1)
+    try:
+        await connection.execute(
+            "DELETE FROM users WHERE id >= $1",
+            ADMIN_ID,
+        )
+        await seed(connection, users)
+        failures = await check_pages(connection)
+        await bench_depth(connection, AsyncpgUserRepository(pool))
+    finally:
+        await connection.execute(
+            "DELETE FROM users WHERE id >= $1",
+            ADMIN_ID,
+        )
+        await pool.close()
+        await connection.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200_000)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.users)))
@@ -0,0 +1,149 @@
+"""Benchmark ``AuthenticationMiddleware`` against the legacy implementation.
+
+Drives an authenticated ``GET /api/v1/user/me`` through a minimal app
+in-process over raw ASGI, so only middleware overhead is measured::
+
+    PYTHONPATH=src python -m benchmarks.auth_middleware --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.presentation.api.middlewares import (
+    AuthenticationMiddleware,
+    collect_public_paths,
+    public,
+)
+from backend.shared import jwt
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from starlette.types import ASGIApp, Message
+
+
+class LegacyAuthenticationMiddleware(BaseHTTPMiddleware):
+    """The previous ``BaseHTTPMiddleware`` based implementation."""
+
+    AUTH_EXCLUDE_PATHS = frozenset(
+        {"/api/v1/auth/telegram", "/health", "/docs", "/openapi.json"},
+    )
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """Dispatch request."""
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
+        path = request.url.path
+        if any(path.startswith(p) for p in self.AUTH_EXCLUDE_PATHS):
+            return await call_next(request)
+
+        token = request.cookies.get("token")
+        if not token:
+            return Response(status_code=401)
+
+        data = jwt.verify_auth_token(token)
+        request.state.user_id = int(data["sub"])
+        return await call_next(request)
+
+
+def build_app(middleware: str) -> ASGIApp:
+    """Build a minimal app guarded by the given middleware."""
+    app = FastAPI()
+
+    @app.get("/api/v1/user/me")
+    async def get_me(request: Request) -> dict[str, Any]:
+        return {"id": request.state.user_id}
+
+    @app.get("/health")
+    @public
+    async def health() -> dict[str, Any]:
+        return {"status": "ok"}
+
+    if middleware == "legacy":
+        app.add_middleware(LegacyAuthenticationMiddleware)
+    else:
+        app.add_middleware(
+            AuthenticationMiddleware,
+            public_paths=collect_public_paths(app.routes),
+        )
+
+    return app
+
+
+async def request(app: ASGIApp, cookie: bytes) -> int:
+    """Send one GET request and return the response status."""
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/user/me",
+        "raw_path": b"/api/v1/user/me",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"cookie", cookie)],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run_case(name: str, requests: int, cookie: bytes) -> None:
+    """Measure per-request latency for one middleware."""
+    app = build_app(name)
+    latencies: list[float] = []
+
+    for _ in range(requests):
+        started = time.perf_counter()
+        status = await request(app, cookie)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+        assert status == 200  # noqa: S101
+
+    latencies.sort()
+    print(  # noqa: T201
+        f"{name:<8} mean={statistics.fmean(latencies):.1f}us "
+        f"p50={latencies[len(latencies) // 2]:.1f}us "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1]:.1f}us",
+    )
+
+
+async def main(requests: int) -> None:
+    """Run the benchmark."""
+    token, _, _ = jwt.create_auth_token("1")
+    cookie = f"token={token}".encode()
+
+    for name in ("legacy", "asgi"):
+        await run_case(name, requests, cookie)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
@@ -0,0 +1,231 @@
+"""Differential check and benchmark of the init_data validator.
+
+Runs ``InitDataValidator`` and aiogram's ``safe_parse_webapp_init_data``
+over a corpus of valid, tampered, malformed and randomly mutated
+init_data and fails when they disagree on acceptance or on the parsed
+user. Then times both on valid data and on stale data::
+
+    PYTHONPATH=src python -m benchmarks.init_data --mutations 5000
+
+aiogram is a development dependency only, the application does not
+import it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import random
+import sys
+import timeit
+import urllib.parse
+from typing import Any
+
+from aiogram.utils.web_app import safe_parse_webapp_init_data
+
+from backend.shared.validators.webapp import (
+    InitDataValidator,
+    WebAppInitDataValidationError,
+)
+from benchmarks.telegram import sign_fields, sign_init_data, synthetic_user
+
+BOT_TOKEN = "123456:differential-check-token"
+AUTH_DATE = 1_700_000_000
+USER_FIELDS = (
+    "id",
+    "first_name",
+    "last_name",
+    "username",
+    "language_code",
+    "photo_url",
+)
+
+
+def corpus(mutations: int, seed: int) -> list[str]:
+    """Return init_data samples covering accepted and rejected inputs."""
+    rng = random.Random(seed)
+    user = synthetic_user(123456789)
+    valid = [
+        sign_init_data(BOT_TOKEN, user, AUTH_DATE),
+        sign_init_data(
+            BOT_TOKEN,
+            user,
+            AUTH_DATE,
+            query_id="AAHdF6IQAAAAAN0XohDhrOrc",
+            chat_type="sender",
+            chat_instance="-8127311939217460120",
+            start_param="ref=a&b c+d%",
+        ),
+        sign_init_data(
+            BOT_TOKEN,
+            {
+                "id": 1,
+                "first_name": "Ünïcødé 🚀 & = + % name",
+                "last_name": "line\nbreak",
+                "is_premium": True,
+                "allows_write_to_pm": True,
+            },
+            AUTH_DATE,
+        ),
+        sign_init_data(BOT_TOKEN, {"id": 42, "first_name": "Min"}, AUTH_DATE),
+        sign_fields(BOT_TOKEN, {"auth_date": str(AUTH_DATE)}),
+        sign_fields(
+            BOT_TOKEN,
+            {"auth_date": str(AUTH_DATE), "user": "[1, 2]", "x": "{}"},
+        ),
+    ]
+    signed = valid[0]
+    hash_ = urllib.parse.parse_qs(signed)["hash"][0]
+
+    samples = [
+        *valid,
+        # signature
+        sign_init_data("654321:other-token", user, AUTH_DATE),
+        signed.replace(hash_, hash_[:-1] + ("0" if hash_[-1] != "0" else "1")),
+        signed.replace(hash_, hash_.upper()),
+        signed.replace(f"hash={hash_}", "hash="),
+        signed.replace(f"&hash={hash_}", ""),
+        signed + "&hash=" + hash_,
+        signed + "&extra=1",
+        signed + "&extra=",
+        signed.replace(f"auth_date={AUTH_DATE}", f"auth_date={AUTH_DATE + 1}"),
+        signed.replace("bench_123456789", "bench_987654321"),
+        signed + "&user=" + urllib.parse.quote(json.dumps(user)),
+        signed + "&hash=" + "é",
+        # structure
+        "",
+        "hash",
+        "&",
+        "=",
+        "&&",
+        signed + "&",
+        "&" + signed,
+        signed.replace("&", "&&", 1),
+        signed.replace("&", ";"),
+        signed.replace("=", "%3D", 1),
+        # fields
+        sign_fields(BOT_TOKEN, {"user": json.dumps(user)}),
+        sign_fields(
+            BOT_TOKEN,
+            {"auth_date": "not-a-date", "user": json.dumps(user)},
+        ),
+        sign_fields(
+            BOT_TOKEN,
+            {"auth_date": str(AUTH_DATE), "user": "{not json}"},
+        ),
+        sign_fields(
+            BOT_TOKEN,
+            {"auth_date": str(AUTH_DATE), "user": '{"first_name": "No id"}'},
+        ),
+        sign_fields(
+            BOT_TOKEN,
+            {"auth_date": str(AUTH_DATE), "user": '{"id": 1}'},
+        ),
+    ]
+
+    for _ in range(mutations):
+        chars = list(rng.choice(valid))
+        position = rng.randrange(len(chars))
+        operation = rng.randrange(3)
+        if operation == 0:
+            del chars[position]
+        elif operation == 1:
+            chars.insert(position, rng.choice("&=+%abc0\n"))
+        else:
+            chars[position] = rng.choice("&=+%abc0")
+        samples.append("".join(chars))
+
+    return samples
+
+
+def reference(init_data: str) -> tuple[Any, ...] | None:
+    """Validate with aiogram, None when rejected."""
+    try:
+        data = safe_parse_webapp_init_data(BOT_TOKEN, init_data)
+    except Exception:  # noqa: BLE001
+        return None
+
+    return (
+        int(data.auth_date.timestamp()),
+        tuple(getattr(data.user, name) for name in USER_FIELDS)
+        if data.user
+        else None,
+    )
+
+
+def candidate(
+    validator: InitDataValidator,
+    init_data: str,
+) -> tuple[Any, ...] | None:
+    """Validate with the application's validator, None when rejected."""
+    try:
+        data = validator.validate(init_data)
+    except WebAppInitDataValidationError:
+        return None
+
+    return (
+        data.auth_date,
+        tuple(getattr(data.user, name) for name in USER_FIELDS)
+        if data.user
+        else None,
+    )
+
+
+def check(samples: list[str]) -> int:
+    """Compare both validators on every sample, return disagreements."""
+    validator = InitDataValidator(BOT_TOKEN)
+    accepted = 0
+    mismatches = 0
+    for init_data in samples:
+        expected = reference(init_data)
+        actual = candidate(validator, init_data)
+        accepted += expected is not None
+        if expected != actual:
+            mismatches += 1
+            print(  # noqa: T201
+                f"MISMATCH {init_data!r}\n"
+                f"  aiogram: {expected}\n  validator: {actual}",
+            )
+
+    print(  # noqa: T201
+        f"{len(samples)} samples, {accepted} accepted by aiogram, "
+        f"{mismatches} mismatches",
+    )
+    return mismatches
+
+
+def bench() -> None:
+    """Time both validators on valid and on stale init_data."""
+    init_data = sign_init_data(BOT_TOKEN, synthetic_user(123456789))
+    stale = sign_init_data(BOT_TOKEN, synthetic_user(123456789), AUTH_DATE)
+    validator = InitDataValidator(BOT_TOKEN, max_age=86400)
+
+    def reject(init_data: str) -> None:
+        with contextlib.suppress(WebAppInitDataValidationError):
+            validator.validate(init_data)
+
+    cases = {
+        "aiogram valid": lambda: safe_parse_webapp_init_data(
+            BOT_TOKEN,
+            init_data,
+        ),
+        "validator valid": lambda: validator.validate(init_data),
+        "validator stale": lambda: reject(stale),
+    }
+    for name, func in cases.items():
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f"{name:<16} {best * 1_000_000:8.2f}us")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mutations", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if check(corpus(args.mutations, args.seed)):
+        sys.exit(1)
+    bench()
@@ -0,0 +1,101 @@
+"""Benchmark ``PydanticJSONResponse`` against FastAPI's default path.
+
+Drives ``GET /api/v1/user/me`` through a minimal app in-process over raw
+ASGI and reports latency plus the peak memory allocated per response::
+
+    PYTHONPATH=src python -m benchmarks.json_response --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from fastapi import FastAPI
+from starlette.responses import Response
+
+from backend.domain.entities.user import User
+from backend.domain.value_objects.user import (
+    FirstName,
+    LanguageCode,
+    LastName,
+    PhotoUrl,
+    UserId,
+    Username,
+)
+from backend.presentation.api.models.user.me import UserMeResponse
+from backend.presentation.api.responses import PydanticJSONResponse
+from benchmarks.auth_middleware import request
+
+USER = User(
+    id=UserId(123456789),
+    first_name=FirstName("Pavel"),
+    last_name=LastName("Durov"),
+    username=Username("durov"),
+    photo_url=PhotoUrl("https://t.me/i/userpic/320/durov.jpg"),
+    language_code=LanguageCode("en"),
+)
+
+
+def build_app(path: str) -> FastAPI:
+    """Build a minimal app serving the user profile."""
+    if path == "default":
+        app = FastAPI()
+
+        @app.get("/api/v1/user/me", response_model=UserMeResponse)
+        async def get_me() -> UserMeResponse:
+            return UserMeResponse.from_entity(USER)
+
+    else:
+        app = FastAPI(default_response_class=PydanticJSONResponse)
+
+        @app.get("/api/v1/user/me", response_model=UserMeResponse)
+        async def get_me() -> Response:
+            return PydanticJSONResponse(UserMeResponse.from_entity(USER))
+
+    return app
+
+
+async def run_case(name: str, requests: int) -> None:
+    """Measure latency and peak allocation for one response path."""
+    app = build_app(name)
+    latencies: list[float] = []
+
+    for _ in range(requests):
+        started = time.perf_counter()
+        await request(app, b"")
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+
+    peaks: list[int] = []
+    tracemalloc.start()
+    for _ in range(1000):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await request(app, b"")
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    latencies.sort()
+    print(  # noqa: T201
+        f"{name:<8} mean={statistics.fmean(latencies):.1f}us "
+        f"p50={latencies[len(latencies) // 2]:.1f}us "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1]:.1f}us "
+        f"peak_alloc={statistics.fmean(peaks):.0f}B",
+    )
+
+
+async def main(requests: int) -> None:
+    """Run the benchmark."""
+    for name in ("default", "fast"):
+        await run_case(name, requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
@@ -0,0 +1,346 @@
+"""End-to-end load benchmark for the public routes.
+
+Authenticates synthetic users through ``POST /api/v1/auth/telegram`` with
+correctly signed init_data, then drives ``GET /api/v1/user/me`` with their
+tokens, ``GET /api/v1/users`` with pages of their IDs and ``GET /health``.
+Runs in-process through the ASGI app (needs a migrated database, reports
+DB queries per request) or against a running server started with
+``ENVIRONMENT=production RATE_LIMIT_ENABLED=false``::
+
+    PYTHONPATH=src python -m benchmarks.load --users 2000
+    PYTHONPATH=src python -m benchmarks.load --url http://localhost:5000
+    PYTHONPATH=src python -m benchmarks.load --compare old.json new.json
+
+Results are written as JSON tagged with the current commit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from benchmarks import git_commit
+from benchmarks.telegram import FIRST_SYNTHETIC_ID, synthetic_init_data
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator, Sequence
+
+RESULTS_DIR = Path(__file__).parent / "results"
+METRICS = (
+    "throughput_rps",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "queries_per_request",
+)
+
+Call = tuple[str, str, dict[str, Any]]
+
+
+class QueryCounter:
+    """Count statements executed by the app's engine."""
+
+    def __init__(self) -> None:
+        """Initialize the query counter."""
+        self.count = 0
+
+    def __call__(self, *_: Any) -> None:  # noqa: ANN401
+        """Count one statement."""
+        self.count += 1
+
+
+@asynccontextmanager
+async def asgi_client() -> AsyncIterator[
+    tuple[httpx.AsyncClient, QueryCounter | None]
+]:
+    """Start the app in-process and yield a client bound to it."""
+    # init_data is only verified in production, limits would throttle
+    # thousands of users sharing one client address; forced because
+    # make loads .env, which sets ENVIRONMENT=development
+    os.environ["ENVIRONMENT"] = "production"
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+    from sqlalchemy import event
+
+    from backend.__main__ import app, container
+    from backend.shared import config
+    from backend.shared._config import DatabaseBackend
+
+    # statements are only counted through the SQLAlchemy engine
+    queries = None
+    if config.db.backend == DatabaseBackend.SQLALCHEMY:
+        queries = QueryCounter()
+        engine = container.service().db().engine()
+        event.listen(engine.sync_engine, "before_cursor_execute", queries)
+
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            cookies=_no_cookies(),
+        ) as client,
+    ):
+        yield client, queries
+
+
+@asynccontextmanager
+async def server_client(
+    url: str,
+    concurrency: int,
+) -> AsyncIterator[tuple[httpx.AsyncClient, QueryCounter | None]]:
+    """Yield a client for a running server."""
+    async with httpx.AsyncClient(
+        base_url=url,
+        cookies=_no_cookies(),
+        limits=httpx.Limits(max_connections=concurrency),
+        timeout=30,
+    ) as client:
+        yield client, None
+
+
+def _no_cookies() -> CookieJar:
+    """Cookie jar refusing all cookies, tokens are sent explicitly."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    calls: Sequence[Call],
+    concurrency: int,
+    queries: QueryCounter | None,
+    tokens: list[str] | None = None,
+) -> dict[str, Any]:
+    """Send ``calls`` with ``concurrency`` workers and summarize them."""
+    pending: Iterator[Call] = iter(calls)
+    latencies: list[float] = []
+    statuses: Counter[int] = Counter()
+
+    async def worker() -> None:
+        for method, path, kwargs in pending:
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] += 1
+
+            token = response.cookies.get("token")
+            if tokens is not None and token:
+                tokens.append(token)
+
+    queries_before = queries.count if queries else 0
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(n for status, n in statuses.items() if status >= 400),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "p50_ms": _percentile(latencies, 0.50),
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+        "queries_per_request": (
+            round((queries.count - queries_before) / len(latencies), 3)
+            if queries
+            else None
+        ),
+    }
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    """Return a percentile of sorted values."""
+    index = min(len(values) - 1, int(len(values) * fraction))
+    return round(values[index], 3)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run all phases and return the results."""
+    bot_token = args.bot_token or os.environ["BOT_TOKEN"]
+    init_data = synthetic_init_data(bot_token, args.users)
+
+    client_context = (
+        server_client(args.url, args.concurrency)
+        if args.url
+        else asgi_client()
+    )
+
+    phases: dict[str, Any] = {}
+    async with client_context as (client, queries):
+        tokens: list[str] = []
+        phases["auth_telegram"] = await run_phase(
+            client,
+            [
+                ("POST", "/api/v1/auth/telegram", {"json": {"init_data": d}})
+                for d in init_data
+            ],
+            args.concurrency,
+            queries,
+            tokens,
+        )
+        if not tokens:
+            msg = "No user authenticated, check BOT_TOKEN and ENVIRONMENT"
+            raise SystemExit(msg)
+
+        # outside production every init_data signs in the same stub user
+        me = await client.get(
+            "/api/v1/user/me",
+            headers={"Cookie": f"token={tokens[0]}"},
+        )
+        if me.json().get("id", 0) < FIRST_SYNTHETIC_ID:
+            msg = "init_data is not verified, run with ENVIRONMENT=production"
+            raise SystemExit(msg)
+
+        phases["user_me"] = await run_phase(
+            client,
+            [
+                (
+                    "GET",
+                    "/api/v1/user/me",
+                    {
+                        "headers": {
+                            "Cookie": f"token={tokens[i % len(tokens)]}"
+                        }
+                    },
+                )
+                for i in range(args.requests)
+            ],
+            args.concurrency,
+            queries,
+        )
+        rng = random.Random(0)
+        phases["users_batch"] = await run_phase(
+            client,
+            [
+                (
+                    "GET",
+                    "/api/v1/users",
+                    {
+                        "params": {
+                            "ids": rng.sample(
+                                range(
+                                    FIRST_SYNTHETIC_ID,
+                                    FIRST_SYNTHETIC_ID + args.users,
+                                ),
+                                min(args.batch_size, args.users),
+                            ),
+                        },
+                        "headers": {
+                            "Cookie": f"token={tokens[i % len(tokens)]}"
+                        },
+                    },
+                )
+                for i in range(args.requests)
+            ],
+            args.concurrency,
+            queries,
+        )
+        phases["health"] = await run_phase(
+            client,
+            [("GET", "/health", {})] * args.requests,
+            args.concurrency,
+            queries,
+        )
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or "asgi",
+        "users": args.users,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "phases": phases,
+    }
+
+
+def print_results(results: dict[str, Any]) -> None:
+    """Print a results table."""
+    print(  # noqa: T201
+        f"target={results['target']} commit={results['commit']} "
+        f"users={results['users']} concurrency={results['concurrency']}",
+    )
+    for name, phase in results["phases"].items():
+        print(  # noqa: T201
+            f"{name:<14} n={phase['requests']:<6} "
+            f"errors={phase['errors']:<5} "
+            f"rps={phase['throughput_rps']:<8} "
+            f"p50={phase['p50_ms']:.2f}ms p95={phase['p95_ms']:.2f}ms "
+            f"p99={phase['p99_ms']:.2f}ms "
+            f"queries/req={phase['queries_per_request']}",
+        )
+
+
+def compare(old_path: Path, new_path: Path) -> None:
+    """Print the change of every metric between two result files."""
+    old = json.loads(old_path.read_text())
+    new = json.loads(new_path.read_text())
+    print(f"{old['commit']} -> {new['commit']}")  # noqa: T201
+
+    for name, new_phase in new["phases"].items():
+        old_phase = old["phases"].get(name)
+        if old_phase is None:
+            continue
+
+        for metric in METRICS:
+            before, after = old_phase[metric], new_phase[metric]
+            if before is None or after is None:
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            print(  # noqa: T201
+                f"{name:<14} {metric:<20} {before:>10} -> {after:<10} "
+                f"({change:+.1f}%)",
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="running server, in-process if unset")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="IDs per GET /api/v1/users",
+    )
+    parser.add_argument("--bot-token", help="defaults to BOT_TOKEN")
+    parser.add_argument("--output", type=Path, help="results JSON path")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("OLD", "NEW"),
+        help="compare two results files instead of running",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        raise SystemExit(0)
+
+    results = asyncio.run(run(args))
+    print_results(results)
+
+    output = args.output or RESULTS_DIR / (
+        f"load-{results['commit'] or 'local'}-{int(time.time())}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"results written to {output}")  # noqa: T201
@@ -0,0 +1,70 @@
+"""Benchmark ``MetricsMiddleware`` overhead.
+
+Drives ``GET /api/v1/user/me`` through a minimal app in-process over raw
+ASGI with and without the middleware::
+
+    PYTHONPATH=src python -m benchmarks.metrics --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+from fastapi import FastAPI
+
+from backend.presentation.api.middlewares import MetricsMiddleware
+from benchmarks.auth_middleware import request
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+
+
+def build_app(instrumented: bool) -> ASGIApp:  # noqa: FBT001
+    """Build a minimal app, optionally wrapped by the middleware."""
+    app = FastAPI()
+
+    @app.get("/api/v1/user/me")
+    async def get_me() -> dict[str, Any]:
+        return {"id": 1}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware, routes=app.routes)
+
+    return app
+
+
+async def run_case(instrumented: bool, requests: int) -> None:  # noqa: FBT001
+    """Measure per-request latency."""
+    app = build_app(instrumented)
+    latencies: list[float] = []
+
+    for _ in range(requests):
+        started = time.perf_counter()
+        await request(app, b"")
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+
+    latencies.sort()
+    print(  # noqa: T201
+        f"metrics={instrumented!s:<5} "
+        f"mean={statistics.fmean(latencies):.1f}us "
+        f"p50={latencies[len(latencies) // 2]:.1f}us "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1]:.1f}us",
+    )
+
+
+async def main(requests: int) -> None:
+    """Run the benchmark."""
+    for instrumented in (False, True):
+        await run_case(instrumented, requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
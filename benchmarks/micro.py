@@ -0,0 +1,215 @@
+"""Micro-benchmarks for the code on every request, with a regression gate.
+
+Times value-object construction, ``UserAdapter`` conversions,
+``UserMeResponse`` building and rendering, JWT creation and verification
+and init_data validation. Each benchmark reports the best per-call time
+out of several repeats::
+
+    PYTHONPATH=src python -m benchmarks.micro                  # run
+    PYTHONPATH=src python -m benchmarks.micro --save-baseline --rounds 3
+    PYTHONPATH=src python -m benchmarks.micro --check --threshold 0.2
+
+``--check`` exits with status 1 when any benchmark is slower than the
+baseline by more than the threshold. Baselines are machine specific,
+record them on the machine that runs the check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from benchmarks import git_commit
+from benchmarks.telegram import sign_init_data, synthetic_user
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BASELINE = Path(__file__).parent / "baseline.json"
+REPEAT = 25
+
+
+def collect() -> dict[str, Callable[[], object]]:
+    """Return the benchmarks by name."""
+    # init_data is only verified in production; forced because make
+    # loads .env, which sets ENVIRONMENT=development
+    os.environ["ENVIRONMENT"] = "production"
+
+    from backend.domain.entities.user import User
+    from backend.domain.value_objects.user import (
+        FirstName,
+        LanguageCode,
+        LastName,
+        PhotoUrl,
+        UserId,
+        Username,
+    )
+    from backend.infrastructure.database.adapters.user import UserAdapter
+    from backend.presentation.api.models.user.me import UserMeResponse
+    from backend.presentation.api.responses import PydanticJSONResponse
+    from backend.shared import config
+    from backend.shared.jwt import create_auth_token, verify_auth_token
+    from backend.shared.validators.webapp import validate_init_data
+
+    payload = synthetic_user(123456789)
+    user = User(
+        id=UserId(payload["id"]),
+        first_name=FirstName(payload["first_name"]),
+        last_name=LastName(payload["last_name"]),
+        username=Username(payload["username"]),
+        photo_url=PhotoUrl(payload["photo_url"]),
+        language_code=LanguageCode(payload["language_code"]),
+    )
+    model = UserAdapter.to_model(user)
+    row = UserAdapter.to_values(user)
+    response = UserMeResponse.from_entity(user)
+    token, _, _ = create_auth_token(str(user.id.value))
+    init_data = sign_init_data(config.app.bot_token, payload)
+    if not config.app.is_production:
+        msg = "init_data is not verified, settings were loaded too early"
+        raise SystemExit(msg)
+
+    return {
+        "value_objects.user_id": lambda: UserId(payload["id"]),
+        "value_objects.first_name": lambda: FirstName(payload["first_name"]),
+        "value_objects.last_name": lambda: LastName(payload["last_name"]),
+        "value_objects.username": lambda: Username(payload["username"]),
+        "value_objects.photo_url": lambda: PhotoUrl(payload["photo_url"]),
+        "value_objects.language_code": lambda: LanguageCode(
+            payload["language_code"],
+        ),
+        "adapter.to_entity": lambda: UserAdapter.to_entity(model),
+        "adapter.to_model": lambda: UserAdapter.to_model(user),
+        "adapter.from_row": lambda: UserAdapter.from_row(row),
+        "api.user_me_from_entity": lambda: UserMeResponse.from_entity(user),
+        "api.user_me_render": lambda: PydanticJSONResponse(response),
+        "jwt.create_auth_token": lambda: create_auth_token("123456789"),
+        "jwt.verify_auth_token": lambda: verify_auth_token(token),
+        "webapp.validate_init_data": lambda: validate_init_data(init_data),
+    }
+
+
+def measure(func: Callable[[], object]) -> float:
+    """Return the best time per call in nanoseconds.
+
+    Many short repeats (about 20ms each) make the minimum robust against
+    scheduler noise.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, number // 10)
+    best = min(timer.repeat(repeat=REPEAT, number=number))
+    return best / number * 1_000_000_000
+
+
+def run(pattern: str | None, rounds: int) -> dict[str, float]:
+    """Run the benchmarks matching ``pattern``, best of ``rounds``."""
+    benchmarks = {
+        name: func
+        for name, func in collect().items()
+        if not pattern or pattern in name
+    }
+    results: dict[str, float] = {}
+    for _ in range(rounds):
+        for name, func in benchmarks.items():
+            elapsed = round(measure(func), 1)
+            results[name] = min(results.get(name, elapsed), elapsed)
+
+    return results
+
+
+def check(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Print the results against the baseline and return regressions."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<32} {current:>12.1f}ns  (new)")  # noqa: T201
+            continue
+
+        change = (current - previous) / previous
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(  # noqa: T201
+            f"{name:<32} {current:>12.1f}ns  "
+            f"baseline {previous:>12.1f}ns  {change:+7.1%}{flag}",
+        )
+
+    return regressions
+
+
+def main() -> int:
+    """Run the suite and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", help="only run benchmarks containing this")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=1,
+        help="run the suite this many times and keep the best results",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the results as the new baseline",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail when a benchmark regresses beyond the threshold",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown as a fraction, default 0.2 (20%%)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.filter, args.rounds)
+
+    if args.save_baseline:
+        document: dict[str, Any] = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "benchmarks": results,
+        }
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        for name, current in results.items():
+            print(f"{name:<32} {current:>12.1f}ns")  # noqa: T201
+        print(f"baseline written to {args.baseline}")  # noqa: T201
+        return 0
+
+    baseline = (
+        json.loads(args.baseline.read_text())["benchmarks"]
+        if args.baseline.exists()
+        else {}
+    )
+    regressions = check(results, baseline, args.threshold)
+
+    if args.check and regressions:
+        print(  # noqa: T201
+            f"{len(regressions)} benchmark(s) regressed more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}",
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Benchmark the rate limiter.
+
+Measures the cost of a single bucket hit with the in-memory backend and
+the per-request overhead of the ``rate_limit`` dependency on a minimal app
+driven in-process over raw ASGI::
+
+    PYTHONPATH=src python -m benchmarks.rate_limit --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from fastapi import Depends, FastAPI
+
+from backend.application.dtos.rate_limit import Rate
+from backend.infrastructure.services.rate_limit import InMemoryRateLimiter
+from backend.presentation.api.rate_limit import rate_limit
+from benchmarks.auth_middleware import request
+
+
+async def bench_hits(hits: int, keys: int, max_keys: int) -> None:
+    """Measure ``hit`` calls spread over ``keys`` distinct keys."""
+    limiter = InMemoryRateLimiter(max_keys=max_keys)
+    rate = Rate.parse("1000000/second")
+    names = [f"/route:ip:{index}" for index in range(keys)]
+
+    started = time.perf_counter()
+    for index in range(hits):
+        await limiter.hit(names[index % keys], rate)
+    elapsed = time.perf_counter() - started
+
+    print(  # noqa: T201
+        f"hit keys={keys:<7} max_keys={max_keys:<7} "
+        f"{elapsed / hits * 1_000_000_000:.0f}ns/hit",
+    )
+
+
+def build_app(limited: bool) -> FastAPI:  # noqa: FBT001
+    """Build a minimal app with or without a rate limited route."""
+    app = FastAPI()
+    app.state.limiter = InMemoryRateLimiter(max_keys=100_000)
+
+    dependencies = [Depends(rate_limit("1000000/second"))] if limited else None
+
+    @app.get("/api/v1/user/me", dependencies=dependencies)
+    async def get_me() -> dict[str, Any]:
+        return {"id": 1}
+
+    return app
+
+
+async def bench_requests(requests: int) -> None:
+    """Measure per-request latency with and without the dependency."""
+    for limited in (False, True):
+        app = build_app(limited)
+        latencies: list[float] = []
+
+        for _ in range(requests):
+            started = time.perf_counter()
+            await request(app, b"")
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+
+        latencies.sort()
+        print(  # noqa: T201
+            f"request limited={limited!s:<5} "
+            f"mean={statistics.fmean(latencies):.1f}us "
+            f"p50={latencies[len(latencies) // 2]:.1f}us "
+            f"p99={latencies[int(len(latencies) * 0.99) - 1]:.1f}us",
+        )
+
+
+async def main(requests: int) -> None:
+    """Run the benchmark."""
+    await bench_hits(requests * 10, keys=1, max_keys=100_000)
+    await bench_hits(requests * 10, keys=200_000, max_keys=100_000)
+    await bench_requests(requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
@@ -0,0 +1,245 @@
+"""Benchmark ``UserRepository`` statements against the legacy ones.
+
+Compares the pre-built, parameter-bound statements with the legacy paths
+(``session.get`` for lookups, statements rebuilt on every call for
+upserts), batch lookups with ``find_many`` against one ``find_by_id`` per
+user, and reports CPU time per call in this process, wall time and
+the compiled SQL cache outcomes. Requires a migrated Postgres configured
+through the usual ``DB_*`` environment variables::
+
+    PYTHONPATH=src python -m benchmarks.repository --calls 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, event, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.infrastructure.database.adapters.user import UserAdapter
+from backend.infrastructure.database.models.user import UserModel
+from backend.infrastructure.repositories.user import UserRepository
+from backend.shared import config
+from benchmarks.user_save import ID_OFFSET, make_user
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from backend.domain.entities.user import User
+
+PROFILE_COLUMNS = (
+    UserModel.username,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.language_code,
+    UserModel.photo_url,
+)
+
+
+def legacy_upsert(values: list[dict[str, Any]]) -> Any:  # noqa: ANN401
+    """Build the upsert the way the repository used to, on every call."""
+    stmt = insert(UserModel).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[UserModel.id],
+        set_={
+            column.key: stmt.excluded[column.key] for column in PROFILE_COLUMNS
+        },
+        where=or_(
+            *(
+                column.is_distinct_from(stmt.excluded[column.key])
+                for column in PROFILE_COLUMNS
+            ),
+        ),
+    )
+
+
+async def legacy_find(session: AsyncSession, index: int) -> None:
+    """Find a user through the ORM identity map."""
+    model = await session.get(UserModel, ID_OFFSET + index)
+    assert model is not None  # noqa: S101
+    UserAdapter.to_entity(model)
+
+
+async def legacy_save(session: AsyncSession, index: int) -> None:
+    """Upsert a user with a freshly built statement."""
+    user = make_user(index, 1)
+    result = await session.execute(
+        legacy_upsert([UserAdapter.to_values(user)]).returning(
+            *UserModel.__table__.columns,
+        ),
+    )
+    result.mappings().first()
+
+
+async def legacy_save_many(session: AsyncSession, users: list[User]) -> None:
+    """Upsert users with a multi-row VALUES statement."""
+    await session.execute(
+        legacy_upsert([UserAdapter.to_values(user) for user in users]),
+    )
+
+
+async def find(session: AsyncSession, index: int) -> None:
+    """Find a user through the repository."""
+    user = make_user(index, 0).id
+    assert await UserRepository(session).find_by_id(user)  # noqa: S101
+
+
+async def find_each(session: AsyncSession, indexes: list[int]) -> None:
+    """Find a batch of users with one query per user."""
+    for index in indexes:
+        await find(session, index)
+
+
+async def find_many(session: AsyncSession, indexes: list[int]) -> None:
+    """Find a batch of users with a single query."""
+    users = await UserRepository(session).find_many(
+        [make_user(index, 0).id for index in indexes],
+    )
+    assert len(users) == len(indexes)  # noqa: S101
+
+
+async def save(session: AsyncSession, index: int) -> None:
+    """Upsert a user through the repository."""
+    await UserRepository(session).save(make_user(index, 1))
+
+
+async def save_many(session: AsyncSession, users: list[User]) -> None:
+    """Upsert users through the repository."""
+    await UserRepository(session).save_many(users)
+
+
+async def run_case(
+    name: str,
+    call: Callable[[AsyncSession, Any], Awaitable[None]],
+    arguments: Sequence[Any],
+    session_factory: async_sessionmaker[AsyncSession],
+    outcomes: Counter[str],
+) -> None:
+    """Run ``call`` once per argument, each in its own transaction."""
+    outcomes.clear()
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+
+    for argument in arguments:
+        async with session_factory() as session:
+            await call(session, argument)
+            await session.commit()
+
+    cpu = (time.process_time() - cpu_started) / len(arguments) * 1e6
+    wall = (time.perf_counter() - wall_started) / len(arguments) * 1e6
+    print(  # noqa: T201
+        f"{name:<18} cpu={cpu:8.1f}us/call wall={wall:8.1f}us/call "
+        f"compiled_cache={dict(outcomes)}",
+    )
+
+
+async def main(calls: int, batches: int) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(config.db.url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    outcomes: Counter[str] = Counter()
+
+    def observe(*args: Any) -> None:  # noqa: ANN401
+        context = args[4]
+        if context is not None:
+            outcomes[context.cache_hit.name.lower()] += 1
+
+    event.listen(engine.sync_engine, "after_cursor_execute", observe)
+
+    async def cleanup() -> None:
+        async with session_factory() as session:
+            await session.execute(
+                delete(UserModel).where(UserModel.id >= ID_OFFSET),
+            )
+            await session.commit()
+
+    rng = random.Random(0)
+    indexes = list(range(calls))
+    # write-behind batches of varying sizes
+    batch_users = [
+        [make_user(calls + i, 2) for i in rng.sample(range(5000), size)]
+        for size in (rng.randint(1, 500) for _ in range(batches))
+    ]
+    # leaderboard pages
+    lookups = [rng.sample(indexes, min(100, calls)) for _ in range(batches)]
+
+    try:
+        await cleanup()
+        async with session_factory() as session:
+            await UserRepository(session).save_many(
+                [make_user(index, 0) for index in indexes],
+            )
+            await session.commit()
+
+        # warm the connection and both compiled caches
+        for index in indexes[:50]:
+            async with session_factory() as session:
+                await legacy_find(session, index)
+                await find(session, index)
+
+        await run_case(
+            "legacy find",
+            legacy_find,
+            indexes,
+            session_factory,
+            outcomes,
+        )
+        await run_case("find_by_id", find, indexes, session_factory, outcomes)
+        await run_case(
+            "find_by_id x100",
+            find_each,
+            lookups,
+            session_factory,
+            outcomes,
+        )
+        await run_case(
+            "find_many 100",
+            find_many,
+            lookups,
+            session_factory,
+            outcomes,
+        )
+        await run_case(
+            "legacy save",
+            legacy_save,
+            indexes,
+            session_factory,
+            outcomes,
+        )
+        await run_case("save", save, indexes, session_factory, outcomes)
+        await run_case(
+            "legacy save_many",
+            legacy_save_many,
+            batch_users,
+            session_factory,
+            outcomes,
+        )
+        await run_case(
+            "save_many",
+            save_many,
+            batch_users,
+            session_factory,
+            outcomes,
+        )
+    finally:
+        await cleanup()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--batches", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.calls, args.batches))
@@ -0,0 +1,90 @@
+"""Benchmark a request composing several use cases, with and without scope.
+
+Runs a login followed by a profile lookup (``EnsureUserUseCase`` then
+``GetUserUseCase``, the cache is invalidated in between) the way a
+handler composing both would, once with a unit of work per use case and
+once inside the request-scoped unit of work, and reports the connection
+pool checkouts, statements and CPU time per request. Requires a migrated
+Postgres configured through the usual ``DB_*`` environment variables and
+the ``sqlalchemy`` backend::
+
+    PYTHONPATH=src python -m benchmarks.request_scope --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from backend.containers import Container
+from backend.domain.exceptions.user import UserNotFoundError
+from backend.domain.value_objects.user import UserId
+from benchmarks.user_save import ID_OFFSET, StatementCounter, make_user
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from contextlib import AbstractAsyncContextManager
+
+
+async def main(requests: int) -> None:
+    """Run the composed request in both modes."""
+    container = Container()
+    services = container.service()
+    engine = services.db().engine()
+    uow_factory = services.uow()
+    ensure = container.user_use_case().ensure()
+    get = container.user_use_case().get()
+
+    checkouts, statements = StatementCounter(), StatementCounter()
+    event.listen(engine.sync_engine.pool, "checkout", checkouts)
+    event.listen(engine.sync_engine, "before_cursor_execute", statements)
+
+    @contextlib.asynccontextmanager
+    async def unscoped() -> AsyncIterator[None]:
+        yield
+
+    modes: dict[str, Callable[[], AbstractAsyncContextManager[None]]] = {
+        "per use case": unscoped,
+        "request scope": uow_factory.scope,
+    }
+    try:
+        # every round changes the profiles, so each login writes
+        for revision, (mode, scope) in enumerate(modes.items()):
+            for index in range(50):
+                async with scope():
+                    await ensure.execute(make_user(index, revision))
+
+            checkouts.count = statements.count = 0
+            cpu_started = time.process_time()
+            for index in range(requests):
+                user = make_user(index, revision)
+                async with scope():
+                    await ensure.execute(user)
+                    await get.execute(user.id)
+            cpu = (time.process_time() - cpu_started) / requests * 1e6
+
+            print(  # noqa: T201
+                f"{mode:<14} "
+                f"checkouts={checkouts.count / requests:.2f} "
+                f"statements={statements.count / requests:.2f} "
+                f"cpu={cpu:7.1f}us",
+            )
+    finally:
+        async with uow_factory() as uow:
+            for index in range(requests):
+                with contextlib.suppress(UserNotFoundError):
+                    await uow.users.delete(UserId(ID_OFFSET + index))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
@@ -0,0 +1,415 @@
+"""Contract check and benchmark of the unit of work backends.
+
+Runs the same ``IUnitOfWork``/``IUserRepository`` contract against the
+SQLAlchemy and the asyncpg implementations and fails when either breaks
+it, then times the read (``GET /user/me`` cache miss) and write (login
+with a changed profile) paths of both. Requires a migrated Postgres
+configured through the usual ``DB_*`` environment variables::
+
+    PYTHONPATH=src python -m benchmarks.uow_backends --calls 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from backend.application.services.uow import UnitOfWorkFactory
+from backend.domain.entities.user import User
+from backend.domain.exceptions.user import UserNotFoundError
+from backend.domain.repositories.user import UserFilter, UserPosition
+from backend.domain.value_objects.user import (
+    FirstName,
+    LanguageCode,
+    LastName,
+    PhotoUrl,
+    UserId,
+    Username,
+)
+from backend.infrastructure.database.adapters.user import UserAdapter
+from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
+from backend.infrastructure.database.engine import create_engine
+from backend.infrastructure.services.uow import SqlAlchemyUnitOfWork
+from backend.infrastructure.services.uow_asyncpg import AsyncpgUnitOfWork
+from backend.shared import config
+from benchmarks.user_save import ID_OFFSET, make_user
+
+Check = Callable[[UnitOfWorkFactory], Awaitable[None]]
+CHECKS: list[Check] = []
+
+
+class Rollback(Exception):  # noqa: N818
+    """Raised inside a unit of work to roll it back."""
+
+
+def check(func: Check) -> Check:
+    """Register a contract check."""
+    CHECKS.append(func)
+    return func
+
+
+def expect(condition: object, message: str) -> None:
+    """Fail the running check unless ``condition`` holds."""
+    if not condition:
+        raise AssertionError(message)
+
+
+def same(left: User | None, right: User | None) -> bool:
+    """Whether two users have the same fields."""
+    if left is None or right is None:
+        return left is right
+    return UserAdapter.to_values(left) == UserAdapter.to_values(right)
+
+
+async def find(uow_factory: UnitOfWorkFactory, user_id: UserId) -> User | None:
+    """Find a user in a read-only unit of work."""
+    async with uow_factory(read_only=True) as uow:
+        return await uow.users.find_by_id(user_id)
+
+
+async def save(uow_factory: UnitOfWorkFactory, user: User) -> User:
+    """Save a user in its own unit of work."""
+    async with uow_factory(consistency_keys=(user.id.value,)) as uow:
+        return await uow.users.save(user)
+
+
+async def cleanup(uow_factory: UnitOfWorkFactory, ids: range) -> None:
+    """Delete the synthetic users the checks create."""
+    async with uow_factory() as uow:
+        for index in ids:
+            with contextlib.suppress(UserNotFoundError):
+                await uow.users.delete(UserId(ID_OFFSET + index))
+
+
+@check
+async def find_missing(uow_factory: UnitOfWorkFactory) -> None:
+    """A missing user is not found."""
+    expect(await find(uow_factory, make_user(0, 0).id) is None, "found")
+
+
+@check
+async def save_inserts(uow_factory: UnitOfWorkFactory) -> None:
+    """Saving a new user inserts and returns it."""
+    user = make_user(0, 0)
+    expect(same(await save(uow_factory, user), user), "returned user")
+    expect(same(await find(uow_factory, user.id), user), "stored user")
+
+
+@check
+async def save_unchanged(uow_factory: UnitOfWorkFactory) -> None:
+    """Saving an unchanged user returns the given entity."""
+    user = make_user(0, 0)
+    expect(await save(uow_factory, user) is user, "not the given user")
+
+
+@check
+async def save_updates(uow_factory: UnitOfWorkFactory) -> None:
+    """Saving a changed profile updates it."""
+    user = make_user(0, 1)
+    expect(same(await save(uow_factory, user), user), "returned user")
+    expect(same(await find(uow_factory, user.id), user), "stored user")
+
+
+@check
+async def find_many(uow_factory: UnitOfWorkFactory) -> None:
+    """A batch lookup returns the stored users, skipping unknown IDs."""
+    users = [make_user(index, 0) for index in (2, 3, 4)]
+    async with uow_factory() as uow:
+        await uow.users.save_many(users)
+
+    async with uow_factory(read_only=True) as uow:
+        found = await uow.users.find_many(
+            [user.id for user in users] + [make_user(5, 0).id, users[0].id],
+        )
+        expect(await uow.users.find_many([]) == [], "found without IDs")
+
+    found.sort(key=lambda user: user.id.value)
+    expect(len(found) == len(users), f"found {len(found)} users")
+    expect(all(map(same, found, users)), "stored users")
+
+
+@check
+async def optional_fields(uow_factory: UnitOfWorkFactory) -> None:
+    """Unicode and missing optional fields round-trip."""
+    user = User(
+        id=UserId(ID_OFFSET + 1),
+        username=Username(None),
+        first_name=FirstName("Ünïcødé 🚀 ' \" \\ name"),
+        last_name=LastName(None),
+        language_code=LanguageCode(None),
+        photo_url=PhotoUrl("https://t.me/i/userpic/320/photo.jpg"),
+    )
+    expect(same(await save(uow_factory, user), user), "returned user")
+    expect(same(await find(uow_factory, user.id), user), "stored user")
+
+
+@check
+async def save_many(uow_factory: UnitOfWorkFactory) -> None:
+    """A batch inserts new users and updates changed ones."""
+    users = [make_user(index, 2) for index in range(10)]
+    async with uow_factory() as uow:
+        await uow.users.save_many(users)
+        await uow.users.save_many([])
+
+    for user in users:
+        expect(same(await find(uow_factory, user.id), user), "stored user")
+
+
+@check
+async def delete(uow_factory: UnitOfWorkFactory) -> None:
+    """Deleting removes the user, deleting again raises."""
+    user_id = make_user(9, 0).id
+    async with uow_factory() as uow:
+        await uow.users.delete(user_id)
+    expect(await find(uow_factory, user_id) is None, "still stored")
+
+    try:
+        async with uow_factory() as uow:
+            await uow.users.delete(user_id)
+    except UserNotFoundError:
+        return
+    raise AssertionError("no UserNotFoundError")
+
+
+@check
+async def rollback_on_error(uow_factory: UnitOfWorkFactory) -> None:
+    """An error inside the unit of work discards its writes."""
+    user = make_user(20, 0)
+    try:
+        async with uow_factory() as uow:
+            await uow.users.save(user)
+            raise Rollback
+    except Rollback:
+        pass
+    expect(await find(uow_factory, user.id) is None, "write kept")
+
+
+@check
+async def commit_then_continue(uow_factory: UnitOfWorkFactory) -> None:
+    """Writes committed explicitly survive a later rollback."""
+    committed, discarded = make_user(21, 0), make_user(22, 0)
+    try:
+        async with uow_factory() as uow:
+            await uow.users.save(committed)
+            await uow.commit()
+            await uow.users.save(discarded)
+            raise Rollback
+    except Rollback:
+        pass
+    expect(same(await find(uow_factory, committed.id), committed), "lost")
+    expect(await find(uow_factory, discarded.id) is None, "write kept")
+
+
+@check
+async def explicit_rollback(uow_factory: UnitOfWorkFactory) -> None:
+    """An explicit rollback discards writes, later ones are committed."""
+    discarded, committed = make_user(23, 0), make_user(24, 0)
+    async with uow_factory() as uow:
+        await uow.users.save(discarded)
+        await uow.rollback()
+        await uow.users.save(committed)
+    expect(await find(uow_factory, discarded.id) is None, "write kept")
+    expect(same(await find(uow_factory, committed.id), committed), "lost")
+
+
+@check
+async def on_commit_after_commit(uow_factory: UnitOfWorkFactory) -> None:
+    """Commit callbacks run once the writes are visible, in order."""
+    user = make_user(25, 0)
+    calls: list[object] = []
+
+    async def committed() -> None:
+        calls.append(await find(uow_factory, user.id))
+
+    async with uow_factory() as uow:
+        await uow.users.save(user)
+        uow.on_commit(committed)
+        uow.on_commit(partial(asyncio.sleep, 0, "second"))
+        expect(not calls, "ran before commit")
+    expect(len(calls) == 1 and same(calls[0], user), "not run after commit")
+
+    async with uow_factory(read_only=True) as uow:
+        uow.on_commit(committed)
+    expect(len(calls) == 2, "not run for a read-only unit of work")
+
+
+@check
+async def on_commit_dropped(uow_factory: UnitOfWorkFactory) -> None:
+    """Commit callbacks are dropped on rollback."""
+    calls: list[str] = []
+
+    async def committed() -> None:
+        calls.append("committed")
+
+    try:
+        async with uow_factory() as uow:
+            uow.on_commit(committed)
+            raise Rollback
+    except Rollback:
+        pass
+
+    async with uow_factory() as uow:
+        uow.on_commit(committed)
+        await uow.rollback()
+    expect(not calls, "ran after rollback")
+
+
+@check
+async def find_page(uow_factory: UnitOfWorkFactory) -> None:
+    """Pages follow creation order and the filter, matched literally."""
+    users = [
+        User(
+            id=UserId(ID_OFFSET + index),
+            # "%" and "_" of the prefix must not act as LIKE wildcards
+            username=Username(
+                f"Keyset%_{index}" if index < 33 else f"KeysetXX{index}",
+            ),
+            first_name=FirstName("Page"),
+            last_name=LastName(None),
+            language_code=LanguageCode("ru" if index % 2 else "en"),
+            photo_url=PhotoUrl(None),
+        )
+        for index in range(26, 34)
+    ]
+    # two transactions, so the second batch is created later
+    for batch in (users[:4], users[4:]):
+        async with uow_factory() as uow:
+            await uow.users.save_many(batch)
+
+    cases = {
+        UserFilter(username_prefix="KEYSET%_"): users[:7],
+        UserFilter(language_code="ru", username_prefix="keyset%"): [
+            user for user in users[:7] if user.id.value % 2
+        ],
+    }
+    for user_filter, expected in cases.items():
+        listed: list[User] = []
+        after: UserPosition | None = None
+        async with uow_factory(read_only=True) as uow:
+            while page := await uow.users.find_page(after, 3, user_filter):
+                expect(len(page) <= 3, f"page of {len(page)} users")
+                listed += [user for _, user in page]
+                after = page[-1][0]
+        expect(
+            len(listed) == len(expected) and all(map(same, listed, expected)),
+            f"{user_filter} listed {[user.id.value for user in listed]}",
+        )
+
+
+async def run_check(
+    name: str,
+    func: Check,
+    uow_factory: UnitOfWorkFactory,
+) -> bool:
+    """Run one contract check, return whether it passed."""
+    try:
+        await func(uow_factory)
+    except AssertionError as e:
+        print(f"FAIL {name} {func.__name__}: {e}")  # noqa: T201
+        return False
+    return True
+
+
+async def run_checks(name: str, uow_factory: UnitOfWorkFactory) -> int:
+    """Run the contract against one backend, return the failures."""
+    ids = range(34)
+    failures = 0
+    await cleanup(uow_factory, ids)
+    try:
+        for func in CHECKS:
+            failures += not await run_check(name, func, uow_factory)
+    finally:
+        await cleanup(uow_factory, ids)
+
+    print(  # noqa: T201
+        f"{name}: {len(CHECKS) - failures}/{len(CHECKS)} checks passed",
+    )
+    return failures
+
+
+async def bench(
+    name: str,
+    uow_factory: UnitOfWorkFactory,
+    calls: int,
+) -> None:
+    """Time the read and write paths of one backend."""
+    ids = range(calls)
+    await cleanup(uow_factory, ids)
+    async with uow_factory() as uow:
+        await uow.users.save_many([make_user(index, 0) for index in ids])
+
+    cases: dict[str, Callable[[int], Awaitable[object]]] = {
+        "read": lambda index: find(uow_factory, make_user(index, 0).id),
+        "write": lambda index: save(uow_factory, make_user(index, 1)),
+    }
+    try:
+        for case, call in cases.items():
+            for index in ids[:50]:
+                await call(index)
+
+            latencies: list[float] = []
+            cpu_started = time.process_time()
+            for index in ids:
+                started = time.perf_counter()
+                await call(index)
+                latencies.append((time.perf_counter() - started) * 1e6)
+            cpu = (time.process_time() - cpu_started) / calls * 1e6
+
+            latencies.sort()
+            print(  # noqa: T201
+                f"{name:<10} {case:<5} cpu={cpu:7.1f}us "
+                f"p50={statistics.median(latencies):7.1f}us "
+                f"p99={latencies[int(calls * 0.99) - 1]:7.1f}us",
+            )
+    finally:
+        await cleanup(uow_factory, ids)
+
+
+async def main(calls: int) -> int:
+    """Run the contract on both backends, then the benchmark."""
+    engine = create_engine(config.db.url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    read_only_session_factory = async_sessionmaker(
+        engine.execution_options(isolation_level="AUTOCOMMIT"),
+        expire_on_commit=False,
+    )
+    pool = AsyncpgPool(config.db.dsn, min_size=1)
+
+    backends: dict[str, UnitOfWorkFactory] = {
+        "sqlalchemy": partial(
+            SqlAlchemyUnitOfWork,
+            session_factory,
+            read_only_session_factory=read_only_session_factory,
+        ),
+        "asyncpg": partial(AsyncpgUnitOfWork, pool),
+    }
+    try:
+        failures = 0
+        for name, uow_factory in backends.items():
+            failures += await run_checks(name, uow_factory)
+        if failures:
+            return 1
+
+        for name, uow_factory in backends.items():
+            await bench(name, uow_factory, calls)
+    finally:
+        await pool.close()
+        await engine.dispose()
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.calls)))
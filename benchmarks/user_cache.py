@@ -0,0 +1,297 @@
+"""Contract check and benchmark of the user cache backends.
+
+Runs the same ``IUserCache`` contract against the in-memory cache and
+the Redis cache on a local ``fakeredis`` server and fails when either
+breaks it: round trips, misses, TTL expiry, invalidation after
+``EnsureUserUseCase`` writes a changed profile and, for Redis, failing
+open when the server is unreachable. Then times hits of both. Requires
+a migrated Postgres configured through the usual ``DB_*`` environment
+variables::
+
+    PYTHONPATH=src python -m benchmarks.user_cache --calls 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+
+from fakeredis import FakeAsyncRedis, FakeServer
+from redis.exceptions import RedisError
+
+from backend.application.services.uow import UnitOfWorkFactory
+from backend.application.services.user.cache import IUserCache
+from backend.application.use_cases.user.ensure import EnsureUserUseCase
+from backend.domain.entities.user import User
+from backend.domain.exceptions.user import UserNotFoundError
+from backend.infrastructure.database.adapters.user import UserAdapter
+from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
+from backend.infrastructure.services.uow_asyncpg import AsyncpgUnitOfWork
+from backend.infrastructure.services.user.cache.memory import (
+    InMemoryUserCache,
+)
+from backend.infrastructure.services.user.cache.redis import RedisUserCache
+from backend.shared import config
+from benchmarks.user_save import make_user
+
+# seconds, Redis expiries are whole seconds
+TTL = 1
+# far from the users of the other benchmarks
+FIRST_INDEX = 100
+
+
+@dataclass
+class Backend:
+    """A cache backend under check."""
+
+    name: str
+    build: Callable[[], IUserCache]
+    # turn the storage off and on, None when it cannot fail
+    outage: Callable[[bool], None] | None = None
+
+
+Check = Callable[[Backend, UnitOfWorkFactory], Awaitable[None]]
+CHECKS: list[Check] = []
+
+
+def check(func: Check) -> Check:
+    """Register a contract check."""
+    CHECKS.append(func)
+    return func
+
+
+def expect(condition: object, message: str) -> None:
+    """Fail the running check unless ``condition`` holds."""
+    if not condition:
+        raise AssertionError(message)
+
+
+def same(left: User | None, right: User | None) -> bool:
+    """Whether two users have the same fields."""
+    if left is None or right is None:
+        return left is right
+    return UserAdapter.to_values(left) == UserAdapter.to_values(right)
+
+
+def same_users(found: list[User], expected: list[User]) -> bool:
+    """Whether two batches hold the same users, in any order."""
+    found = sorted(found, key=lambda user: user.id.value)
+    expected = sorted(expected, key=lambda user: user.id.value)
+    return len(found) == len(expected) and all(map(same, found, expected))
+
+
+def fake_redis() -> Backend:
+    """Return the Redis backend, each cache on a fresh local server."""
+    servers = [FakeServer()]
+
+    def build() -> IUserCache:
+        servers[0] = FakeServer()
+        return RedisUserCache(FakeAsyncRedis(server=servers[0]), ttl=TTL)
+
+    def outage(down: bool) -> None:
+        servers[0].connected = not down
+
+    return Backend("redis", build, outage)
+
+
+@check
+async def round_trip(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """A cached user is returned with the same fields."""
+    cache = backend.build()
+    user = make_user(FIRST_INDEX, 0)
+    await cache.set(user)
+    expect(same(await cache.get(user.id), user), "not cached as is")
+
+
+@check
+async def miss(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """An uncached user is a miss, alone and in a batch."""
+    cache = backend.build()
+    user = make_user(FIRST_INDEX, 0)
+    expect(await cache.get(user.id) is None, "hit")
+    expect(await cache.get_many([user.id]) == [], "batch hit")
+    expect(await cache.get_many([]) == [], "hit without IDs")
+
+
+@check
+async def many(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """A batch returns the cached users, skipping the uncached ones."""
+    cache = backend.build()
+    users = [make_user(FIRST_INDEX + index, 0) for index in range(3)]
+    await cache.set_many(users)
+    await cache.set_many([])
+    found = await cache.get_many(
+        [user.id for user in users] + [make_user(FIRST_INDEX + 3, 0).id],
+    )
+    expect(same_users(found, users), "cached users")
+
+
+@check
+async def overwrite(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """Caching a user again replaces the cached profile."""
+    cache = backend.build()
+    await cache.set(make_user(FIRST_INDEX, 0))
+    await cache.set(make_user(FIRST_INDEX, 1))
+    cached = await cache.get(make_user(FIRST_INDEX, 0).id)
+    expect(same(cached, make_user(FIRST_INDEX, 1)), "old profile")
+
+
+@check
+async def invalidate(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """An invalidated user is a miss, other users stay cached."""
+    cache = backend.build()
+    kept, dropped = make_user(FIRST_INDEX, 0), make_user(FIRST_INDEX + 1, 0)
+    await cache.set_many([kept, dropped])
+    await cache.invalidate(dropped.id)
+    await cache.invalidate(make_user(FIRST_INDEX + 2, 0).id)
+    expect(await cache.get(dropped.id) is None, "still cached")
+    expect(await cache.get(kept.id) is not None, "other user dropped")
+
+
+@check
+async def expiry(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """Users expire once the TTL has passed."""
+    cache = backend.build()
+    user = make_user(FIRST_INDEX, 0)
+    await cache.set(user)
+    await asyncio.sleep(TTL + 0.1)
+    expect(await cache.get(user.id) is None, "not expired")
+
+
+@check
+async def invalidate_after_ensure(
+    backend: Backend,
+    uow_factory: UnitOfWorkFactory,
+) -> None:
+    """Writing a changed profile drops the cached one."""
+    cache = backend.build()
+    ensure = EnsureUserUseCase(
+        uow_factory,
+        fingerprints=None,
+        user_cache=cache,
+    )
+    await ensure.execute(make_user(FIRST_INDEX, 0))
+    await cache.set(make_user(FIRST_INDEX, 0))
+    await ensure.execute(make_user(FIRST_INDEX, 1))
+    expect(await cache.get(make_user(FIRST_INDEX, 0).id) is None, "stale")
+
+
+@check
+async def fail_open(backend: Backend, _: UnitOfWorkFactory) -> None:
+    """An unreachable store reads as misses and drops writes silently."""
+    if backend.outage is None:
+        return
+
+    cache = backend.build()
+    user = make_user(FIRST_INDEX, 0)
+    await cache.set(user)
+    backend.outage(True)
+    # the cache logs every failed call, expected here
+    logging.disable(logging.ERROR)
+    try:
+        expect(await cache.get(user.id) is None, "hit while down")
+        expect(await cache.get_many([user.id]) == [], "batch hit while down")
+        await cache.set(make_user(FIRST_INDEX, 1))
+        await cache.set_many([make_user(FIRST_INDEX, 1)])
+        await cache.invalidate(user.id)
+    except RedisError as e:
+        raise AssertionError(f"raised {e!r}") from e
+    finally:
+        logging.disable(logging.NOTSET)
+        backend.outage(False)
+    expect(same(await cache.get(user.id), user), "written while down")
+
+
+async def cleanup(uow_factory: UnitOfWorkFactory) -> None:
+    """Delete the synthetic user the checks create."""
+    async with uow_factory() as uow:
+        with contextlib.suppress(UserNotFoundError):
+            await uow.users.delete(make_user(FIRST_INDEX, 0).id)
+
+
+async def run_check(
+    backend: Backend,
+    func: Check,
+    uow_factory: UnitOfWorkFactory,
+) -> bool:
+    """Run one contract check, return whether it passed."""
+    try:
+        await func(backend, uow_factory)
+    except AssertionError as e:
+        print(f"FAIL {backend.name} {func.__name__}: {e}")  # noqa: T201
+        return False
+    return True
+
+
+async def run_checks(backend: Backend, uow_factory: UnitOfWorkFactory) -> int:
+    """Run the contract against one backend, return the failures."""
+    failures = 0
+    await cleanup(uow_factory)
+    try:
+        for func in CHECKS:
+            failures += not await run_check(backend, func, uow_factory)
+    finally:
+        await cleanup(uow_factory)
+
+    print(  # noqa: T201
+        f"{backend.name}: {len(CHECKS) - failures}/{len(CHECKS)} "
+        "checks passed",
+    )
+    return failures
+
+
+async def bench(backend: Backend, calls: int) -> None:
+    """Time cache hits of one backend."""
+    cache = backend.build()
+    users = [make_user(FIRST_INDEX + index, 0) for index in range(100)]
+    await cache.set_many(users)
+    ids = [user.id for user in users]
+
+    cases: dict[str, Callable[[int], Awaitable[object]]] = {
+        "get": lambda index: cache.get(ids[index % len(ids)]),
+        "get_many": lambda _: cache.get_many(ids),
+    }
+    for case, call in cases.items():
+        started = time.process_time()
+        for index in range(calls):
+            await call(index)
+        cpu = (time.process_time() - started) / calls * 1e6
+        print(f"{backend.name:<6} {case:<8} cpu={cpu:7.1f}us")  # noqa: T201
+
+
+async def main(calls: int) -> int:
+    """Run the contract on both backends, then the benchmark."""
+    backends = (
+        Backend("memory", partial(InMemoryUserCache, maxsize=1000, ttl=TTL)),
+        fake_redis(),
+    )
+    pool = AsyncpgPool(config.db.dsn, min_size=1)
+    uow_factory = partial(AsyncpgUnitOfWork, pool)
+    try:
+        failures = 0
+        for backend in backends:
+            failures += await run_checks(backend, uow_factory)
+        if failures:
+            return 1
+
+        for backend in backends:
+            await bench(backend, calls)
+    finally:
+        await pool.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.calls)))
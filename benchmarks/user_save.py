@@ -0,0 +1,167 @@
+"""Benchmark ``UserRepository.save`` against the legacy ORM save path.
+
+Requires a migrated Postgres configured through the usual ``DB_*``
+environment variables::
+
+    PYTHONPATH=src python -m benchmarks.user_save --users 1000 --rounds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.domain.entities.user import User
+from backend.domain.value_objects.user import (
+    FirstName,
+    LanguageCode,
+    LastName,
+    PhotoUrl,
+    UserId,
+    Username,
+)
+from backend.infrastructure.database.adapters.user import UserAdapter
+from backend.infrastructure.database.models.user import UserModel
+from backend.infrastructure.repositories.user import UserRepository
+from backend.shared import config
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# synthetic ids far above real Telegram ids so the benchmark never
+# touches real rows
+ID_OFFSET = 9_000_000_000_000
+
+
+class StatementCounter:
+    """Count statements sent to the database."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.count = 0
+
+    def __call__(self, *_: Any) -> None:
+        """Handle ``before_cursor_execute``."""
+        self.count += 1
+
+
+async def legacy_save(session: AsyncSession, user: User) -> User:
+    """Save a user the way ``UserRepository.save`` used to."""
+    user_model = UserAdapter.to_model(user)
+    existing = await session.get(UserModel, user.id.value)
+
+    if existing:
+        persistent_model = await session.merge(user_model)
+    else:
+        session.add(user_model)
+        persistent_model = user_model
+
+    await session.flush()
+    await session.refresh(persistent_model)
+
+    return UserAdapter.to_entity(persistent_model)
+
+
+async def upsert_save(session: AsyncSession, user: User) -> User:
+    """Save a user through the repository upsert."""
+    return await UserRepository(session).save(user)
+
+
+def make_user(index: int, revision: int) -> User:
+    """Build a synthetic user."""
+    return User(
+        id=UserId(ID_OFFSET + index),
+        username=Username(f"user{index}"),
+        first_name=FirstName(f"First {revision}"),
+        last_name=LastName("Last"),
+        language_code=LanguageCode("en"),
+        photo_url=PhotoUrl(None),
+    )
+
+
+async def run_case(
+    name: str,
+    save: Callable[[AsyncSession, User], Awaitable[User]],
+    session_factory: async_sessionmaker[AsyncSession],
+    counter: StatementCounter,
+    users: int,
+    revision: int,
+) -> dict[str, float]:
+    """Save every synthetic user once in its own transaction."""
+    latencies: list[float] = []
+    counter.count = 0
+
+    for index in range(users):
+        user = make_user(index, revision)
+        started = time.perf_counter()
+        async with session_factory() as session:
+            await save(session, user)
+            await session.commit()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    result = {
+        "statements_per_save": counter.count / users,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+    }
+    print(  # noqa: T201
+        f"{name:<28} "
+        + " ".join(f"{key}={value:.3f}" for key, value in result.items()),
+    )
+    return result
+
+
+async def main(users: int, rounds: int) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(config.db.url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    async def cleanup() -> None:
+        async with session_factory() as session:
+            await session.execute(
+                delete(UserModel).where(UserModel.id >= ID_OFFSET),
+            )
+            await session.commit()
+
+    cases = (("legacy", legacy_save), ("upsert", upsert_save))
+
+    try:
+        for name, save in cases:
+            await cleanup()
+            for round_ in range(rounds):
+                # round 0 inserts, odd rounds change the profile and even
+                # rounds repeat the previous one (unchanged login)
+                revision = (round_ + 1) // 2
+                await run_case(
+                    f"{name} round={round_} rev={revision}",
+                    save,
+                    session_factory,
+                    counter,
+                    users,
+                    revision,
+                )
+    finally:
+        await cleanup()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.rounds))
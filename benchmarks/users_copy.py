@@ -0,0 +1,207 @@
+"""Check and benchmark the bulk user import/export tool.
+
+Writes ``--users`` synthetic users to NDJSON and CSV files, imports them
+through ``backend.tools.users`` (the NDJSON file in two runs, the second
+resuming from the checkpoint of the first), exports the table back and
+checks the synthetic users survived the round trip. Reports throughput
+and the peak memory of the process, which should not grow with
+``--users``. Also checks that records with IDs PostgreSQL cannot store
+as intended (booleans, values past ``BIGINT``) are skipped as invalid.
+Requires a migrated Postgres configured through the usual ``DB_*``
+environment variables::
+
+    PYTHONPATH=src python -m benchmarks.users_copy --users 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import asyncpg
+
+from backend.infrastructure.database.user_copy import UserFileFormat
+from backend.shared import config
+from backend.tools.users import Checkpoint, export_users, import_users
+from benchmarks.user_save import ID_OFFSET
+
+BATCH_SIZE = 10_000
+
+
+def synthetic_record(index: int) -> dict[str, object]:
+    """Return the exported form of a synthetic user."""
+    return {
+        "id": ID_OFFSET + index,
+        "username": f"bulk_{index}",
+        "first_name": f'Bulk "{index}" \\ user',
+        "last_name": None if index % 3 else "Ünïcødé",
+        "language_code": "en",
+        "photo_url": None,
+        "created_at": "2024-01-01T00:00:00",
+    }
+
+
+def write_files(directory: Path, users: int) -> tuple[Path, Path]:
+    """Write the synthetic users as NDJSON and CSV, one at a time."""
+    ndjson_path, csv_path = directory / "in.ndjson", directory / "in.csv"
+    with ndjson_path.open("w") as ndjson_file, csv_path.open("w") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=synthetic_record(0))
+        writer.writeheader()
+        for index in range(users):
+            record = synthetic_record(index)
+            ndjson_file.write(json.dumps(record) + "\n")
+            writer.writerow(record)
+    return ndjson_path, csv_path
+
+
+def count_synthetic(path: Path, users: int) -> int:
+    """Count the exported synthetic users matching their source."""
+    matching = 0
+    with path.open() as file:
+        for line in file:
+            record = json.loads(line)
+            index = record["id"] - ID_OFFSET
+            matching += 0 <= index < users and record == synthetic_record(
+                index,
+            )
+    return matching
+
+
+# a boolean ID would otherwise write user 1
+INVALID_IDS = (True, 2**63)
+
+
+async def check_invalid_ids(directory: Path) -> bool:
+    """Import invalid IDs next to a valid record, return whether skipped."""
+    path = directory / "invalid.ndjson"
+    valid = synthetic_record(0)
+    with path.open("w") as file:
+        for user_id in INVALID_IDS:
+            file.write(json.dumps({**valid, "id": user_id}) + "\n")
+        file.write(json.dumps(valid) + "\n")
+
+    await import_users(
+        str(path),
+        UserFileFormat.NDJSON,
+        BATCH_SIZE,
+        len(INVALID_IDS),
+        None,
+    )
+    imported = await synthetic_rows("SELECT FROM users WHERE id >= $1")
+    connection = await asyncpg.connect(config.db.dsn)
+    try:
+        overwritten = await connection.fetchval(
+            "SELECT count(*) FROM users WHERE id = 1 AND username = $1",
+            valid["username"],
+        )
+    finally:
+        await connection.close()
+    passed = imported == 1 and not overwritten
+    print(  # noqa: T201
+        f"{'ok' if passed else 'FAIL'} invalid IDs skipped: "
+        f"{imported} valid imported, user 1 overwritten: {bool(overwritten)}",
+    )
+    return passed
+
+
+async def synthetic_rows(statement: str) -> int:
+    """Run ``statement`` on the synthetic users, return its row count."""
+    connection = await asyncpg.connect(config.db.dsn)
+    try:
+        status = await connection.execute(statement, ID_OFFSET)
+    finally:
+        await connection.close()
+    return int(status.rpartition(" ")[2])
+
+
+def report(name: str, records: int, started: float) -> None:
+    """Print the throughput of a step and the peak memory so far."""
+    elapsed = time.perf_counter() - started
+    # kilobytes on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(  # noqa: T201
+        f"{name:<24} {records:>9} records {elapsed:7.2f}s "
+        f"{records / elapsed:>9.0f} records/s peak_rss={peak:.0f}MB",
+    )
+
+
+async def main(users: int) -> int:
+    """Run the round trip."""
+    with tempfile.TemporaryDirectory() as directory:
+        ndjson_path, csv_path = write_files(Path(directory), users)
+        checkpoint = Checkpoint(Path(directory) / "in.checkpoint")
+        exported = Path(directory) / "out.ndjson"
+
+        await synthetic_rows("DELETE FROM users WHERE id >= $1")
+        try:
+            if not await check_invalid_ids(Path(directory)):
+                return 1
+            await synthetic_rows("DELETE FROM users WHERE id >= $1")
+
+            # an interrupted import: half of the batches committed
+            half = users // 2 // BATCH_SIZE * BATCH_SIZE
+            checkpoint.save(half)
+            started = time.perf_counter()
+            await import_users(
+                str(ndjson_path),
+                UserFileFormat.NDJSON,
+                BATCH_SIZE,
+                0,
+                checkpoint,
+            )
+            report("import ndjson (resumed)", users - half, started)
+            resumed = await synthetic_rows(
+                f"SELECT FROM users WHERE id >= $1 AND id < $1 + {half}",
+            )
+            if resumed:
+                print(f"resume imported {resumed} skipped users")  # noqa: T201
+                return 1
+
+            checkpoint.save(0)
+            started = time.perf_counter()
+            await import_users(
+                str(ndjson_path),
+                UserFileFormat.NDJSON,
+                BATCH_SIZE,
+                0,
+                checkpoint,
+            )
+            report("import ndjson", users, started)
+
+            started = time.perf_counter()
+            await import_users(
+                str(csv_path),
+                UserFileFormat.CSV,
+                BATCH_SIZE,
+                0,
+                None,
+            )
+            report("import csv (unchanged)", users, started)
+
+            started = time.perf_counter()
+            await export_users(str(exported), UserFileFormat.NDJSON)
+            report("export ndjson", users, started)
+        finally:
+            await synthetic_rows("DELETE FROM users WHERE id >= $1")
+
+        matching = count_synthetic(exported, users)
+
+    print(f"{matching}/{users} users round-tripped")  # noqa: T201
+    return 0 if matching == users else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(asyncio.run(main(args.users)))
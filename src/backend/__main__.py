@@ -2,17 +2,32 @@
 
 import logging
 
-import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi.errors import RateLimitExceeded
+from starlette.exceptions import HTTPException
 
+from backend import server
 from backend.containers import Container
-from backend.containers.services import ServiceContainer
 from backend.presentation import api
-from backend.presentation.api import docs, health, middlewares, state
+from backend.presentation.api import (
+    docs,
+    health,
+    metrics,
+    middlewares,
+    state,
+)
+from backend.presentation.api.lifespan import create_lifespan
+from backend.presentation.api.rate_limit import (
+    RateLimitExceededError,
+    rate_limit,
+    rate_limit_handler,
+)
+from backend.presentation.api.responses import (
+    PydanticJSONResponse,
+    http_exception_handler,
+)
+from backend.presentation.api.uow import request_unit_of_work
 from backend.shared import config
-from backend.shared.slowapi import rate_limit_handler
 
 logging.basicConfig(
     level=logging.INFO if config.app.is_production else logging.DEBUG,
@@ -30,13 +45,52 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None,
     openapi_url=None if config.app.is_production else "/openapi.json",
+    lifespan=create_lifespan(container),
+    default_response_class=PydanticJSONResponse,
 )
 
 app.state = state.AppState()
-app.state.limiter = ServiceContainer.limiter()
+app.state.limiter = container.service().limiter()
+app.state.unit_of_work = container.service().uow()
+
+app.include_router(
+    api.router,
+    dependencies=[
+        *(
+            [Depends(rate_limit(config.rate_limit.default))]
+            if config.rate_limit.default
+            else []
+        ),
+        Depends(request_unit_of_work),
+    ],
+)
+app.include_router(health.router)
+
+if config.metrics.enabled:
+    app.include_router(metrics.router)
+
+if config.app.is_development:
+    docs.setup_scalar(app)
+
+app.add_exception_handler(HTTPException, http_exception_handler)
+app.add_exception_handler(RateLimitExceededError, rate_limit_handler)
 
-app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
-app.add_middleware(middlewares.AuthenticationMiddleware)
+if config.profiling.enabled:
+    app.add_middleware(
+        middlewares.ProfilingMiddleware,
+        output_dir=config.profiling.output_dir,
+        interval=config.profiling.interval_ms / 1000,
+        header=config.profiling.header if config.app.is_development else None,
+        sample_rate=config.profiling.sample_rate,
+        flush_every=config.profiling.flush_every,
+    )
+app.add_middleware(
+    middlewares.AuthenticationMiddleware,
+    public_paths=[
+        *middlewares.collect_public_paths(app.routes),
+        *filter(None, [app.openapi_url]),
+    ],
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=config.app.allowed_origins_list,
@@ -45,11 +99,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(api.router)
-app.include_router(health.router)
-
-if config.app.is_development:
-    docs.setup_scalar(app)
+if config.metrics.enabled:
+    app.add_middleware(middlewares.MetricsMiddleware, routes=app.routes)
 
 
 if __name__ == "__main__":
@@ -57,4 +108,4 @@ if __name__ == "__main__":
         "Starting the application in %s mode",
         config.app.environment.value,
     )
-    uvicorn.run(app, host=config.app.host, port=config.app.port)
+    server.run(app)
@@ -3,8 +3,35 @@
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class DatabasePoolStatus:
+    """Database connection pool usage."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
+@dataclass(frozen=True)
+class DatabaseHealthStatus:
+    """Database health status."""
+
+    connected: bool
+    latency_ms: float | None = None
+    pool: DatabasePoolStatus | None = None
+
+
 @dataclass(frozen=True)
 class HealthServiceStatus:
     """Health status."""
 
-    db_connection: bool
+    database: DatabaseHealthStatus
+    # unix timestamp of the probe the status was taken from
+    checked_at: float
+    is_stale: bool = False
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether the service is ready to serve traffic."""
+        return self.database.connected and not self.is_stale
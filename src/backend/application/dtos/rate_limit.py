@@ -0,0 +1,56 @@
+"""Rate limit DTOs."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_RATE_PATTERN = re.compile(
+    r"^\s*(\d+)\s*(?:/|per)\s*(\d+)?\s*(second|minute|hour|day)s?\s*$",
+)
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@dataclass(frozen=True)
+class Rate:
+    """Allowed number of requests per period (token bucket)."""
+
+    limit: int
+    period: float
+
+    @classmethod
+    def parse(cls, rate: str) -> Rate:
+        """Parse a rate like ``1/second``, ``100/minute`` or ``5/10 hours``.
+
+        Raises:
+            ValueError: If the rate is malformed
+
+        """
+        match = _RATE_PATTERN.match(rate.lower())
+        if not match or int(match.group(1)) < 1:
+            msg = f"Invalid rate limit: {rate!r}"
+            raise ValueError(msg)
+
+        multiplier = int(match.group(2) or 1)
+        return cls(
+            limit=int(match.group(1)),
+            period=multiplier * _PERIODS[match.group(3)],
+        )
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added to the bucket per second."""
+        return self.limit / self.period
+
+    def __str__(self) -> str:
+        """Return the string representation of the rate."""
+        return f"{self.limit} per {self.period:g} second"
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a rate limit hit."""
+
+    allowed: bool
+    # seconds until the next request is allowed
+    retry_after: float = 0.0
@@ -2,11 +2,13 @@
 
 from abc import ABC, abstractmethod
 
+from backend.application.dtos.health import DatabaseHealthStatus
+
 
 class IDatabaseHealthCheckService(ABC):
     """Database health check service."""
 
     @abstractmethod
-    async def check_connection(self) -> bool:
-        """Check the database connection."""
+    async def check(self) -> DatabaseHealthStatus:
+        """Check the database connection and pool usage."""
         raise NotImplementedError
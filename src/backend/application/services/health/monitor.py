@@ -0,0 +1,25 @@
+"""Health monitor service."""
+
+from abc import ABC, abstractmethod
+
+from backend.application.dtos.health import HealthServiceStatus
+
+
+class IHealthMonitor(ABC):
+    """Health monitor keeping a periodically refreshed health snapshot."""
+
+    @property
+    @abstractmethod
+    def snapshot(self) -> HealthServiceStatus:
+        """Return the latest health snapshot without doing any I/O."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Take the first snapshot and start refreshing it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop refreshing the snapshot."""
+        raise NotImplementedError
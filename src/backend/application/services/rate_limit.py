@@ -0,0 +1,17 @@
+"""Rate limiter."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from backend.application.dtos.rate_limit import Rate, RateLimitResult
+
+
+class IRateLimiter(ABC):
+    """Token bucket rate limiter."""
+
+    @abstractmethod
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        """Take one token from the bucket of a key."""
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Protocol, Self
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection, Hashable
     from types import TracebackType
 
     from backend.domain.repositories.user import IUserRepository
@@ -36,3 +37,33 @@ class IUnitOfWork(ABC):
     @abstractmethod
     async def rollback(self) -> None:
         """Rollback transaction."""
+
+    @abstractmethod
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the work done so far is committed.
+
+        Callbacks are dropped on rollback. For read-only units of work
+        they run when the unit of work exits without an error.
+        """
+
+
+class UnitOfWorkFactory(Protocol):
+    """Unit of Work factory."""
+
+    def __call__(
+        self,
+        *,
+        read_only: bool = False,
+        consistency_keys: Collection[Hashable] = (),
+    ) -> IUnitOfWork:
+        """Create a unit of work.
+
+        Args:
+            read_only: The unit of work only reads and may be served by a
+                read replica
+            consistency_keys: Keys of the rows involved (e.g. user ids);
+                reads of keys written shortly before by a committed unit
+                of work are served by the primary
+
+        """
+        ...
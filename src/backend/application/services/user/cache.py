@@ -0,0 +1,36 @@
+"""User profile cache."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from backend.domain.entities.user import User
+    from backend.domain.value_objects.user import UserId
+
+
+class IUserCache(ABC):
+    """Read-through cache of user entities."""
+
+    @abstractmethod
+    async def get(self, user_id: UserId) -> User | None:
+        """Get a cached user."""
+
+    @abstractmethod
+    async def set(self, user: User) -> None:
+        """Cache a user."""
+
+    @abstractmethod
+    async def get_many(self, user_ids: Collection[UserId]) -> list[User]:
+        """Get the cached users among ``user_ids``, in no particular order."""
+
+    @abstractmethod
+    async def set_many(self, users: Collection[User]) -> None:
+        """Cache several users."""
+
+    @abstractmethod
+    async def invalidate(self, user_id: UserId) -> None:
+        """Drop a cached user."""
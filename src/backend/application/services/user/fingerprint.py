@@ -0,0 +1,26 @@
+"""User profile fingerprint store."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from backend.domain.entities.user import User
+    from backend.domain.value_objects.user import UserId
+
+
+class IUserFingerprintStore(ABC):
+    """Last persisted profile fingerprint per user."""
+
+    @abstractmethod
+    def is_unchanged(self, user: User) -> bool:
+        """Check if the user profile matches the last persisted one."""
+
+    @abstractmethod
+    def remember(self, user: User) -> None:
+        """Remember the user profile as persisted."""
+
+    @abstractmethod
+    def forget(self, user_id: UserId) -> None:
+        """Forget the persisted profile of a user."""
@@ -0,0 +1,32 @@
+"""Write-behind queue for user upserts."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from backend.domain.entities.user import User
+
+
+class IUserWriteQueue(ABC):
+    """Queue of pending user upserts flushed in batches."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start flushing in the background."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Flush everything pending and stop."""
+
+    @abstractmethod
+    async def submit(self, user: User, *, wait: bool | None = None) -> None:
+        """Queue a user upsert.
+
+        Args:
+            user: User entity
+            wait: Wait until the upsert is committed, defaults to the
+                configured durability mode
+
+        """
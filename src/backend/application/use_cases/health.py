@@ -4,7 +4,7 @@ import logging
 from abc import ABC, abstractmethod
 
 from backend.application.dtos.health import HealthServiceStatus
-from backend.application.services.health.db import IDatabaseHealthCheckService
+from backend.application.services.health.monitor import IHealthMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -21,23 +21,19 @@ class IHealthCheckUseCase(ABC):
 class HealthCheckUseCase(IHealthCheckUseCase):
     """Health check use case implementation."""
 
-    def __init__(
-        self,
-        database_health_check_service: IDatabaseHealthCheckService,
-    ) -> None:
+    def __init__(self, health_monitor: IHealthMonitor) -> None:
         """Initialize the health check use case."""
-        self.db_health_check = database_health_check_service
+        self.health_monitor = health_monitor
 
     async def execute(self) -> HealthServiceStatus:
         """Execute the health check.
 
+        Serves the snapshot kept by the background health monitor, so it
+        never touches the database.
+
         Returns:
             HealthServiceStatus: Health service status
 
         """
         logger.debug("Executing health check...")
-
-        # Health check
-        db_conn_ok = await self.db_health_check.check_connection()
-
-        return HealthServiceStatus(db_connection=db_conn_ok)
+        return self.health_monitor.snapshot
@@ -1,10 +1,23 @@
 """Ensure user use case."""
 
+import functools
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable
 
-from backend.application.services.uow import IUnitOfWork
+from backend.application.services.uow import UnitOfWorkFactory
+from backend.application.services.user.cache import IUserCache
+from backend.application.services.user.fingerprint import (
+    IUserFingerprintStore,
+)
+from backend.application.services.user.write_queue import IUserWriteQueue
 from backend.domain.entities.user import User
+from backend.shared import metrics
+
+logger = logging.getLogger(__name__)
+
+_WRITTEN = metrics.ENSURE_USER_WRITES.labels("written")
+_SKIPPED = metrics.ENSURE_USER_WRITES.labels("skipped")
+_QUEUED = metrics.ENSURE_USER_WRITES.labels("queued")
 
 
 class IEnsureUserUseCase(ABC):
@@ -20,14 +33,25 @@ class EnsureUserUseCase(IEnsureUserUseCase):
 
     def __init__(
         self,
-        uow_factory: Callable[[], IUnitOfWork],
+        uow_factory: UnitOfWorkFactory,
+        fingerprints: IUserFingerprintStore | None,
+        user_cache: IUserCache,
+        write_queue: IUserWriteQueue | None = None,
     ) -> None:
         """Initialize EnsureUserUseCase."""
         self._uow_factory = uow_factory
+        self._fingerprints = fingerprints
+        self._user_cache = user_cache
+        self._write_queue = write_queue
 
     async def execute(self, user: User) -> User:
         """Ensure user.
 
+        When fingerprints are kept, the database write is skipped if the
+        profile matches the last one persisted by this process. Otherwise
+        the user is written and its cached profile is invalidated, either
+        right away or through the write-behind queue when it is enabled.
+
         Args:
             user: User entity
 
@@ -35,7 +59,33 @@ class EnsureUserUseCase(IEnsureUserUseCase):
             User: User entity
 
         """
-        async with self._uow_factory() as uow:
-            await uow.users.save(user)
+        if self._fingerprints and self._fingerprints.is_unchanged(user):
+            _SKIPPED.inc()
+            logger.debug("User ID=%s profile unchanged, skipping", user.id)
+            return user
+
+        if self._write_queue:
+            # the queue invalidates the cache once the batch is committed
+            if self._fingerprints:
+                self._fingerprints.remember(user)
+            await self._write_queue.submit(user)
+            _QUEUED.inc()
+        else:
+            # reads of this user skip lagging replicas for a while
+            async with self._uow_factory(
+                consistency_keys=(user.id.value,),
+            ) as uow:
+                await uow.users.save(user)
+                # the commit may come later (request-scoped unit of work),
+                # reads before it must not be served the old profile
+                await self._user_cache.invalidate(user.id)
+                uow.on_commit(functools.partial(self._written, user))
+            _WRITTEN.inc()
 
         return user
+
+    async def _written(self, user: User) -> None:
+        """Record a committed profile, dropping what was cached meanwhile."""
+        await self._user_cache.invalidate(user.id)
+        if self._fingerprints:
+            self._fingerprints.remember(user)
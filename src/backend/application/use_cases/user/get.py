@@ -1,10 +1,11 @@
 """Get user use case."""
 
+import functools
 import logging
 from abc import ABC, abstractmethod
-from typing import Callable
 
-from backend.application.services.uow import IUnitOfWork
+from backend.application.services.uow import UnitOfWorkFactory
+from backend.application.services.user.cache import IUserCache
 from backend.domain.entities.user import User
 from backend.domain.exceptions.user import UserNotFoundError
 from backend.domain.value_objects.user import UserId
@@ -23,13 +24,22 @@ class IGetUserUseCase(ABC):
 class GetUserUseCase(IGetUserUseCase):
     """Get user use case."""
 
-    def __init__(self, uow_factory: Callable[[], IUnitOfWork]) -> None:
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        user_cache: IUserCache,
+    ) -> None:
         """Initialize get user use case."""
         self.uow_factory = uow_factory
+        self.user_cache = user_cache
 
     async def execute(self, user_id: UserId) -> User:
         """Get user.
 
+        Served from the user cache when possible, the database is only
+        queried on a cache miss, through a read-only unit of work that
+        may be served by a read replica.
+
         Args:
             user_id: User id
 
@@ -40,7 +50,15 @@ class GetUserUseCase(IGetUserUseCase):
             UserNotFoundError: If user not found
 
         """
-        async with self.uow_factory() as uow:
+        user = await self.user_cache.get(user_id)
+        if user:
+            logger.debug("User with id %s served from cache", user_id)
+            return user
+
+        async with self.uow_factory(
+            read_only=True,
+            consistency_keys=(user_id.value,),
+        ) as uow:
             logger.debug("Getting user with id %s", user_id)
 
             user = await uow.users.find_by_id(user_id)
@@ -49,4 +67,7 @@ class GetUserUseCase(IGetUserUseCase):
                 logger.error(msg)
                 raise UserNotFoundError(msg)
 
-            return user
+            # never cache a row the request may still roll back
+            uow.on_commit(functools.partial(self.user_cache.set, user))
+
+        return user
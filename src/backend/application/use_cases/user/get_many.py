@@ -0,0 +1,71 @@
+"""Get many users use case."""
+
+import functools
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from backend.application.services.uow import UnitOfWorkFactory
+from backend.application.services.user.cache import IUserCache
+from backend.domain.entities.user import User
+from backend.domain.value_objects.user import UserId
+
+logger = logging.getLogger(__name__)
+
+
+class IGetUsersUseCase(ABC):
+    """Get many users use case."""
+
+    @abstractmethod
+    async def execute(self, user_ids: Sequence[UserId]) -> list[User]:
+        """Get users."""
+
+
+class GetUsersUseCase(IGetUsersUseCase):
+    """Get many users use case."""
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        user_cache: IUserCache,
+    ) -> None:
+        """Initialize get many users use case."""
+        self.uow_factory = uow_factory
+        self.user_cache = user_cache
+
+    async def execute(self, user_ids: Sequence[UserId]) -> list[User]:
+        """Get users.
+
+        Cached users are served from the user cache, the misses are
+        loaded with a single query through a read-only unit of work.
+
+        Args:
+            user_ids: User ids, duplicates are ignored
+
+        Returns:
+            list[User]: Found users in the order of ``user_ids``, unknown
+                ids are left out
+
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        found = {
+            user.id: user for user in await self.user_cache.get_many(user_ids)
+        }
+
+        missing = [user_id for user_id in user_ids if user_id not in found]
+        if missing:
+            async with self.uow_factory(
+                read_only=True,
+                consistency_keys=[user_id.value for user_id in missing],
+            ) as uow:
+                logger.debug("Getting %s users missing from cache", missing)
+
+                loaded = await uow.users.find_many(missing)
+                # never cache rows the request may still roll back
+                uow.on_commit(
+                    functools.partial(self.user_cache.set_many, loaded),
+                )
+
+            found.update((user.id, user) for user in loaded)
+
+        return [found[user_id] for user_id in user_ids if user_id in found]
@@ -0,0 +1,79 @@
+"""List users use case."""
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from backend.application.services.uow import UnitOfWorkFactory
+from backend.domain.entities.user import User
+from backend.domain.repositories.user import UserFilter, UserPosition
+
+logger = logging.getLogger(__name__)
+
+
+class IListUsersUseCase(ABC):
+    """List users use case."""
+
+    @abstractmethod
+    def execute(
+        self,
+        user_filter: UserFilter,
+        after: UserPosition | None,
+        limit: int,
+    ) -> AsyncIterator[tuple[UserPosition, User]]:
+        """List users."""
+
+
+class ListUsersUseCase(IListUsersUseCase):
+    """List users use case."""
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        chunk_size: int = 100,
+    ) -> None:
+        """Initialize list users use case.
+
+        Args:
+            uow_factory: Unit of work factory
+            chunk_size: Users loaded per query
+
+        """
+        self.uow_factory = uow_factory
+        self.chunk_size = chunk_size
+
+    async def execute(
+        self,
+        user_filter: UserFilter,
+        after: UserPosition | None,
+        limit: int,
+    ) -> AsyncIterator[tuple[UserPosition, User]]:
+        """List users in creation order.
+
+        The page is loaded ``chunk_size`` users at a time, each chunk with
+        one keyset query in its own read-only unit of work, so neither a
+        connection nor the whole page is held while it is consumed.
+
+        Args:
+            user_filter: Conditions the users must match
+            after: Position of the last user of the previous page
+            limit: Most users returned
+
+        Yields:
+            tuple[UserPosition, User]: Users with their position
+
+        """
+        remaining = limit
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            async with self.uow_factory(read_only=True) as uow:
+                chunk = await uow.users.find_page(after, size, user_filter)
+            logger.debug("Listed %s users after %s", len(chunk), after)
+
+            for item in chunk:
+                yield item
+
+            if len(chunk) < size:
+                return
+            remaining -= size
+            after = chunk[-1][0]
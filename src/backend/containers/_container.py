@@ -2,6 +2,7 @@
 
 from dependency_injector import containers, providers
 
+from backend.containers.services import ServiceContainer
 from backend.containers.use_cases import ServiceUseCaseContainer
 from backend.containers.user.use_cases import UserUseCaseContainer
 
@@ -9,6 +10,16 @@ from backend.containers.user.use_cases import UserUseCaseContainer
 class Container(containers.DeclarativeContainer):
     """Main DI container."""
 
-    service_use_case = providers.Container(ServiceUseCaseContainer)
+    # shared by all use case containers, so there is a single engine (and
+    # connection pool) and a single instance of every singleton service
+    service = providers.Container(ServiceContainer)
 
-    user_use_case = providers.Container(UserUseCaseContainer)
+    service_use_case = providers.Container(
+        ServiceUseCaseContainer,
+        service=service,
+    )
+
+    user_use_case = providers.Container(
+        UserUseCaseContainer,
+        service=service,
+    )
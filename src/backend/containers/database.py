@@ -1,26 +1,50 @@
 """Database container."""
 
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
+from backend.infrastructure.database.engine import create_engine
+from backend.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from backend.infrastructure.database.replicas import (
+    InMemoryStickyKeys,
+    RedisStickyKeys,
+    ReplicaRouter,
+)
 from backend.shared import config
 
+config.db.check_pool(config.app.worker_count)
+config.db.check_replicas(config.app.worker_count)
+pool_size, max_overflow = config.db.pool_limits(config.app.worker_count)
+warmup_connections = min(config.db.warmup_connections, pool_size)
+
+# shared by the primary and the replica engines
+engine_options = {
+    "pre_ping_idle_seconds": config.db.pre_ping_idle_seconds,
+    "observe_compiled_cache": config.metrics.enabled,
+    "future": True,
+    "pool_size": pool_size,
+    "max_overflow": max_overflow,
+    "pool_timeout": config.db.pool_timeout_seconds,
+    "pool_recycle": config.db.pool_recycle_seconds,
+    "query_cache_size": config.db.query_cache_size,
+    "connect_args": config.db.connect_args,
+}
+
 
 class DatabaseContainer(containers.DeclarativeContainer):
     """Database container."""
 
+    redis = providers.Dependency(instance_of=Redis)
+
     engine = providers.Singleton(
-        create_async_engine,
+        create_engine,
         config.db.url,
-        future=True,
-        pool_size=20,
-        max_overflow=30,
-        pool_pre_ping=True,
-        pool_recycle=3600,
+        poolclass=(
+            InstrumentedAsyncQueuePool if config.metrics.enabled else None
+        ),
+        **engine_options,
     )
 
     session_factory = providers.Singleton(
@@ -29,3 +53,62 @@ class DatabaseContainer(containers.DeclarativeContainer):
         class_=AsyncSession,
         expire_on_commit=False,
     )
+
+    # read-only units of work, no BEGIN/COMMIT round trips
+    read_only_session_factory = providers.Singleton(
+        async_sessionmaker,
+        bind=engine.provided.execution_options.call(
+            isolation_level="AUTOCOMMIT",
+        ),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    replicas = providers.Selector(
+        providers.Object(
+            "enabled" if config.db.replica_url_list else "disabled",
+        ),
+        enabled=providers.Singleton(
+            ReplicaRouter,
+            engines=providers.List(
+                *(
+                    providers.Singleton(create_engine, url, **engine_options)
+                    for url in config.db.replica_url_list
+                ),
+            ),
+            balancing=config.db.replica_balancing,
+            retry_seconds=config.db.replica_retry_seconds,
+            sticky=providers.Selector(
+                providers.Object(
+                    config.db.replica_sticky_backend.value
+                    if config.db.replica_sticky_seconds
+                    else "disabled",
+                ),
+                memory=providers.Singleton(
+                    InMemoryStickyKeys,
+                    ttl=config.db.replica_sticky_seconds,
+                    maxsize=config.db.replica_sticky_max_size,
+                ),
+                redis=providers.Singleton(
+                    RedisStickyKeys,
+                    client=redis,
+                    ttl=config.db.replica_sticky_seconds,
+                ),
+                disabled=providers.Object(None),
+            ),
+        ),
+        disabled=providers.Object(None),
+    )
+
+    # asyncpg backend, the same connection budget as the engine
+    pool = providers.Singleton(
+        AsyncpgPool,
+        config.db.dsn,
+        min_size=warmup_connections,
+        max_size=pool_size + max_overflow,
+        acquire_timeout=config.db.pool_timeout_seconds,
+        max_inactive_connection_lifetime=config.db.pool_recycle_seconds,
+        timeout=config.db.connect_timeout_seconds,
+        command_timeout=config.db.command_timeout_seconds or None,
+        statement_cache_size=config.db.prepared_statement_cache_size,
+    )
@@ -1,32 +1,138 @@
 """Service container."""
 
 from dependency_injector import containers, providers
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from redis.asyncio import Redis
 
 from backend.containers.database import DatabaseContainer
 from backend.infrastructure.services.health.db import (
+    AsyncpgHealthCheckService,
     DatabaseHealthCheckService,
 )
+from backend.infrastructure.services.health.monitor import (
+    BackgroundHealthMonitor,
+)
+from backend.infrastructure.services.rate_limit import (
+    InMemoryRateLimiter,
+    RedisRateLimiter,
+)
 from backend.infrastructure.services.uow import SqlAlchemyUnitOfWork
+from backend.infrastructure.services.uow_asyncpg import AsyncpgUnitOfWork
+from backend.infrastructure.services.uow_scope import (
+    RequestScopedUnitOfWorkFactory,
+)
+from backend.infrastructure.services.user.cache import (
+    InMemoryUserCache,
+    RedisUserCache,
+)
+from backend.infrastructure.services.user.fingerprint import (
+    InMemoryUserFingerprintStore,
+)
+from backend.infrastructure.services.user.write_behind import (
+    WriteBehindUserQueue,
+)
+from backend.shared import config
+from backend.shared._config import WriteDurability
 
 
 class ServiceContainer(containers.DeclarativeContainer):
     """Service container."""
 
-    db = providers.Container(DatabaseContainer)
+    redis = providers.Singleton(Redis.from_url, config.redis.url)
+
+    db = providers.Container(DatabaseContainer, redis=redis)
+
+    # a new, independent unit of work per call
+    unit_of_work = providers.Selector(
+        providers.Object(config.db.backend.value),
+        sqlalchemy=providers.Factory(
+            SqlAlchemyUnitOfWork,
+            session_factory=db.session_factory,
+            replicas=db.replicas,
+            read_only_session_factory=db.read_only_session_factory,
+        ),
+        asyncpg=providers.Factory(AsyncpgUnitOfWork, pool=db.pool),
+    )
+
+    # shares one unit of work between the use cases of a request
+    uow = providers.Singleton(
+        RequestScopedUnitOfWorkFactory,
+        uow_factory=unit_of_work.provider,
+    )
+
+    database_health_check = providers.Selector(
+        providers.Object(config.db.backend.value),
+        sqlalchemy=providers.Singleton(
+            DatabaseHealthCheckService,
+            engine=db.engine,
+            timeout=config.health.probe_timeout_seconds,
+        ),
+        asyncpg=providers.Singleton(
+            AsyncpgHealthCheckService,
+            pool=db.pool,
+            timeout=config.health.probe_timeout_seconds,
+        ),
+    )
+
+    health_monitor = providers.Singleton(
+        BackgroundHealthMonitor,
+        database_health_check=database_health_check,
+        interval=config.health.probe_interval_seconds,
+        max_age=config.health.max_age_seconds,
+    )
+
+    limiter = providers.Selector(
+        providers.Object(config.rate_limit.backend.value),
+        memory=providers.Singleton(
+            InMemoryRateLimiter,
+            max_keys=config.rate_limit.max_keys,
+        ),
+        redis=providers.Singleton(RedisRateLimiter, client=redis),
+    )
 
-    limiter = providers.Singleton(
-        Limiter,
-        key_func=get_remote_address,
+    user_cache = providers.Selector(
+        providers.Object(config.cache.backend.value),
+        memory=providers.Singleton(
+            InMemoryUserCache,
+            maxsize=config.cache.user_max_size,
+            ttl=config.cache.user_ttl_seconds,
+        ),
+        redis=providers.Singleton(
+            RedisUserCache,
+            client=redis,
+            ttl=config.cache.user_ttl_seconds,
+        ),
     )
 
-    uow = providers.Factory(
-        SqlAlchemyUnitOfWork,
-        session_factory=db.session_factory,
+    user_fingerprints = providers.Selector(
+        providers.Object(
+            "enabled"
+            if config.cache.fingerprints_enabled(config.app.worker_count)
+            else "disabled",
+        ),
+        enabled=providers.Singleton(
+            InMemoryUserFingerprintStore,
+            maxsize=config.cache.user_fingerprint_max_size,
+            ttl=config.cache.user_fingerprint_ttl_seconds,
+        ),
+        disabled=providers.Object(None),
     )
 
-    database_health_check = providers.Factory(
-        DatabaseHealthCheckService,
-        session_factory=db.session_factory,
+    user_write_queue = providers.Selector(
+        providers.Object(
+            "enabled" if config.write_behind.enabled else "disabled",
+        ),
+        enabled=providers.Singleton(
+            WriteBehindUserQueue,
+            # flushes run in the background, outside any request
+            uow_factory=unit_of_work.provider,
+            user_cache=user_cache,
+            fingerprints=user_fingerprints,
+            flush_interval=config.write_behind.flush_interval_ms / 1000,
+            max_batch_size=config.write_behind.max_batch_size,
+            max_pending=config.write_behind.max_pending,
+            wait_for_flush=(
+                config.write_behind.durability == WriteDurability.FLUSHED
+            ),
+        ),
+        disabled=providers.Object(None),
     )
@@ -16,7 +16,9 @@ class ServiceUseCaseContainer(containers.DeclarativeContainer):
         ServiceContainer,
     )
 
-    health_check: providers.Factory[IHealthCheckUseCase] = providers.Factory(
-        HealthCheckUseCase,
-        database_health_check_service=service.database_health_check,
+    health_check: providers.Singleton[IHealthCheckUseCase] = (
+        providers.Singleton(
+            HealthCheckUseCase,
+            health_monitor=service.health_monitor,
+        )
     )
@@ -4,6 +4,8 @@ from dependency_injector import containers, providers
 
 from backend.application.use_cases.user.ensure import EnsureUserUseCase
 from backend.application.use_cases.user.get import GetUserUseCase
+from backend.application.use_cases.user.get_many import GetUsersUseCase
+from backend.application.use_cases.user.list_users import ListUsersUseCase
 from backend.containers.services import ServiceContainer
 
 
@@ -12,11 +14,25 @@ class UserUseCaseContainer(containers.DeclarativeContainer):
 
     service = providers.Container(ServiceContainer)
 
-    ensure = providers.Factory(
+    # stateless, shared by all requests
+    ensure = providers.Singleton(
         EnsureUserUseCase,
-        uow_factory=service.uow.provider,
+        uow_factory=service.uow,
+        fingerprints=service.user_fingerprints,
+        user_cache=service.user_cache,
+        write_queue=service.user_write_queue,
     )
-    get = providers.Factory(
+    get = providers.Singleton(
         GetUserUseCase,
-        uow_factory=service.uow.provider,
+        uow_factory=service.uow,
+        user_cache=service.user_cache,
+    )
+    get_many = providers.Singleton(
+        GetUsersUseCase,
+        uow_factory=service.uow,
+        user_cache=service.user_cache,
+    )
+    list_users = providers.Singleton(
+        ListUsersUseCase,
+        uow_factory=service.uow,
     )
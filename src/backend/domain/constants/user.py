@@ -1,3 +1,6 @@
 """User constants."""
 
 LANGUAGE_CODE_LENGTH = 2
+# stored as BIGINT
+MAX_USER_ID = 2**63 - 1
+PHOTO_URL_PREFIX = "https://t.me/i/userpic/"
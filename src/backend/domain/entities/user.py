@@ -12,7 +12,7 @@ from backend.domain.value_objects.user import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """User entity."""
 
@@ -22,3 +22,20 @@ class User:
     last_name: LastName
     language_code: LanguageCode
     photo_url: PhotoUrl
+
+    @property
+    def profile_fingerprint(self) -> int:
+        """Compact fingerprint of the profile fields.
+
+        Stable within a process only (built on ``hash``), meant for
+        in-process change detection.
+        """
+        return hash(
+            (
+                self.username.value,
+                self.first_name.value,
+                self.last_name.value,
+                self.language_code.value,
+                self.photo_url.value,
+            ),
+        )
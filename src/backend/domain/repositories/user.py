@@ -3,13 +3,34 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from datetime import datetime
+
     from backend.domain.entities.user import User
     from backend.domain.value_objects.user import UserId
 
 
+@dataclass(frozen=True, slots=True)
+class UserPosition:
+    """Position of a user in creation order, ties broken by ID."""
+
+    created_at: datetime
+    user_id: UserId
+
+
+@dataclass(frozen=True, slots=True)
+class UserFilter:
+    """Conditions users are listed by, ``None`` matches everyone."""
+
+    language_code: str | None = None
+    # case-insensitive
+    username_prefix: str | None = None
+
+
 class IUserRepository(ABC):
     """User repository interface."""
 
@@ -17,10 +38,34 @@ class IUserRepository(ABC):
     async def find_by_id(self, user_id: UserId) -> User | None:
         """Find a user by their ID."""
 
+    @abstractmethod
+    async def find_many(self, user_ids: Collection[UserId]) -> list[User]:
+        """Find the users with the given IDs, in no particular order.
+
+        IDs that match no user are left out of the result.
+        """
+
+    @abstractmethod
+    async def find_page(
+        self,
+        after: UserPosition | None,
+        limit: int,
+        user_filter: UserFilter | None = None,
+    ) -> list[tuple[UserPosition, User]]:
+        """Find up to ``limit`` users created after ``after``, oldest first.
+
+        Pages are read by keyset, so every page costs the same however
+        far into the table it is.
+        """
+
     @abstractmethod
     async def save(self, user: User) -> User:
         """Save a user."""
 
+    @abstractmethod
+    async def save_many(self, users: Sequence[User]) -> None:
+        """Save several users at once."""
+
     @abstractmethod
     async def delete(self, user_id: UserId) -> None:
         """Delete a user."""
@@ -0,0 +1,28 @@
+"""Base value object."""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+from typing_extensions import Self
+
+T = TypeVar("T")
+
+
+class ValueObject(Generic[T]):
+    """Base of value objects wrapping a single validated ``value``.
+
+    Subclasses are frozen, slotted dataclasses validating ``value`` in
+    ``__post_init__``.
+    """
+
+    __slots__ = ()
+
+    value: T
+
+    @classmethod
+    def trusted(cls, value: T) -> Self:
+        """Build from already validated data, skipping validation."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", value)
+        return instance
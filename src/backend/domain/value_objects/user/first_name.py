@@ -1,10 +1,14 @@
 """User first name value object."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
+from backend.domain.value_objects.base import ValueObject
+
 
-@dataclass(frozen=True)
-class FirstName:
+@dataclass(frozen=True, slots=True)
+class FirstName(ValueObject[str]):
     """User first name value object."""
 
     value: str
@@ -15,7 +19,7 @@ class FirstName:
             msg = "First name must be a string"
             raise TypeError(msg)
 
-        if not self.value.strip():
+        if not self.value or self.value.isspace():
             msg = "First name cannot be empty"
             raise ValueError(msg)
 
@@ -1,17 +1,23 @@
 """User ID value object."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
+from backend.domain.constants.user import MAX_USER_ID
+from backend.domain.value_objects.base import ValueObject
+
 
-@dataclass(frozen=True)
-class UserId:
+@dataclass(frozen=True, slots=True)
+class UserId(ValueObject[int]):
     """User ID value object."""
 
     value: int
 
     def __post_init__(self) -> None:
         """Post-init validation."""
-        if not isinstance(self.value, int):
+        # bool is an int subclass, True would be user 1
+        if not isinstance(self.value, int) or isinstance(self.value, bool):
             msg = "User ID must be an integer"
             raise TypeError(msg)
 
@@ -19,6 +25,10 @@ class UserId:
             msg = "User ID must be positive"
             raise ValueError(msg)
 
+        if self.value > MAX_USER_ID:
+            msg = f"User ID must be at most {MAX_USER_ID}"
+            raise ValueError(msg)
+
     def __str__(self) -> str:
         """Return the string representation of the user ID."""
         return str(self.value)
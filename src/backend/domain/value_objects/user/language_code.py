@@ -5,10 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from backend.domain.constants.user import LANGUAGE_CODE_LENGTH
+from backend.domain.value_objects.base import ValueObject
 
 
-@dataclass(frozen=True)
-class LanguageCode:
+@dataclass(frozen=True, slots=True)
+class LanguageCode(ValueObject[str | None]):
     """User language code value object."""
 
     value: str | None = None
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from backend.domain.value_objects.base import ValueObject
 
-@dataclass(frozen=True)
-class LastName:
+
+@dataclass(frozen=True, slots=True)
+class LastName(ValueObject[str | None]):
     """User last name value object."""
 
     value: str | None = None
@@ -20,7 +22,7 @@ class LastName:
             msg = "Last name must be a string"
             raise TypeError(msg)
 
-        if not self.value.strip():
+        if not self.value or self.value.isspace():
             msg = "Last name cannot be empty"
             raise ValueError(msg)
 
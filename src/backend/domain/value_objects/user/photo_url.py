@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from urllib.parse import urlparse
 
+from backend.domain.constants.user import PHOTO_URL_PREFIX
+from backend.domain.value_objects.base import ValueObject
 
-@dataclass(frozen=True)
-class PhotoUrl:
+
+@dataclass(frozen=True, slots=True)
+class PhotoUrl(ValueObject[str | None]):
     """User photo URL value object."""
 
     value: str | None = None
@@ -21,16 +23,15 @@ class PhotoUrl:
             msg = "Photo URL must be a string"
             raise TypeError(msg)
 
-        parsed = urlparse(self.value)
-        if parsed.scheme != "https" or not parsed.netloc:
-            msg = "Photo URL must be a valid HTTPS URL"
-            raise ValueError(msg)
-
-        if not self.value.startswith("https://t.me/i/userpic/"):
-            msg = "Photo URL must be a valid Telegram userpic URL"
-            raise ValueError(
-                msg,
+        # the fixed https://t.me prefix implies scheme and host, no need
+        # to parse the URL
+        if not self.value.startswith(PHOTO_URL_PREFIX):
+            msg = (
+                "Photo URL must be a valid Telegram userpic URL"
+                if self.value.startswith("https://")
+                else "Photo URL must be a valid HTTPS URL"
             )
+            raise ValueError(msg)
 
     def __str__(self) -> str:
         """Return the string representation of the photo URL."""
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from backend.domain.value_objects.base import ValueObject
 
-@dataclass(frozen=True)
-class Username:
+
+@dataclass(frozen=True, slots=True)
+class Username(ValueObject[str | None]):
     """User username value object."""
 
     value: str | None = None
@@ -20,7 +22,7 @@ class Username:
             msg = "Username must be a string"
             raise TypeError(msg)
 
-        if not self.value.strip():
+        if not self.value or self.value.isspace():
             msg = "Username cannot be empty"
             raise ValueError(msg)
 
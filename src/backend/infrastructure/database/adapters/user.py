@@ -1,5 +1,9 @@
 """User database adapter."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from backend.domain.entities.user import User
 from backend.domain.value_objects.user import (
     FirstName,
@@ -11,30 +15,91 @@ from backend.domain.value_objects.user import (
 )
 from backend.infrastructure.database.models.user import UserModel
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# value object validating each entity column
+_VALUE_OBJECTS: dict[str, Any] = {
+    "id": UserId,
+    "username": Username,
+    "first_name": FirstName,
+    "last_name": LastName,
+    "language_code": LanguageCode,
+    "photo_url": PhotoUrl,
+}
+
 
 class UserAdapter:
-    """User database adapter."""
+    """User database adapter.
+
+    Rows were validated by the value objects before they were written, so
+    entities loaded back are built through the trusted constructors
+    without validating them again.
+    """
 
     @staticmethod
     def to_entity(user: UserModel) -> User:
         """Convert a user model to an entity."""
         return User(
-            id=UserId(user.id),
-            username=Username(user.username),
-            first_name=FirstName(user.first_name),
-            last_name=LastName(user.last_name),
-            language_code=LanguageCode(user.language_code),
-            photo_url=PhotoUrl(user.photo_url),
+            id=UserId.trusted(user.id),
+            username=Username.trusted(user.username),
+            first_name=FirstName.trusted(user.first_name),
+            last_name=LastName.trusted(user.last_name),
+            language_code=LanguageCode.trusted(user.language_code),
+            photo_url=PhotoUrl.trusted(user.photo_url),
         )
 
     @staticmethod
     def to_model(user: User) -> UserModel:
         """Convert an entity to a model."""
-        return UserModel(
-            id=user.id.value,
-            username=user.username.value,
-            first_name=user.first_name.value,
-            last_name=user.last_name.value,
-            language_code=user.language_code.value,
-            photo_url=user.photo_url.value,
+        return UserModel(**UserAdapter.to_values(user))
+
+    @staticmethod
+    def to_values(user: User) -> dict[str, Any]:
+        """Convert an entity to a column-name keyed mapping."""
+        return {
+            "id": user.id.value,
+            "username": user.username.value,
+            "first_name": user.first_name.value,
+            "last_name": user.last_name.value,
+            "language_code": user.language_code.value,
+            "photo_url": user.photo_url.value,
+        }
+
+    @staticmethod
+    def from_row(row: Mapping[Any, Any]) -> User:
+        """Convert a column-name keyed row to an entity."""
+        return User(
+            id=UserId.trusted(row["id"]),
+            username=Username.trusted(row["username"]),
+            first_name=FirstName.trusted(row["first_name"]),
+            last_name=LastName.trusted(row["last_name"]),
+            language_code=LanguageCode.trusted(row["language_code"]),
+            photo_url=PhotoUrl.trusted(row["photo_url"]),
         )
+
+    @staticmethod
+    def validate_columns(
+        columns: Mapping[str, Sequence[Any]],
+    ) -> dict[int, str]:
+        """Validate a batch of rows laid out column by column.
+
+        Each column is run through its value object in one pass, without
+        building entities. Missing columns are treated as all ``None``.
+
+        Returns:
+            dict[int, str]: error of every invalid row, by row index
+
+        """
+        size = max(map(len, columns.values()), default=0)
+        errors: dict[int, str] = {}
+        for name, value_object in _VALUE_OBJECTS.items():
+            values = columns.get(name) or [None] * size
+            for index, value in enumerate(values):
+                # entering try is free since Python 3.11, only errors cost
+                try:
+                    value_object(value)
+                except (TypeError, ValueError) as e:  # noqa: PERF203
+                    errors.setdefault(index, f"{name}: {e}")
+
+        return errors
@@ -0,0 +1,158 @@
+"""asyncpg connection pool."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+if TYPE_CHECKING:
+    from asyncpg.pool import PoolConnectionProxy
+
+logger = logging.getLogger(__name__)
+
+
+async def _keep_session_state(_: asyncpg.Connection) -> None:
+    """Skip the reset query asyncpg runs when a connection is released.
+
+    The default ``RESET ALL``/``UNLISTEN``/advisory unlock costs a round
+    trip per release; the application never changes session state. An
+    open transaction is still rolled back by asyncpg itself.
+    """
+
+
+class AsyncpgPool:
+    """asyncpg pool opened on first use.
+
+    ``min_size`` connections are opened with the pool, further ones on
+    demand up to ``max_size``. Call ``open`` at startup to connect ahead
+    of the first request and ``close`` on shutdown.
+
+    ``fetch``, ``fetchrow`` and ``execute`` run outside a transaction and
+    hold a connection only for the duration of the query.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        acquire_timeout: float | None = None,
+        max_inactive_connection_lifetime: float = 300.0,
+        **connect_kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            dsn: ``postgresql://`` connection URL
+            min_size: Connections opened with the pool
+            max_size: Maximum number of connections
+            acquire_timeout: Wait for a free connection before failing,
+                None = no limit
+            max_inactive_connection_lifetime: Close connections idle for
+                longer than this, 0 = never
+            **connect_kwargs: ``asyncpg.connect`` arguments
+
+        """
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_inactive_connection_lifetime = (
+            max_inactive_connection_lifetime
+        )
+        self.connect_kwargs = connect_kwargs
+        self._pool: asyncpg.Pool | None = None
+        self._lock = asyncio.Lock()
+
+    async def open(self) -> asyncpg.Pool:
+        """Open the pool unless it is open already."""
+        if self._pool is not None:
+            return self._pool
+
+        async with self._lock:
+            if self._pool is None:
+                started = time.perf_counter()
+                self._pool = await asyncpg.create_pool(
+                    self.dsn,
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    max_inactive_connection_lifetime=(
+                        self.max_inactive_connection_lifetime
+                    ),
+                    reset=_keep_session_state,
+                    **self.connect_kwargs,
+                )
+                logger.info(
+                    "Opened asyncpg pool with %s connections in %.1fms",
+                    self.min_size,
+                    (time.perf_counter() - started) * 1000,
+                )
+
+        return self._pool
+
+    async def acquire(self) -> PoolConnectionProxy:
+        """Check out a connection, hand it back with ``release``."""
+        pool = self._pool or await self.open()
+        return await pool.acquire(timeout=self.acquire_timeout)
+
+    async def release(self, connection: PoolConnectionProxy) -> None:
+        """Return a connection checked out with ``acquire``."""
+        if self._pool is not None:
+            await self._pool.release(connection)
+
+    async def fetch(
+        self,
+        query: str,
+        *args: Any,  # noqa: ANN401
+    ) -> list[Any]:
+        """Run a query on a connection checked out for it alone."""
+        connection = await self.acquire()
+        try:
+            return await connection.fetch(query, *args)
+        finally:
+            await self.release(connection)
+
+    async def fetchrow(
+        self,
+        query: str,
+        *args: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """Run a query on a connection checked out for it alone."""
+        connection = await self.acquire()
+        try:
+            return await connection.fetchrow(query, *args)
+        finally:
+            await self.release(connection)
+
+    async def execute(
+        self,
+        query: str,
+        *args: Any,  # noqa: ANN401
+    ) -> str:
+        """Run a statement on a connection checked out for it alone."""
+        connection = await self.acquire()
+        try:
+            return await connection.execute(query, *args)
+        finally:
+            await self.release(connection)
+
+    async def close(self) -> None:
+        """Close the pool once its connections are released."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    @property
+    def size(self) -> int:
+        """Number of open connections."""
+        return self._pool.get_size() if self._pool is not None else 0
+
+    @property
+    def idle_size(self) -> int:
+        """Number of open connections not checked out."""
+        return self._pool.get_idle_size() if self._pool is not None else 0
@@ -0,0 +1,152 @@
+"""Database engine."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from backend.shared import metrics
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlalchemy.engine.default import DefaultExecutionContext
+    from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+logger = logging.getLogger(__name__)
+
+_CHECKED_IN_AT = "checked_in_at"
+
+
+def create_engine(
+    url: str,
+    pre_ping_idle_seconds: float = 0,
+    observe_compiled_cache: bool = False,
+    **kwargs: Any,  # noqa: ANN401
+) -> AsyncEngine:
+    """Create the async engine.
+
+    Args:
+        url: Database URL
+        pre_ping_idle_seconds: Ping connections idle for longer than this
+            on checkout, 0 = ping on every checkout
+        observe_compiled_cache: Count compiled SQL cache hits and misses
+        **kwargs: ``create_async_engine`` arguments
+
+    Returns:
+        AsyncEngine: Engine
+
+    """
+    engine = create_async_engine(
+        url,
+        pool_pre_ping=not pre_ping_idle_seconds,
+        **kwargs,
+    )
+    if pre_ping_idle_seconds:
+        IdleConnectionPinger(engine.sync_engine, pre_ping_idle_seconds)
+    if observe_compiled_cache:
+        event.listen(
+            engine.sync_engine,
+            "after_cursor_execute",
+            _CompiledCacheObserver(),
+        )
+
+    return engine
+
+
+class _CompiledCacheObserver:
+    """Count executed statements by compiled cache outcome."""
+
+    def __init__(self) -> None:
+        self._lookups = {
+            stats: metrics.DB_COMPILED_CACHE_LOOKUPS.labels(
+                stats.name.lower(),
+            )
+            for stats in CacheStats
+        }
+
+    def __call__(
+        self,
+        *args: Any,  # noqa: ANN401
+    ) -> None:
+        context: DefaultExecutionContext | None = args[4]
+        if context is not None:
+            self._lookups[context.cache_hit].inc()
+
+
+class IdleConnectionPinger:
+    """Ping pooled connections on checkout only when they sat idle.
+
+    ``pool_pre_ping`` costs a round trip on every checkout. Connections
+    checked in less than ``idle_seconds`` ago are handed out as they are;
+    older ones are pinged, and a failed ping makes the pool replace the
+    connection and retry the checkout.
+    """
+
+    def __init__(self, engine: Engine, idle_seconds: float) -> None:
+        """Subscribe to the pool events of ``engine``."""
+        self.engine = engine
+        self.idle_seconds = idle_seconds
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "checkout", self._on_checkout)
+
+    def _on_checkin(
+        self,
+        _: Any,  # noqa: ANN401
+        record: ConnectionPoolEntry,
+    ) -> None:
+        record.info[_CHECKED_IN_AT] = time.monotonic()
+
+    def _on_checkout(
+        self,
+        dbapi_connection: Any,  # noqa: ANN401
+        record: ConnectionPoolEntry,
+        _: PoolProxiedConnection,
+    ) -> None:
+        checked_in_at = record.info.pop(_CHECKED_IN_AT, None)
+        if (
+            checked_in_at is None
+            or time.monotonic() - checked_in_at < self.idle_seconds
+        ):
+            return
+
+        try:
+            self.engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            logger.info("Replacing idle connection that failed a ping")
+            raise exc.DisconnectionError from e
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` pooled connections ahead of the first request."""
+    if connections <= 0:
+        return
+
+    started = time.perf_counter()
+    pending = [engine.connect() for _ in range(connections)]
+    results = await asyncio.gather(
+        *(connection.start() for connection in pending),
+        return_exceptions=True,
+    )
+    # return the opened connections to the pool even if some failed
+    await asyncio.gather(
+        *(
+            connection.close()
+            for connection, result in zip(pending, results, strict=True)
+            if not isinstance(result, BaseException)
+        ),
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    logger.info(
+        "Opened %s database connections in %.1fms",
+        connections,
+        (time.perf_counter() - started) * 1000,
+    )
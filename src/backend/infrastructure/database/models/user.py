@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, BigInteger, String
+from sqlalchemy import TIMESTAMP, BigInteger, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.infrastructure.database.base import Base
@@ -14,6 +14,21 @@ class UserModel(Base):
     """User model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # keyset pagination in creation order
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index(
+            "ix_users_language_code_created_at_id",
+            "language_code",
+            "created_at",
+            "id",
+        ),
+        # case-insensitive username prefix search (LIKE 'abc%')
+        Index(
+            "ix_users_lower_username_prefix",
+            text("lower(username) text_pattern_ops"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     username: Mapped[str | None] = mapped_column(String, default=None)
@@ -0,0 +1,46 @@
+"""Instrumented connection pool."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from backend.shared import metrics
+
+if TYPE_CHECKING:
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool exporting its usage as Prometheus metrics.
+
+    Checked-out and overflow connections are refreshed from the pool's
+    checkout/checkin events; the time spent acquiring a connection is
+    observed around ``_do_get``, which no event covers.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the pool and subscribe to its events."""
+        super().__init__(*args, **kwargs)
+        event.listen(self, "checkout", self._on_checkout)
+        event.listen(self, "checkin", self._on_checkin)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+    def _on_checkout(self, *_: Any) -> None:  # noqa: ANN401
+        self._record_usage()
+
+    def _on_checkin(self, *_: Any) -> None:  # noqa: ANN401
+        self._record_usage()
+
+    def _record_usage(self) -> None:
+        metrics.DB_POOL_CHECKED_OUT.set(self.checkedout())
+        metrics.DB_POOL_OVERFLOW.set(max(0, self.overflow()))
@@ -0,0 +1,213 @@
+"""Read replica routing."""
+
+from __future__ import annotations
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.shared._config import ReplicaBalancing
+from backend.shared.cache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Hashable, Sequence
+
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False, slots=True)
+class Replica:
+    """Read replica and its routing state."""
+
+    engine: AsyncEngine
+    # autocommit sessions, replicas only serve read-only units of work
+    session_factory: async_sessionmaker[AsyncSession]
+    # units of work currently using the replica
+    in_use: int = 0
+    unavailable_until: float = 0.0
+
+
+class StickyKeys(ABC):
+    """Keys written recently, read from the primary until they expire."""
+
+    @abstractmethod
+    async def add(self, keys: Collection[Hashable]) -> None:
+        """Mark ``keys`` as just written."""
+
+    @abstractmethod
+    async def contains_any(self, keys: Collection[Hashable]) -> bool:
+        """Check if any of ``keys`` was written recently."""
+
+
+class InMemoryStickyKeys(StickyKeys):
+    """Sticky keys of this process only, for a single worker."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        """Initialize the in-memory sticky keys."""
+        self._keys: LRUCache[Hashable, bool] = LRUCache(maxsize, ttl)
+
+    async def add(self, keys: Collection[Hashable]) -> None:
+        """Mark ``keys`` as just written."""
+        for key in keys:
+            self._keys.set(key, True)
+
+    async def contains_any(self, keys: Collection[Hashable]) -> bool:
+        """Check if any of ``keys`` was written recently."""
+        return any(self._keys.get(key) for key in keys)
+
+
+class RedisStickyKeys(StickyKeys):
+    """Sticky keys shared between processes through Redis.
+
+    A write on one worker sends the following reads of every worker to
+    the primary. When Redis fails, keys are reported as sticky so reads
+    go to the primary rather than to a possibly lagging replica.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        ttl: float,
+        prefix: str = "replica_sticky:",
+    ) -> None:
+        """Initialize the Redis sticky keys."""
+        self._client = client
+        self._ttl_ms = max(1, int(ttl * 1000))
+        self._prefix = prefix
+
+    async def add(self, keys: Collection[Hashable]) -> None:
+        """Mark ``keys`` as just written."""
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(f"{self._prefix}{key}", 1, px=self._ttl_ms)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Failed to record %s sticky keys", len(keys))
+
+    async def contains_any(self, keys: Collection[Hashable]) -> bool:
+        """Check if any of ``keys`` was written recently."""
+        if not keys:
+            return False
+        try:
+            return bool(
+                await self._client.exists(
+                    *(f"{self._prefix}{key}" for key in keys),
+                ),
+            )
+        except RedisError:
+            logger.exception("Failed to read sticky keys, using the primary")
+            return True
+
+
+class ReplicaRouter:
+    """Pick the replica serving a read-only unit of work.
+
+    Replicas are balanced round-robin or by the fewest units of work in
+    flight in this process. A replica that fails is skipped for
+    ``retry_seconds``; when none is available, reads go to the primary.
+
+    Read-your-writes: keys passed to ``stick`` (e.g. the user id of a
+    login upsert) are read from the primary until they expire from
+    ``sticky``, so a lagging replica never serves an older row than was
+    just written. With several workers the keys must be shared.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        retry_seconds: float = 30.0,
+        sticky: StickyKeys | None = None,
+    ) -> None:
+        """Initialize the replica router.
+
+        Args:
+            engines: Replica engines
+            balancing: Balancing strategy
+            retry_seconds: Time a failed replica is skipped for
+            sticky: Keys written recently, None = no stickiness
+
+        """
+        self.replicas = [
+            Replica(
+                engine=engine,
+                session_factory=async_sessionmaker(
+                    bind=engine.execution_options(
+                        isolation_level="AUTOCOMMIT",
+                    ),
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                ),
+            )
+            for engine in engines
+        ]
+        self.balancing = balancing
+        self.retry_seconds = retry_seconds
+        self._sticky = sticky
+        self._turn = 0
+
+    async def acquire(
+        self,
+        keys: Collection[Hashable] = (),
+    ) -> Replica | None:
+        """Pick a replica for a read, None to read from the primary.
+
+        A replica returned here must be handed back with ``release``.
+        """
+        if (
+            self._sticky is not None
+            and keys
+            and await self._sticky.contains_any(keys)
+        ):
+            return None
+
+        now = time.monotonic()
+        available = [
+            replica
+            for replica in self.replicas
+            if replica.unavailable_until <= now
+        ]
+        if not available:
+            return None
+
+        self._turn += 1
+        replica = available[self._turn % len(available)]
+        if self.balancing == ReplicaBalancing.LEAST_CONNECTIONS:
+            # ties are broken round-robin
+            replica = min(
+                available,
+                key=lambda candidate: (
+                    candidate.in_use,
+                    candidate is not replica,
+                ),
+            )
+
+        replica.in_use += 1
+        return replica
+
+    def release(self, replica: Replica) -> None:
+        """Hand back a replica returned by ``acquire``."""
+        replica.in_use -= 1
+
+    def mark_unavailable(self, replica: Replica) -> None:
+        """Skip a failed replica for ``retry_seconds``."""
+        replica.unavailable_until = time.monotonic() + self.retry_seconds
+        logger.warning(
+            "Read replica %s is unavailable, retrying in %ss",
+            replica.engine.url.render_as_string(hide_password=True),
+            self.retry_seconds,
+        )
+
+    async def stick(self, keys: Collection[Hashable]) -> None:
+        """Read ``keys`` from the primary until they expire."""
+        if self._sticky is not None:
+            await self._sticky.add(keys)
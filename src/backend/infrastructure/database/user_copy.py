@@ -0,0 +1,111 @@
+"""Bulk copy of the users table through PostgreSQL ``COPY``."""
+
+from __future__ import annotations
+
+import logging
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from backend.infrastructure.database.user_sql import (
+    COLUMNS,
+    ON_CONFLICT_UPDATE_PROFILE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import BinaryIO
+
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+class UserFileFormat(str, Enum):
+    """Format of exported and imported user files."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_COLUMN_LIST = ", ".join(COLUMNS)
+
+_SELECT = f"SELECT {_COLUMN_LIST} FROM users"  # noqa: S608
+
+# PostgreSQL escapes backslashes in the text format; CSV with quote and
+# delimiter characters JSON never contains unescaped passes the JSON as is
+_EXPORT_OPTIONS: dict[UserFileFormat, dict[str, Any]] = {
+    UserFileFormat.NDJSON: {
+        "format": "csv",
+        "quote": "\x01",
+        "delimiter": "\x02",
+    },
+    UserFileFormat.CSV: {"format": "csv", "header": True},
+}
+_EXPORT_QUERIES = {
+    UserFileFormat.NDJSON: f"SELECT row_to_json(u) FROM ({_SELECT}) AS u",
+    UserFileFormat.CSV: _SELECT,
+}
+
+_STAGING_TABLE = "users_import"
+
+# session-local, emptied by every commit
+_CREATE_STAGING = (
+    f"CREATE TEMPORARY TABLE IF NOT EXISTS {_STAGING_TABLE} "
+    "(LIKE users INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+
+_UPSERT_STAGED = (
+    f"INSERT INTO users ({_COLUMN_LIST}) "  # noqa: S608
+    f"SELECT {_COLUMN_LIST} FROM {_STAGING_TABLE} "
+    f"{ON_CONFLICT_UPDATE_PROFILE}"
+)
+
+
+class UserCopy:
+    """Stream the users table to and from files with ``COPY``.
+
+    Rows never become entities or ORM objects: exports are written by
+    PostgreSQL as they are produced and imports are sent as binary
+    ``COPY`` batches, so memory stays bounded by one batch.
+    """
+
+    def __init__(self, connection: asyncpg.Connection) -> None:
+        """Initialize the copier on a dedicated connection."""
+        self._connection = connection
+        self._staging_created = False
+
+    async def export(
+        self, output: BinaryIO, file_format: UserFileFormat
+    ) -> int:
+        """Write every user to ``output``, return the number of rows."""
+        status = await self._connection.copy_from_query(
+            _EXPORT_QUERIES[file_format],
+            output=output,
+            **_EXPORT_OPTIONS[file_format],
+        )
+        # command tag, e.g. "COPY 42"
+        return int(status.rpartition(" ")[2])
+
+    async def import_batch(self, records: Sequence[tuple[Any, ...]]) -> int:
+        """Upsert validated records in one transaction.
+
+        Records hold the ``COLUMNS`` values in order, IDs must be unique
+        within the batch. Returns the number of rows inserted or updated.
+        """
+        if not records:
+            return 0
+
+        if not self._staging_created:
+            await self._connection.execute(_CREATE_STAGING)
+            self._staging_created = True
+
+        async with self._connection.transaction():
+            await self._connection.copy_records_to_table(
+                _STAGING_TABLE,
+                records=records,
+                columns=COLUMNS,
+            )
+            status = await self._connection.execute(_UPSERT_STAGED)
+
+        # command tag, e.g. "INSERT 0 42"
+        return int(status.rpartition(" ")[2])
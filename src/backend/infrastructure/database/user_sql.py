@@ -0,0 +1,38 @@
+"""Raw SQL shared by the users table queries."""
+
+# columns refreshed from Telegram on every login
+PROFILE_COLUMNS = (
+    "username",
+    "first_name",
+    "last_name",
+    "language_code",
+    "photo_url",
+)
+ENTITY_COLUMNS = ("id", *PROFILE_COLUMNS)
+# every column, in the order of exports and imports
+COLUMNS = (*ENTITY_COLUMNS, "created_at")
+
+# only rewrite rows whose profile changed, keep the original created_at
+ON_CONFLICT_UPDATE_PROFILE = (
+    "ON CONFLICT (id) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in PROFILE_COLUMNS)
+    + " WHERE "
+    + " OR ".join(
+        f"users.{name} IS DISTINCT FROM excluded.{name}"
+        for name in PROFILE_COLUMNS
+    )
+)
+
+
+def username_prefix_pattern(prefix: str) -> str:
+    """Return a ``LIKE`` pattern matching ``lower(username)`` by prefix.
+
+    ``\\``, ``%`` and ``_`` in ``prefix`` match literally.
+    """
+    escaped = (
+        prefix.lower()
+        .replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
+    return f"{escaped}%"
@@ -2,24 +2,143 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete
+from sqlalchemy import (
+    TIMESTAMP,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 from backend.domain.exceptions.user import UserNotFoundError
-from backend.domain.repositories.user import IUserRepository
+from backend.domain.repositories.user import IUserRepository, UserPosition
+from backend.domain.value_objects.user import UserId
 from backend.infrastructure.database.adapters.user import UserAdapter
 from backend.infrastructure.database.models.user import UserModel
+from backend.infrastructure.database.user_sql import (
+    PROFILE_COLUMNS,
+    username_prefix_pattern,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from typing import Any
+
+    from sqlalchemy import Select
+    from sqlalchemy.dialects.postgresql import Insert
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from backend.domain.entities.user import User
-    from backend.domain.value_objects.user import UserId
+    from backend.domain.repositories.user import UserFilter
 
 logger = logging.getLogger(__name__)
 
+_USERS = UserModel.__table__
+
+_PROFILE_COLUMNS = tuple(_USERS.c[name] for name in PROFILE_COLUMNS)
+_ENTITY_COLUMNS = (_USERS.c.id, *_PROFILE_COLUMNS)
+
+
+def _upsert(stmt: Insert) -> Insert:
+    """Make an insert only rewrite rows whose profile changed."""
+    return stmt.on_conflict_do_update(
+        index_elements=[_USERS.c.id],
+        set_={
+            column.key: stmt.excluded[column.key]
+            for column in _PROFILE_COLUMNS
+        },
+        where=or_(
+            *(
+                column.is_distinct_from(stmt.excluded[column.key])
+                for column in _PROFILE_COLUMNS
+            ),
+        ),
+    )
+
+
+# Statements are built once and bound with parameters on every call, so
+# each compiles once per engine and is then served from the compiled cache
+# (and asyncpg's prepared statement cache). The PostgreSQL ``ON CONFLICT``
+# insert has no cache key of its own, so upserts are wrapped in lambda
+# statements, which are cached by the lambda's code location instead.
+_FIND_BY_ID = select(*_ENTITY_COLUMNS).where(_USERS.c.id == bindparam("id"))
+
+# a single array parameter, the SQL does not depend on the number of IDs
+_FIND_MANY = select(*_ENTITY_COLUMNS).where(
+    _USERS.c.id == any_(cast(bindparam("ids"), ARRAY(_USERS.c.id.type))),
+)
+
+
+@functools.cache
+def _find_page(
+    after: bool,
+    language_code: bool,
+    username_prefix: bool,
+) -> Select[Any]:
+    """Build the page query for a combination of conditions.
+
+    Absent conditions are left out of the SQL rather than disabled with
+    ``IS NULL`` checks, so every combination has a plan using its index.
+    """
+    conditions = []
+    if after:
+        conditions.append(
+            tuple_(_USERS.c.created_at, _USERS.c.id)
+            > tuple_(bindparam("after_created_at"), bindparam("after_id")),
+        )
+    if language_code:
+        conditions.append(
+            _USERS.c.language_code == bindparam("language_code"),
+        )
+    if username_prefix:
+        conditions.append(
+            func.lower(_USERS.c.username).like(bindparam("username_pattern")),
+        )
+
+    return (
+        select(*_ENTITY_COLUMNS, _USERS.c.created_at)
+        .where(*conditions)
+        .order_by(_USERS.c.created_at, _USERS.c.id)
+        .limit(bindparam("limit"))
+    )
+
+
+_SAVE = _upsert(insert(_USERS)).returning(*_ENTITY_COLUMNS)
+_SAVE_STMT = lambda_stmt(lambda: _SAVE)
+
+# one row per array element; the SQL does not depend on the batch size
+_SAVE_MANY = _upsert(
+    insert(_USERS).from_select(
+        [*(column.key for column in _ENTITY_COLUMNS), "created_at"],
+        select(
+            func.unnest(
+                *(
+                    cast(bindparam(column.key), ARRAY(column.type))
+                    for column in _ENTITY_COLUMNS
+                ),
+            )
+            .table_valued(*(column.key for column in _ENTITY_COLUMNS))
+            .render_derived(),
+            bindparam("created_at", type_=TIMESTAMP),
+        ),
+    ),
+)
+
+_SAVE_MANY_STMT = lambda_stmt(lambda: _SAVE_MANY)
+
+_DELETE = delete(_USERS).where(_USERS.c.id == bindparam("id"))
+
 
 class UserRepository(IUserRepository):
     """User repository implementation."""
@@ -30,32 +149,96 @@ class UserRepository(IUserRepository):
 
     async def find_by_id(self, user_id: UserId) -> User | None:
         """Find a user by their ID."""
-        user_model = await self._session.get(UserModel, user_id.value)
-        return UserAdapter.to_entity(user_model) if user_model else None
+        result = await self._session.execute(
+            _FIND_BY_ID,
+            {"id": user_id.value},
+        )
+        row = result.mappings().first()
+        return UserAdapter.from_row(row) if row else None
+
+    async def find_many(self, user_ids: Collection[UserId]) -> list[User]:
+        """Find users with a single ``id = ANY(...)`` query."""
+        if not user_ids:
+            return []
+
+        result = await self._session.execute(
+            _FIND_MANY,
+            {"ids": [user_id.value for user_id in user_ids]},
+        )
+        return [UserAdapter.from_row(row) for row in result.mappings()]
+
+    async def find_page(
+        self,
+        after: UserPosition | None,
+        limit: int,
+        user_filter: UserFilter | None = None,
+    ) -> list[tuple[UserPosition, User]]:
+        """Find a page of users with a single keyset query."""
+        language_code = user_filter.language_code if user_filter else None
+        prefix = user_filter.username_prefix if user_filter else None
+
+        parameters: dict[str, Any] = {"limit": limit}
+        if after:
+            parameters["after_created_at"] = after.created_at
+            parameters["after_id"] = after.user_id.value
+        if language_code:
+            parameters["language_code"] = language_code
+        if prefix:
+            parameters["username_pattern"] = username_prefix_pattern(prefix)
+
+        result = await self._session.execute(
+            _find_page(bool(after), bool(language_code), bool(prefix)),
+            parameters,
+        )
+        return [
+            (
+                UserPosition(row["created_at"], UserId.trusted(row["id"])),
+                UserAdapter.from_row(row),
+            )
+            for row in result.mappings()
+        ]
 
     async def save(self, user: User) -> User:
-        """Save a user."""
-        user_model = UserAdapter.to_model(user)
-
-        existing_user = await self.find_by_id(user.id)
-
-        if existing_user:
-            persistent_model = await self._session.merge(user_model)
-            logger.debug("User ID=%s already exists, updating", user.id)
-        else:
-            self._session.add(user_model)
-            persistent_model = user_model
-            logger.debug("User ID=%s not found, creating", user.id)
-
-        await self._session.flush()
-        await self._session.refresh(persistent_model)
-
-        return UserAdapter.to_entity(persistent_model)
+        """Save a user.
+
+        Runs a single ``INSERT ... ON CONFLICT (id) DO UPDATE`` statement.
+        The update only fires when a profile column actually differs, so
+        unchanged rows are never rewritten and return nothing.
+        """
+        result = await self._session.execute(
+            _SAVE_STMT,
+            UserAdapter.to_values(user),
+        )
+        row = result.mappings().first()
+
+        if row is None:
+            logger.debug("User ID=%s is up to date, skipping write", user.id)
+            return user
+
+        logger.debug("User ID=%s created or updated", user.id)
+        return UserAdapter.from_row(row)
+
+    async def save_many(self, users: Sequence[User]) -> None:
+        """Save users with a single upsert of ``unnest``-ed arrays.
+
+        User IDs must be unique within the batch.
+        """
+        if not users:
+            return
+
+        rows = [UserAdapter.to_values(user) for user in users]
+        parameters: dict[str, Any] = {
+            column.key: [row[column.key] for row in rows]
+            for column in _ENTITY_COLUMNS
+        }
+        parameters["created_at"] = datetime.now()
+
+        await self._session.execute(_SAVE_MANY_STMT, parameters)
+        logger.debug("Upserted %s users", len(users))
 
     async def delete(self, user_id: UserId) -> None:
         """Delete a user."""
-        stmt = delete(UserModel).where(UserModel.id == user_id.value)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(_DELETE, {"id": user_id.value})
 
         if result.rowcount == 0:
             raise UserNotFoundError(user_id)
@@ -0,0 +1,201 @@
+"""asyncpg user repository implementation."""
+
+from __future__ import annotations
+
+import functools
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from backend.domain.exceptions.user import UserNotFoundError
+from backend.domain.repositories.user import IUserRepository, UserPosition
+from backend.domain.value_objects.user import UserId
+from backend.infrastructure.database.adapters.user import UserAdapter
+from backend.infrastructure.database.user_sql import (
+    ENTITY_COLUMNS,
+    ON_CONFLICT_UPDATE_PROFILE,
+    username_prefix_pattern,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+    from asyncpg.pool import PoolConnectionProxy
+
+    from backend.domain.entities.user import User
+    from backend.domain.repositories.user import UserFilter
+    from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
+
+logger = logging.getLogger(__name__)
+
+_COLUMN_LIST = ", ".join(ENTITY_COLUMNS)
+
+# asyncpg prepares each statement once per connection and reuses it
+_FIND_BY_ID = f"SELECT {_COLUMN_LIST} FROM users WHERE id = $1"  # noqa: S608
+
+_FIND_MANY = (
+    f"SELECT {_COLUMN_LIST} FROM users "  # noqa: S608
+    "WHERE id = ANY($1::bigint[])"
+)
+
+
+@functools.cache
+def _find_page(after: bool, language_code: bool, username_prefix: bool) -> str:
+    """Build the page query for a combination of conditions.
+
+    Absent conditions are left out of the SQL rather than disabled with
+    ``IS NULL`` checks, so every combination has a plan using its index.
+    ``$1`` is the limit, the parameters of the present conditions follow
+    in the order of the arguments.
+    """
+    conditions: list[str] = []
+    parameter = 2
+    if after:
+        conditions.append(
+            f"(created_at, id) > (${parameter}::timestamp, "
+            f"${parameter + 1}::bigint)",
+        )
+        parameter += 2
+    if language_code:
+        conditions.append(f"language_code = ${parameter}")
+        parameter += 1
+    if username_prefix:
+        conditions.append(f"lower(username) LIKE ${parameter}")
+
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return (
+        f"SELECT {_COLUMN_LIST}, created_at FROM users "  # noqa: S608
+        f"{where}ORDER BY created_at, id LIMIT $1"
+    )
+
+
+_SAVE = (
+    f"INSERT INTO users ({_COLUMN_LIST}, created_at) "  # noqa: S608
+    "VALUES ($1, $2, $3, $4, $5, $6, $7) "
+    f"{ON_CONFLICT_UPDATE_PROFILE} RETURNING {_COLUMN_LIST}"
+)
+
+# one row per array element; the SQL does not depend on the batch size
+_SAVE_MANY = (
+    f"INSERT INTO users ({_COLUMN_LIST}, created_at) "  # noqa: S608
+    "SELECT *, $7::timestamp FROM unnest("
+    "$1::bigint[], $2::varchar[], $3::varchar[], "
+    "$4::varchar[], $5::varchar[], $6::varchar[]) "
+    f"{ON_CONFLICT_UPDATE_PROFILE}"
+)
+
+_DELETE = "DELETE FROM users WHERE id = $1"
+
+
+class AsyncpgUserRepository(IUserRepository):
+    """User repository talking to asyncpg directly.
+
+    Rows are mapped to entities without ORM objects or SQL compilation.
+    Bound to a connection, statements run in its transaction; bound to the
+    pool, each runs in autocommit on a connection checked out for it.
+    """
+
+    def __init__(self, connection: PoolConnectionProxy | AsyncpgPool) -> None:
+        """Initialize the user repository."""
+        self._connection = connection
+
+    async def find_by_id(self, user_id: UserId) -> User | None:
+        """Find a user by their ID."""
+        row = await self._connection.fetchrow(_FIND_BY_ID, user_id.value)
+        return UserAdapter.from_row(row) if row else None
+
+    async def find_many(self, user_ids: Collection[UserId]) -> list[User]:
+        """Find users with a single ``id = ANY($1)`` query."""
+        if not user_ids:
+            return []
+
+        rows = await self._connection.fetch(
+            _FIND_MANY,
+            [user_id.value for user_id in user_ids],
+        )
+        return [UserAdapter.from_row(row) for row in rows]
+
+    async def find_page(
+        self,
+        after: UserPosition | None,
+        limit: int,
+        user_filter: UserFilter | None = None,
+    ) -> list[tuple[UserPosition, User]]:
+        """Find a page of users with a single keyset query."""
+        language_code = user_filter.language_code if user_filter else None
+        prefix = user_filter.username_prefix if user_filter else None
+
+        args: list[Any] = [limit]
+        if after:
+            args += [after.created_at, after.user_id.value]
+        if language_code:
+            args.append(language_code)
+        if prefix:
+            args.append(username_prefix_pattern(prefix))
+
+        rows = await self._connection.fetch(
+            _find_page(bool(after), bool(language_code), bool(prefix)),
+            *args,
+        )
+        return [
+            (
+                UserPosition(row["created_at"], UserId.trusted(row["id"])),
+                UserAdapter.from_row(row),
+            )
+            for row in rows
+        ]
+
+    async def save(self, user: User) -> User:
+        """Save a user.
+
+        Runs a single ``INSERT ... ON CONFLICT (id) DO UPDATE`` statement.
+        The update only fires when a profile column actually differs, so
+        unchanged rows are never rewritten and return nothing.
+        """
+        row = await self._connection.fetchrow(
+            _SAVE,
+            user.id.value,
+            user.username.value,
+            user.first_name.value,
+            user.last_name.value,
+            user.language_code.value,
+            user.photo_url.value,
+            datetime.now(),
+        )
+
+        if row is None:
+            logger.debug("User ID=%s is up to date, skipping write", user.id)
+            return user
+
+        logger.debug("User ID=%s created or updated", user.id)
+        return UserAdapter.from_row(row)
+
+    async def save_many(self, users: Sequence[User]) -> None:
+        """Save users with a single upsert of ``unnest``-ed arrays.
+
+        User IDs must be unique within the batch.
+        """
+        if not users:
+            return
+
+        await self._connection.execute(
+            _SAVE_MANY,
+            [user.id.value for user in users],
+            [user.username.value for user in users],
+            [user.first_name.value for user in users],
+            [user.last_name.value for user in users],
+            [user.language_code.value for user in users],
+            [user.photo_url.value for user in users],
+            datetime.now(),
+        )
+        logger.debug("Upserted %s users", len(users))
+
+    async def delete(self, user_id: UserId) -> None:
+        """Delete a user."""
+        # command tag, e.g. "DELETE 1"
+        status = await self._connection.execute(_DELETE, user_id.value)
+
+        if status.rpartition(" ")[2] == "0":
+            raise UserNotFoundError(user_id)
+
+        logger.debug("User ID=%s deleted", user_id)
@@ -2,12 +2,20 @@
 
 import asyncio
 import logging
+import time
 
+from asyncpg import PostgresError
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
 
+from backend.application.dtos.health import (
+    DatabaseHealthStatus,
+    DatabasePoolStatus,
+)
 from backend.application.services.health.db import IDatabaseHealthCheckService
+from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
 
 logger = logging.getLogger(__name__)
 
@@ -15,28 +23,93 @@ logger = logging.getLogger(__name__)
 class DatabaseHealthCheckService(IDatabaseHealthCheckService):
     """Database health check service."""
 
-    def __init__(
-        self,
-        session_factory: async_sessionmaker[AsyncSession],
-    ) -> None:
+    def __init__(self, engine: AsyncEngine, timeout: float = 5.0) -> None:
         """Initialize the database health check service."""
-        self.session_factory = session_factory
+        self.engine = engine
+        self.timeout = timeout
 
-    async def check_connection(self, timeout: float = 5.0) -> bool:
-        """Check database connection."""
+    async def check(self) -> DatabaseHealthStatus:
+        """Check database connection and pool usage."""
         logger.debug("Checking database connection...")
+        connected = False
+        latency_ms = None
         try:
-            async with asyncio.timeout(timeout):
-                async with self.session_factory() as session:
-                    result = await session.execute(text("SELECT 1"))
-                    value = result.scalar()
-                    is_ok = value == 1
-                    logger.debug("Database health check result: %s", is_ok)
-                    return is_ok
+            async with asyncio.timeout(self.timeout):
+                started = time.perf_counter()
+                async with self.engine.connect() as connection:
+                    value = await connection.scalar(text("SELECT 1"))
+                latency_ms = (time.perf_counter() - started) * 1000
+                connected = value == 1
+                logger.debug("Database health check result: %s", connected)
 
         except (SQLAlchemyError, ConnectionError):
             logger.exception("Database health check failed")
-            return False
         except Exception:
             logger.exception("Unexpected error during database health check")
-            return False
+
+        return DatabaseHealthStatus(
+            connected=connected,
+            latency_ms=latency_ms,
+            pool=self.pool_status(),
+        )
+
+    def pool_status(self) -> DatabasePoolStatus | None:
+        """Return the connection pool usage, if the pool reports it."""
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return None
+
+        return DatabasePoolStatus(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(0, pool.overflow()),
+        )
+
+
+class AsyncpgHealthCheckService(IDatabaseHealthCheckService):
+    """Database health check service for the asyncpg backend."""
+
+    def __init__(self, pool: AsyncpgPool, timeout: float = 5.0) -> None:
+        """Initialize the database health check service."""
+        self.pool = pool
+        self.timeout = timeout
+
+    async def check(self) -> DatabaseHealthStatus:
+        """Check database connection and pool usage."""
+        logger.debug("Checking database connection...")
+        connected = False
+        latency_ms = None
+        try:
+            async with asyncio.timeout(self.timeout):
+                started = time.perf_counter()
+                connection = await self.pool.acquire()
+                try:
+                    value = await connection.fetchval("SELECT 1")
+                finally:
+                    await self.pool.release(connection)
+                latency_ms = (time.perf_counter() - started) * 1000
+                connected = value == 1
+                logger.debug("Database health check result: %s", connected)
+
+        except (PostgresError, OSError):
+            logger.exception("Database health check failed")
+        except Exception:
+            logger.exception("Unexpected error during database health check")
+
+        return DatabaseHealthStatus(
+            connected=connected,
+            latency_ms=latency_ms,
+            pool=self.pool_status(),
+        )
+
+    def pool_status(self) -> DatabasePoolStatus:
+        """Return the connection pool usage."""
+        size = self.pool.size
+        idle = self.pool.idle_size
+        return DatabasePoolStatus(
+            size=self.pool.max_size,
+            checked_in=idle,
+            checked_out=size - idle,
+            overflow=0,
+        )
@@ -0,0 +1,97 @@
+"""Background health monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from backend.application.dtos.health import (
+    DatabaseHealthStatus,
+    HealthServiceStatus,
+)
+from backend.application.services.health.monitor import IHealthMonitor
+
+if TYPE_CHECKING:
+    from backend.application.services.health.db import (
+        IDatabaseHealthCheckService,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundHealthMonitor(IHealthMonitor):
+    """Refresh a health snapshot every ``interval`` seconds.
+
+    Probes never run on the request path: readers get the latest
+    snapshot, marked stale once it is older than ``max_age`` seconds
+    (e.g. when the refresh loop is stuck).
+    """
+
+    def __init__(
+        self,
+        database_health_check: IDatabaseHealthCheckService,
+        interval: float,
+        max_age: float,
+    ) -> None:
+        """Initialize the health monitor."""
+        self._database_health_check = database_health_check
+        self._interval = interval
+        self._max_age = max_age
+
+        self._snapshot = HealthServiceStatus(
+            database=DatabaseHealthStatus(connected=False),
+            checked_at=0.0,
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def snapshot(self) -> HealthServiceStatus:
+        """Return the latest health snapshot."""
+        snapshot = self._snapshot
+        if time.time() - snapshot.checked_at > self._max_age:
+            return dataclasses.replace(snapshot, is_stale=True)
+
+        return snapshot
+
+    async def start(self) -> None:
+        """Take the first snapshot and start refreshing it."""
+        if self._task is None:
+            await self.refresh()
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                "Health monitor started (interval=%ss)", self._interval
+            )
+
+    async def stop(self) -> None:
+        """Stop refreshing the snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            logger.info("Health monitor stopped")
+
+    async def refresh(self) -> HealthServiceStatus:
+        """Probe all dependencies and replace the snapshot."""
+        database = await self._database_health_check.check()
+        self._snapshot = HealthServiceStatus(
+            database=database,
+            checked_at=time.time(),
+        )
+
+        if not database.connected:
+            logger.warning("Health probe failed: database is unreachable")
+
+        return self._snapshot
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Health probe crashed")
@@ -0,0 +1,6 @@
+"""Rate limiter backends."""
+
+from .memory import InMemoryRateLimiter
+from .redis import RedisRateLimiter
+
+__all__ = ["InMemoryRateLimiter", "RedisRateLimiter"]
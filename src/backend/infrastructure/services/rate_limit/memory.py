@@ -0,0 +1,57 @@
+"""In-memory rate limiter."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from backend.application.dtos.rate_limit import RateLimitResult
+from backend.application.services.rate_limit import IRateLimiter
+
+if TYPE_CHECKING:
+    from backend.application.dtos.rate_limit import Rate
+
+_ALLOWED = RateLimitResult(allowed=True)
+
+
+class InMemoryRateLimiter(IRateLimiter):
+    """Per-process token bucket rate limiter.
+
+    Each key holds a single ``(tokens, updated_at)`` pair. Keys are kept
+    in least recently used order and the idlest ones are evicted once
+    ``max_keys`` is exceeded; an evicted key simply starts again with a
+    full bucket, which is the state an idle key converges to anyway.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        """Initialize the in-memory rate limiter."""
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        """Take one token from the bucket of a key."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            tokens = rate.limit
+            if len(self._buckets) >= self._max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            tokens, updated_at = bucket
+            tokens = min(
+                rate.limit,
+                tokens + (now - updated_at) * rate.refill_rate,
+            )
+            self._buckets.move_to_end(key)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return RateLimitResult(
+                allowed=False,
+                retry_after=(1 - tokens) / rate.refill_rate,
+            )
+
+        self._buckets[key] = (tokens - 1, now)
+        return _ALLOWED
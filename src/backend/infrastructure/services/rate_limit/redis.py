@@ -0,0 +1,83 @@
+"""Redis rate limiter."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from redis.exceptions import RedisError
+
+from backend.application.dtos.rate_limit import RateLimitResult
+from backend.application.services.rate_limit import IRateLimiter
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from backend.application.dtos.rate_limit import Rate
+
+logger = logging.getLogger(__name__)
+
+_ALLOWED = RateLimitResult(allowed=True)
+
+# KEYS[1] bucket, ARGV[1] capacity, ARGV[2] refill rate (tokens/second)
+# returns 0 when allowed, otherwise milliseconds until the next token
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_per_ms = tonumber(ARGV[2]) / 1000
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(
+        capacity, tokens + (now - tonumber(bucket[2])) * refill_per_ms
+    )
+end
+
+local retry_after = 0
+if tokens < 1 then
+    retry_after = math.ceil((1 - tokens) / refill_per_ms)
+else
+    tokens = tokens - 1
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated_at", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil(capacity / refill_per_ms))
+return retry_after
+"""
+
+
+class RedisRateLimiter(IRateLimiter):
+    """Token bucket rate limiter shared between processes through Redis.
+
+    The whole bucket update runs atomically in a Lua script using the
+    Redis clock, so every worker sees the same counts. Buckets expire once
+    they would be full again. Redis errors fail open.
+    """
+
+    def __init__(self, client: Redis, prefix: str = "rate_limit:") -> None:
+        """Initialize the Redis rate limiter."""
+        self._script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._prefix = prefix
+
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        """Take one token from the bucket of a key."""
+        try:
+            retry_after_ms = await self._script(
+                keys=[f"{self._prefix}{key}"],
+                args=[rate.limit, rate.refill_rate],
+            )
+        except RedisError:
+            logger.exception("Rate limiter unavailable, allowing request")
+            return _ALLOWED
+
+        if not retry_after_ms:
+            return _ALLOWED
+
+        return RateLimitResult(
+            allowed=False,
+            retry_after=int(retry_after_ms) / 1000,
+        )
@@ -4,28 +4,67 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable
 
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from typing_extensions import Self
 
 from backend.application.services.uow import IUnitOfWork
 from backend.infrastructure.repositories.user import UserRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Collection, Hashable
     from types import TracebackType
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from backend.infrastructure.database.replicas import (
+        Replica,
+        ReplicaRouter,
+    )
+
 
 class SqlAlchemyUnitOfWork(IUnitOfWork):
-    """SQLAlchemy implementation of Unit of Work."""
+    """SQLAlchemy implementation of Unit of Work.
+
+    Read-only units of work never open a transaction: their sessions come
+    from ``read_only_session_factory`` (bound to an autocommit engine), so
+    no BEGIN/COMMIT is sent, and are not committed on exit. On the primary
+    the session checks out a connection at its first query; a replica is
+    connected on entry, so an unreachable one can still be swapped.
+
+    Read-only units of work are served by a read replica when ``replicas``
+    is set, falling back to the primary when the chosen replica cannot be
+    reached or a consistency key was written recently.
+    """
 
-    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        replicas: ReplicaRouter | None = None,
+        read_only_session_factory: Callable[[], AsyncSession] | None = None,
+        *,
+        read_only: bool = False,
+        consistency_keys: Collection[Hashable] = (),
+    ) -> None:
         """Initialize the SQLAlchemy unit of work."""
         self._session_factory = session_factory
+        self._read_only_session_factory = (
+            read_only_session_factory or session_factory
+        )
+        self._replicas = replicas
+        self._read_only = read_only
+        self._consistency_keys = consistency_keys
         self._session: AsyncSession | None = None
+        self._replica: Replica | None = None
+        self._on_commit: list[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self) -> Self:
         """Enter async context manager."""
-        self._session = self._session_factory()
+        if not self._read_only:
+            self._session = self._session_factory()
+        elif self._replicas is not None:
+            self._session = await self._replica_session(self._replicas)
+        else:
+            self._session = self._read_only_session_factory()
 
         self.users = UserRepository(self._session)
 
@@ -38,21 +77,79 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit async context manager."""
+        committed = False
         try:
             if exc_type is not None:
                 await self.rollback()
             else:
-                await self.commit()
+                if not self._read_only:
+                    await self._commit()
+                committed = True
         finally:
             if self._session:
                 await self._session.close()
 
+            if self._replica is not None and self._replicas is not None:
+                if (
+                    isinstance(exc_val, DBAPIError)
+                    and exc_val.connection_invalidated
+                ):
+                    self._replicas.mark_unavailable(self._replica)
+                self._replicas.release(self._replica)
+                self._replica = None
+
+        # after the connection is back in the pool
+        if committed:
+            await self._run_on_commit()
+
     async def commit(self) -> None:
         """Commit transaction."""
-        if self._session:
-            await self._session.commit()
+        await self._commit()
+        await self._run_on_commit()
 
     async def rollback(self) -> None:
         """Rollback transaction."""
+        self._on_commit.clear()
         if self._session:
             await self._session.rollback()
+
+    async def _commit(self) -> None:
+        """Commit the session without running the commit callbacks."""
+        if self._session:
+            await self._session.commit()
+
+        if (
+            not self._read_only
+            and self._replicas is not None
+            and self._consistency_keys
+        ):
+            await self._replicas.stick(self._consistency_keys)
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the work done so far is committed."""
+        self._on_commit.append(callback)
+
+    async def _run_on_commit(self) -> None:
+        """Run and forget the registered commit callbacks."""
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            await callback()
+
+    async def _replica_session(self, replicas: ReplicaRouter) -> AsyncSession:
+        """Open a session on a replica, or on the primary as a fallback."""
+        replica = await replicas.acquire(self._consistency_keys)
+        if replica is None:
+            return self._read_only_session_factory()
+
+        session = replica.session_factory()
+        try:
+            # connect now, so an unreachable replica can still be swapped
+            await session.connection()
+        except (OSError, SQLAlchemyError):
+            await session.close()
+            replicas.mark_unavailable(replica)
+            replicas.release(replica)
+            return self._read_only_session_factory()
+
+        self._replica = replica
+        return session
@@ -0,0 +1,121 @@
+"""asyncpg implementation of Unit of Work pattern."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+from backend.application.services.uow import IUnitOfWork
+from backend.infrastructure.repositories.user_asyncpg import (
+    AsyncpgUserRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection, Hashable
+    from types import TracebackType
+
+    from asyncpg.pool import PoolConnectionProxy
+    from asyncpg.transaction import Transaction
+
+    from backend.infrastructure.database.asyncpg_pool import AsyncpgPool
+
+
+class AsyncpgUnitOfWork(IUnitOfWork):
+    """asyncpg implementation of Unit of Work.
+
+    Holds one pooled connection and one transaction. Read-only units of
+    work hold neither: their queries run in autocommit on the pool, which
+    checks out a connection at the first query and returns it right
+    after. Read replicas are not used, ``consistency_keys`` is accepted
+    for interface compatibility.
+    """
+
+    def __init__(
+        self,
+        pool: AsyncpgPool,
+        *,
+        read_only: bool = False,
+        consistency_keys: Collection[Hashable] = (),
+    ) -> None:
+        """Initialize the asyncpg unit of work."""
+        self._pool = pool
+        self._read_only = read_only
+        self._consistency_keys = consistency_keys
+        self._connection: PoolConnectionProxy | None = None
+        self._transaction: Transaction | None = None
+        self._on_commit: list[Callable[[], Awaitable[None]]] = []
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        if self._read_only:
+            self.users = AsyncpgUserRepository(self._pool)
+            return self
+
+        self._connection = await self._pool.acquire()
+        try:
+            await self._begin()
+        except BaseException:
+            await self._pool.release(self._connection)
+            self._connection = None
+            raise
+
+        self.users = AsyncpgUserRepository(self._connection)
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager."""
+        transaction, self._transaction = self._transaction, None
+        try:
+            if exc_type is not None:
+                self._on_commit.clear()
+                if transaction is not None:
+                    await transaction.rollback()
+            elif transaction is not None:
+                await transaction.commit()
+        finally:
+            if self._connection is not None:
+                await self._pool.release(self._connection)
+                self._connection = None
+
+        # after the connection is back in the pool
+        if exc_type is None:
+            await self._run_on_commit()
+
+    async def commit(self) -> None:
+        """Commit transaction, later statements run in a new one."""
+        if self._transaction is not None:
+            await self._transaction.commit()
+            await self._begin()
+        await self._run_on_commit()
+
+    async def rollback(self) -> None:
+        """Rollback transaction, later statements run in a new one."""
+        self._on_commit.clear()
+        if self._transaction is not None:
+            await self._transaction.rollback()
+            await self._begin()
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the work done so far is committed."""
+        self._on_commit.append(callback)
+
+    async def _run_on_commit(self) -> None:
+        """Run and forget the registered commit callbacks."""
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            await callback()
+
+    async def _begin(self) -> None:
+        """Start a transaction on the held connection."""
+        self._transaction = None
+        if self._connection is not None:
+            transaction = self._connection.transaction()
+            await transaction.start()
+            self._transaction = transaction
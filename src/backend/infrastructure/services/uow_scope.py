@@ -0,0 +1,230 @@
+"""Request-scoped Unit of Work."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+from backend.application.services.uow import IUnitOfWork
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Collection,
+        Hashable,
+    )
+    from types import TracebackType
+
+    from backend.application.services.uow import UnitOfWorkFactory
+
+
+class _RequestScope:
+    """Units of work shared by everything running in one request.
+
+    A session serves one task at a time: handles opened by concurrent
+    tasks of the request (e.g. use cases run with ``asyncio.gather``)
+    wait for each other. The lock is reentrant per task, so a handle may
+    be opened inside another in the same task, but not by a task that
+    the holder is waiting for.
+    """
+
+    def __init__(self, uow_factory: UnitOfWorkFactory) -> None:
+        self._uow_factory = uow_factory
+        # shared with the units of work, so every key is stuck on commit
+        self._consistency_keys: set[Hashable] = set()
+        self._reader: IUnitOfWork | None = None
+        self._writer: IUnitOfWork | None = None
+        self._error: BaseException | None = None
+        self._lock = asyncio.Lock()
+        self._owner: asyncio.Task[object] | None = None
+        self._depth = 0
+        self.closed = False
+
+    async def acquire(self) -> None:
+        """Wait until no other task of the request uses the session."""
+        task = asyncio.current_task()
+        if self._owner is not task or task is None:
+            await self._lock.acquire()
+            self._owner = task
+        self._depth += 1
+
+    def release(self) -> None:
+        """Let the next task of the request use the session."""
+        self._depth -= 1
+        if not self._depth:
+            self._owner = None
+            self._lock.release()
+
+    async def get(
+        self,
+        read_only: bool,
+        consistency_keys: Collection[Hashable],
+    ) -> IUnitOfWork:
+        """Enter the shared unit of work on first use and return it.
+
+        Must be called between ``acquire`` and ``release``. Reads go to
+        the writer once there is one, so they see the request's own
+        uncommitted writes.
+        """
+        if self.closed:
+            msg = "The request unit of work is already closed"
+            raise RuntimeError(msg)
+
+        self._consistency_keys.update(consistency_keys)
+        if self._writer is not None:
+            return self._writer
+
+        if read_only:
+            if self._reader is None:
+                self._reader = await self._uow_factory(
+                    read_only=True,
+                    consistency_keys=self._consistency_keys,
+                ).__aenter__()
+            return self._reader
+
+        self._writer = await self._uow_factory(
+            consistency_keys=self._consistency_keys,
+        ).__aenter__()
+        return self._writer
+
+    def fail(self, error: BaseException) -> None:
+        """Roll the request back when it ends."""
+        if self._error is None:
+            self._error = error
+
+    async def close(self, error: BaseException | None) -> None:
+        """Commit, or roll back on error, and release the connections."""
+        self.closed = True
+        error = error or self._error
+        exc_type = type(error) if error is not None else None
+        tb = error.__traceback__ if error is not None else None
+
+        reader, writer = self._reader, self._writer
+        self._reader = self._writer = None
+        try:
+            if writer is not None:
+                await writer.__aexit__(exc_type, error, tb)
+        finally:
+            if reader is not None:
+                await reader.__aexit__(exc_type, error, tb)
+
+
+class _ScopedUnitOfWork(IUnitOfWork):
+    """Handle on the unit of work shared by a request."""
+
+    def __init__(
+        self,
+        scope: _RequestScope,
+        read_only: bool,
+        consistency_keys: Collection[Hashable],
+    ) -> None:
+        self._scope = scope
+        self._read_only = read_only
+        self._consistency_keys = consistency_keys
+        self._uow: IUnitOfWork | None = None
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager, waiting for other tasks."""
+        await self._scope.acquire()
+        try:
+            self._uow = await self._scope.get(
+                self._read_only,
+                self._consistency_keys,
+            )
+        except BaseException:
+            self._scope.release()
+            raise
+        self.users = self._uow.users
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager, the request commits later."""
+        self._scope.release()
+        if exc_val is not None:
+            self._scope.fail(exc_val)
+
+    async def commit(self) -> None:
+        """Commit the request's transaction now."""
+        if self._uow is not None:
+            await self._uow.commit()
+
+    async def rollback(self) -> None:
+        """Rollback the request's transaction now."""
+        if self._uow is not None:
+            await self._uow.rollback()
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the request is committed."""
+        if self._uow is not None:
+            self._uow.on_commit(callback)
+
+
+class RequestScopedUnitOfWorkFactory:
+    """Share one unit of work between the use cases of a request.
+
+    Inside ``scope()`` every unit of work created by this factory is a
+    handle on the same session (one for reads and, once something is
+    written, one for writes), entered at its first use and committed
+    once when the scope ends. An error escaping any of them rolls the
+    whole request back. Handles of concurrent tasks take turns on the
+    session, since a session must not be used by two tasks at once.
+    Outside a scope each call creates an independent unit of work
+    through ``uow_factory``.
+    """
+
+    def __init__(self, uow_factory: UnitOfWorkFactory) -> None:
+        """Initialize the factory.
+
+        Args:
+            uow_factory: Creates the units of work that are shared
+
+        """
+        self._uow_factory = uow_factory
+        self._scope: ContextVar[_RequestScope | None] = ContextVar(
+            "request_unit_of_work",
+            default=None,
+        )
+
+    def __call__(
+        self,
+        *,
+        read_only: bool = False,
+        consistency_keys: Collection[Hashable] = (),
+    ) -> IUnitOfWork:
+        """Create a unit of work, shared when a scope is active."""
+        scope = self._scope.get()
+        # e.g. a streamed response body still reading after the request
+        if scope is None or scope.closed:
+            return self._uow_factory(
+                read_only=read_only,
+                consistency_keys=consistency_keys,
+            )
+
+        return _ScopedUnitOfWork(scope, read_only, consistency_keys)
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncIterator[None]:
+        """Share units of work until the block exits, then commit."""
+        scope = _RequestScope(self._uow_factory)
+        token = self._scope.set(scope)
+        try:
+            yield
+        except BaseException as e:
+            await scope.close(e)
+            raise
+        else:
+            await scope.close(None)
+        finally:
+            self._scope.reset(token)
@@ -0,0 +1,6 @@
+"""User cache backends."""
+
+from .memory import InMemoryUserCache
+from .redis import RedisUserCache
+
+__all__ = ["InMemoryUserCache", "RedisUserCache"]
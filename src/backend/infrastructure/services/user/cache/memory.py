@@ -0,0 +1,44 @@
+"""In-memory user cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from backend.application.services.user.cache import IUserCache
+from backend.shared.cache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from backend.domain.entities.user import User
+    from backend.domain.value_objects.user import UserId
+
+
+class InMemoryUserCache(IUserCache):
+    """Per-process LRU + TTL user cache."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the in-memory user cache."""
+        self._users: LRUCache[int, User] = LRUCache(maxsize, ttl)
+
+    async def get(self, user_id: UserId) -> User | None:
+        """Get a cached user."""
+        return self._users.get(user_id.value)
+
+    async def set(self, user: User) -> None:
+        """Cache a user."""
+        self._users.set(user.id.value, user)
+
+    async def get_many(self, user_ids: Collection[UserId]) -> list[User]:
+        """Get the cached users among ``user_ids``."""
+        users = (self._users.get(user_id.value) for user_id in user_ids)
+        return [user for user in users if user is not None]
+
+    async def set_many(self, users: Collection[User]) -> None:
+        """Cache several users."""
+        for user in users:
+            self._users.set(user.id.value, user)
+
+    async def invalidate(self, user_id: UserId) -> None:
+        """Drop a cached user."""
+        self._users.pop(user_id.value)
@@ -0,0 +1,114 @@
+"""Redis user cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from redis.exceptions import RedisError
+
+from backend.application.services.user.cache import IUserCache
+from backend.infrastructure.database.adapters.user import UserAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from redis.asyncio import Redis
+
+    from backend.domain.entities.user import User
+    from backend.domain.value_objects.user import UserId
+
+logger = logging.getLogger(__name__)
+
+
+class RedisUserCache(IUserCache):
+    """User cache shared between processes through Redis.
+
+    The client is injected, so any ``redis.asyncio.Redis`` compatible
+    client (e.g. a ``fakeredis`` instance) can be used. Redis errors are
+    logged and treated as cache misses, the database stays the source of
+    truth.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        ttl: int,
+        prefix: str = "user:",
+    ) -> None:
+        """Initialize the Redis user cache."""
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    async def get(self, user_id: UserId) -> User | None:
+        """Get a cached user."""
+        try:
+            payload = await self._client.get(self._key(user_id.value))
+        except RedisError:
+            logger.exception("Failed to read user %s from cache", user_id)
+            return None
+
+        return UserAdapter.from_row(json.loads(payload)) if payload else None
+
+    async def set(self, user: User) -> None:
+        """Cache a user."""
+        payload = json.dumps(UserAdapter.to_values(user))
+        try:
+            await self._client.set(
+                self._key(user.id.value),
+                payload,
+                ex=self._ttl,
+            )
+        except RedisError:
+            logger.exception("Failed to write user %s to cache", user.id)
+
+    async def get_many(self, user_ids: Collection[UserId]) -> list[User]:
+        """Get the cached users among ``user_ids`` with a single ``MGET``."""
+        if not user_ids:
+            return []
+
+        try:
+            payloads = await self._client.mget(
+                [self._key(user_id.value) for user_id in user_ids],
+            )
+        except RedisError:
+            logger.exception(
+                "Failed to read %s users from cache", len(user_ids)
+            )
+            return []
+
+        return [
+            UserAdapter.from_row(json.loads(payload))
+            for payload in payloads
+            if payload
+        ]
+
+    async def set_many(self, users: Collection[User]) -> None:
+        """Cache several users in a single pipelined round trip."""
+        if not users:
+            return
+
+        pipeline = self._client.pipeline(transaction=False)
+        for user in users:
+            pipeline.set(
+                self._key(user.id.value),
+                json.dumps(UserAdapter.to_values(user)),
+                ex=self._ttl,
+            )
+        try:
+            await pipeline.execute()
+        except RedisError:
+            logger.exception("Failed to write %s users to cache", len(users))
+
+    async def invalidate(self, user_id: UserId) -> None:
+        """Drop a cached user."""
+        try:
+            await self._client.delete(self._key(user_id.value))
+        except RedisError:
+            logger.exception("Failed to invalidate cached user %s", user_id)
+
+    def _key(self, user_id: int) -> str:
+        """Return the cache key of a user."""
+        return f"{self._prefix}{user_id}"
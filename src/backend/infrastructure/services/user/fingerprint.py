@@ -0,0 +1,39 @@
+"""In-memory user profile fingerprint store."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from backend.application.services.user.fingerprint import (
+    IUserFingerprintStore,
+)
+from backend.shared.cache import LRUCache
+
+if TYPE_CHECKING:
+    from backend.domain.entities.user import User
+    from backend.domain.value_objects.user import UserId
+
+
+class InMemoryUserFingerprintStore(IUserFingerprintStore):
+    """Bounded in-process fingerprint store.
+
+    Entries expire after ``ttl`` seconds so that rows changed or deleted
+    outside of this process are eventually written again.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the fingerprint store."""
+        self._fingerprints: LRUCache[int, int] = LRUCache(maxsize, ttl)
+
+    def is_unchanged(self, user: User) -> bool:
+        """Check if the user profile matches the last persisted one."""
+        fingerprint = self._fingerprints.get(user.id.value)
+        return fingerprint == user.profile_fingerprint
+
+    def remember(self, user: User) -> None:
+        """Remember the user profile as persisted."""
+        self._fingerprints.set(user.id.value, user.profile_fingerprint)
+
+    def forget(self, user_id: UserId) -> None:
+        """Forget the persisted profile of a user."""
+        self._fingerprints.pop(user_id.value)
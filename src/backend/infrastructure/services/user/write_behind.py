@@ -0,0 +1,158 @@
+"""Write-behind batching of user upserts."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+from backend.application.services.user.write_queue import IUserWriteQueue
+
+if TYPE_CHECKING:
+    from backend.application.services.uow import UnitOfWorkFactory
+    from backend.application.services.user.cache import IUserCache
+    from backend.application.services.user.fingerprint import (
+        IUserFingerprintStore,
+    )
+    from backend.domain.entities.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindUserQueue(IUserWriteQueue):
+    """Coalesce user upserts and flush them as one multi-row upsert.
+
+    A batch is flushed every ``flush_interval`` seconds or as soon as
+    ``max_batch_size`` distinct users are pending, in a single unit of
+    work. Repeated submissions of the same user within a batch collapse
+    into one row (the latest wins).
+
+    With ``wait_for_flush`` set, ``submit`` only returns once the upsert
+    is committed and raises if the flush failed. When ``max_pending``
+    users are already queued, ``submit`` waits for the next flush
+    (backpressure). After a batch is committed its users are invalidated
+    in the user cache; when a batch fails, their fingerprints are
+    forgotten so the next login writes them again.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        user_cache: IUserCache,
+        fingerprints: IUserFingerprintStore | None,
+        flush_interval: float,
+        max_batch_size: int,
+        max_pending: int,
+        wait_for_flush: bool,
+    ) -> None:
+        """Initialize the write-behind queue."""
+        self._uow_factory = uow_factory
+        self._user_cache = user_cache
+        self._fingerprints = fingerprints
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._max_pending = max(max_pending, max_batch_size)
+        self._wait_for_flush = wait_for_flush
+
+        self._pending: dict[int, User] = {}
+        self._waiters: dict[int, list[asyncio.Future[None]]] = {}
+        self._batch_ready = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Start flushing in the background."""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                "User write-behind started (interval=%ss, batch=%s)",
+                self._flush_interval,
+                self._max_batch_size,
+            )
+
+    async def stop(self) -> None:
+        """Flush everything pending and stop."""
+        if self._task is not None:
+            # let an in-flight flush complete instead of cancelling it
+            self._stopping = True
+            self._batch_ready.set()
+            await self._task
+            self._task = None
+
+        while self._pending:
+            await self._flush()
+
+        logger.info("User write-behind stopped")
+
+    async def submit(self, user: User, *, wait: bool | None = None) -> None:
+        """Queue a user upsert."""
+        while len(self._pending) >= self._max_pending:
+            logger.debug("User write-behind queue is full, waiting")
+            self._batch_ready.set()
+            self._drained.clear()
+            await self._drained.wait()
+
+        self._pending[user.id.value] = user
+        if len(self._pending) >= self._max_batch_size:
+            self._batch_ready.set()
+
+        if wait is None:
+            wait = self._wait_for_flush
+
+        if wait:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(user.id.value, []).append(waiter)
+            await waiter
+
+    async def _run(self) -> None:
+        """Flush batches until stopped."""
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self._flush_interval):
+                    await self._batch_ready.wait()
+
+            self._batch_ready.clear()
+            if self._pending:
+                await self._flush()
+
+    async def _flush(self) -> None:
+        """Flush one batch of pending users."""
+        async with self._flush_lock:
+            users = list(self._pending.values())[: self._max_batch_size]
+            waiters: list[asyncio.Future[None]] = []
+            for user in users:
+                del self._pending[user.id.value]
+                waiters.extend(self._waiters.pop(user.id.value, ()))
+
+            if len(self._pending) >= self._max_batch_size:
+                self._batch_ready.set()
+
+            try:
+                async with self._uow_factory(
+                    consistency_keys=[user.id.value for user in users],
+                ) as uow:
+                    await uow.users.save_many(users)
+
+            except Exception as e:
+                logger.exception("Failed to flush %s users", len(users))
+                if self._fingerprints:
+                    for user in users:
+                        self._fingerprints.forget(user.id)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+
+            else:
+                logger.debug("Flushed %s users", len(users))
+                for user in users:
+                    await self._user_cache.invalidate(user.id)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+            finally:
+                self._drained.set()
@@ -0,0 +1,39 @@
+"""Administrator access."""
+
+from __future__ import annotations
+
+import logging
+
+# resolved at runtime by FastAPI to inject the request
+from fastapi import HTTPException, Request, status
+
+from backend.shared import config
+from backend.shared.validators.fastapi import (
+    UserIdNotFoundInStateError,
+    get_user_id_from_state,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def require_admin(request: Request) -> None:
+    """Reject users missing from ``ADMIN_USER_IDS``.
+
+    Raises:
+        HTTPException: 401 without a user, 403 for other users
+
+    """
+    try:
+        user_id = get_user_id_from_state(request)
+    except UserIdNotFoundInStateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unauthorized",
+        ) from e
+
+    if user_id not in config.app.admin_user_ids:
+        logger.warning("User ID=%s denied admin access", user_id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Forbidden",
+        )
@@ -4,6 +4,8 @@ from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from scalar_fastapi import get_scalar_api_reference
 
+from backend.presentation.api.middlewares import public
+
 
 def setup_scalar(app: FastAPI) -> None:
     """Set up documentation for the app.
@@ -17,6 +19,7 @@ def setup_scalar(app: FastAPI) -> None:
     """
 
     @app.get("/docs", include_in_schema=False)
+    @public
     async def api_documentation() -> HTMLResponse:
         """Scalar API reference.
 
@@ -1,54 +1,115 @@
-"""Health check endpoint."""
+"""Health check endpoints."""
 
 from datetime import datetime
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic_core import to_json
 
 from backend.application.use_cases.health import IHealthCheckUseCase
-from backend.containers.services import ServiceContainer
 from backend.containers.use_cases import ServiceUseCaseContainer
-from backend.presentation.api.models.health import HealthCheckResponse
+from backend.presentation.api.middlewares import public
+from backend.presentation.api.models.health import (
+    HealthCheckResponse,
+    ReadinessResponse,
+)
+from backend.presentation.api.responses import (
+    PreEncodedJSONResponse,
+    PydanticJSONResponse,
+)
 
 router = APIRouter(tags=["Health"])
-limiter = ServiceContainer.limiter()
+
+_LIVE_BODY = to_json({"status": "ok"})
 
 
 @router.get(
     "/health",
+    response_model=HealthCheckResponse,
     status_code=status.HTTP_200_OK,
     summary="Health check endpoint",
-    description="Check the health of the service",
+    description="Check the health of the service from the cached snapshot",
     response_description="Health check response",
     responses={
         200: {
             "description": "Service is healthy",
             "model": HealthCheckResponse,
         },
-        429: {"description": "Rate limit exceeded"},
         503: {"description": "Service unavailable"},
     },
 )
-@limiter.limit("1/second")
+@public
 @inject
 async def health_check(
-    request: Request,  # noqa: ARG001
     use_case: Annotated[
         IHealthCheckUseCase,
         Depends(Provide[ServiceUseCaseContainer.health_check]),
     ],
-) -> HealthCheckResponse:
+) -> PydanticJSONResponse:
     """Health check endpoint."""
     health_status = await use_case.execute()
 
-    if not health_status.db_connection:
+    if not health_status.is_healthy:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database connection is not healthy",
         )
 
-    return HealthCheckResponse(
-        status="ok",
-        timestamp=int(datetime.now().astimezone().timestamp()),
+    return PydanticJSONResponse(
+        HealthCheckResponse(
+            status="ok",
+            timestamp=int(datetime.now().astimezone().timestamp()),
+        ),
+    )
+
+
+@router.get(
+    "/health/live",
+    status_code=status.HTTP_200_OK,
+    summary="Liveness probe",
+    description="Report that the process is up, without doing any I/O",
+    responses={200: {"description": "Process is alive"}},
+)
+@public
+async def health_live() -> PreEncodedJSONResponse:
+    """Liveness probe."""
+    return PreEncodedJSONResponse(_LIVE_BODY)
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Readiness probe",
+    description=(
+        "Report the cached health snapshot refreshed by the background "
+        "prober, including database latency and pool usage"
+    ),
+    responses={
+        200: {"description": "Service is ready", "model": ReadinessResponse},
+        503: {
+            "description": "Service is not ready",
+            "model": ReadinessResponse,
+        },
+    },
+)
+@public
+@inject
+async def health_ready(
+    use_case: Annotated[
+        IHealthCheckUseCase,
+        Depends(Provide[ServiceUseCaseContainer.health_check]),
+    ],
+) -> PydanticJSONResponse:
+    """Readiness probe."""
+    health_status = await use_case.execute()
+
+    return PydanticJSONResponse(
+        ReadinessResponse.from_status(health_status),
+        status_code=(
+            status.HTTP_200_OK
+            if health_status.is_healthy
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
     )
@@ -0,0 +1,73 @@
+"""Application lifespan."""
+
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from backend.containers.database import warmup_connections
+from backend.infrastructure.database.engine import warm_up
+from backend.shared import config
+from backend.shared._config import DatabaseBackend
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from contextlib import AbstractAsyncContextManager
+
+    from fastapi import FastAPI
+
+    from backend.containers import Container
+
+logger = logging.getLogger(__name__)
+
+
+def create_lifespan(
+    container: Container,
+) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    """Create the app lifespan starting and stopping background services.
+
+    Args:
+        container: Wired DI container
+
+    Returns:
+        Lifespan context manager factory
+
+    """
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        services = container.service()
+        uses_asyncpg = config.db.backend == DatabaseBackend.ASYNCPG
+
+        try:
+            if uses_asyncpg:
+                # opens ``warmup_connections`` connections
+                await services.db().pool().open()
+            else:
+                await warm_up(services.db().engine(), warmup_connections)
+        except Exception:
+            logger.exception("Database warm-up failed")
+
+        health_monitor = services.health_monitor()
+        await health_monitor.start()
+
+        write_queue = services.user_write_queue()
+        if write_queue:
+            await write_queue.start()
+
+        logger.info("Application started")
+        try:
+            yield
+        finally:
+            if write_queue:
+                await write_queue.stop()
+
+            await health_monitor.stop()
+
+            if uses_asyncpg:
+                await services.db().pool().close()
+
+            logger.info("Application stopped")
+
+    return lifespan
@@ -0,0 +1,34 @@
+"""Prometheus metrics endpoint."""
+
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from backend.presentation.api.middlewares import public
+from backend.shared import config, metrics
+
+router = APIRouter()
+
+
+@router.get(config.metrics.path, include_in_schema=False)
+@public
+async def get_metrics(
+    authorization: Annotated[str, Header()] = "",
+) -> Response:
+    """Expose metrics in the Prometheus text format.
+
+    Scrapers cannot log in, so the route bypasses user authentication
+    and is protected by ``METRICS_TOKEN`` instead when it is set.
+    """
+    if config.metrics.token and not hmac.compare_digest(
+        authorization.encode(),
+        f"Bearer {config.metrics.token}".encode(),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unauthorized",
+        )
+
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
@@ -1,5 +1,14 @@
 """Middlewares for the API."""
 
 from .authentication import AuthenticationMiddleware
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .public import collect_public_paths, public
 
-__all__ = ["AuthenticationMiddleware"]
+__all__ = [
+    "AuthenticationMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "collect_public_paths",
+    "public",
+]
@@ -1,86 +1,138 @@
 """Authentication middleware."""
 
+from __future__ import annotations
+
 import logging
-from collections.abc import Awaitable
-from typing import Callable, ClassVar
+from typing import TYPE_CHECKING
+
+from starlette.requests import cookie_parser
+
+from backend.presentation.api.middlewares.public import PublicPathMatcher
+from backend.presentation.api.responses import (
+    UNAUTHORIZED_BODY,
+    PreEncodedJSONResponse,
+)
+from backend.shared import jwt, metrics
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-from backend.shared import jwt
+    from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+TOKEN_COOKIE = "token"
+
+_JWT_VALID = metrics.JWT_VERIFICATIONS.labels("valid")
+_JWT_MISSING = metrics.JWT_VERIFICATIONS.labels("missing")
+_JWT_EXPIRED = metrics.JWT_VERIFICATIONS.labels("expired")
+_JWT_INVALID = metrics.JWT_VERIFICATIONS.labels("invalid")
+_JWT_ERROR = metrics.JWT_VERIFICATIONS.labels("error")
+
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    """Authentication middleware."""
+class AuthenticationMiddleware:
+    """Authentication middleware.
+
+    Pure ASGI middleware: public paths are passed through untouched, every
+    other request must carry a valid JWT in the ``token`` cookie. The
+    authenticated user id is stored in ``scope["state"]`` and is available
+    as ``request.state.user_id``.
+    """
+
+    _unauthorized = PreEncodedJSONResponse(
+        UNAUTHORIZED_BODY,
+        status_code=401,
+    )
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        public_paths: Iterable[str] = (),
+    ) -> None:
+        """Initialize authentication middleware.
 
-    # public paths (no authentication)
-    AUTH_EXCLUDE_PATHS: ClassVar[set[str]] = {
-        "/api/v1/auth/telegram",
-        "/health",
-        "/docs",
-        "/openapi.json",
-    }
+        Args:
+            app: Next ASGI app
+            public_paths: Path templates that bypass authentication,
+                including all of their subpaths
 
-    def __init__(self, app: ASGIApp) -> None:
-        """Initialize authentication middleware."""
-        super().__init__(app)
+        """
+        self.app = app
+        self.is_public = PublicPathMatcher(public_paths)
 
-    async def dispatch(
+    async def __call__(
         self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Dispatch request."""
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Authenticate the request."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or self.is_public(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        user_id = self._authenticate(scope)
+        if user_id is None:
+            await self._unauthorized(scope, receive, send)
+            return
 
-        path = request.url.path
+        scope.setdefault("state", {})["user_id"] = user_id
+        await self.app(scope, receive, send)
 
-        if any(path.startswith(p) for p in self.AUTH_EXCLUDE_PATHS):
-            return await call_next(request)
+    @staticmethod
+    def _authenticate(scope: Scope) -> int | None:
+        """Return the authenticated user id or None."""
+        path = scope["path"]
 
-        token = request.cookies.get("token")
+        token = _get_cookie(scope, TOKEN_COOKIE)
         if not token:
+            _JWT_MISSING.inc()
             logger.warning("Missing token cookie for path: %s", path)
-            return self._unauthorized()
+            return None
 
         try:
             data = jwt.verify_auth_token(token)
 
             user_id = data.get("sub")
             if not user_id or not isinstance(user_id, str):
+                _JWT_INVALID.inc()
                 logger.warning(
                     "Invalid or missing user_id in token for path: %s",
                     path,
                 )
-                return self._unauthorized()
-
-            request.state.user_id = int(user_id)
+                return None
 
+            _JWT_VALID.inc()
             logger.debug("User authenticated for path: %s", path)
+            return int(user_id)
 
-        except (
-            jwt.ExpiredSignatureError,
-            jwt.DecodeError,
-            jwt.InvalidTokenError,
-            Exception,
-        ):
+        except jwt.ExpiredSignatureError:
+            _JWT_EXPIRED.inc()
+            logger.exception("Expired token for path %s", path)
+            return None
+
+        except (jwt.DecodeError, jwt.InvalidTokenError):
+            _JWT_INVALID.inc()
+            logger.exception("Invalid token for path %s", path)
+            return None
+
+        except Exception:
+            _JWT_ERROR.inc()
             logger.exception(
                 "Unexpected error verifying token for path %s",
                 path,
             )
-            return self._unauthorized()
+            return None
 
-        return await call_next(request)
 
-    @staticmethod
-    def _unauthorized() -> Response:
-        """Return unauthorized response."""
-        return Response(
-            content='{"detail": "Unauthorized"}',
-            status_code=401,
-            media_type="application/json",
-        )
+def _get_cookie(scope: Scope, name: str) -> str | None:
+    """Get a cookie value from the raw ASGI headers."""
+    for key, value in scope["headers"]:
+        if key == b"cookie":
+            return cookie_parser(value.decode("latin-1")).get(name)
+
+    return None
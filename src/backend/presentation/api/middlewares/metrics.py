@@ -0,0 +1,91 @@
+"""Metrics middleware."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from starlette.routing import Match
+
+from backend.shared import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from starlette.routing import BaseRoute
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Record request latency per route template and in-flight requests.
+
+    Requests are labelled with the route template (``/users/{id}``), never
+    the raw path, so label cardinality stays bounded. Requests rejected
+    before routing (e.g. by authentication) are matched against ``routes``.
+    Label children are bound once per (method, route, status).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Sequence[BaseRoute] = (),
+    ) -> None:
+        """Initialize metrics middleware.
+
+        Args:
+            app: Next ASGI app
+            routes: Application routes used to label requests that never
+                reached the router
+
+        """
+        self.app = app
+        self.routes = routes
+        self._observers: dict[tuple[str, str, int], Any] = {}
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Measure the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+
+            key = (scope["method"], self._route(scope), status)
+            observer = self._observers.get(key)
+            if observer is None:
+                observer = metrics.HTTP_REQUEST_DURATION.labels(*key)
+                self._observers[key] = observer
+            observer.observe(elapsed)
+
+    def _route(self, scope: Scope) -> str:
+        """Return the route template of the request."""
+        route = scope.get("route")
+        if route is None:
+            for candidate in self.routes:
+                match, _ = candidate.matches(scope)
+                if match is Match.FULL:
+                    route = candidate
+                    break
+
+        return getattr(route, "path", None) or UNMATCHED_ROUTE
@@ -0,0 +1,179 @@
+"""Profiling middleware."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import re
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from pyinstrument.session import Session
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+REPORT_HEADER = b"x-profile-report"
+
+
+class ProfilingMiddleware:
+    """Sample request profiles with pyinstrument.
+
+    Two modes, both writing speedscope reports (https://speedscope.app)
+    to ``output_dir``:
+
+    * on demand: a request carrying ``header`` is profiled on its own and
+      the report path is returned in the ``X-Profile-Report`` header, the
+      report is written there once the response has been sent;
+    * sampling: a ``sample_rate`` fraction of requests is profiled and
+      aggregated per route template, a report is written for every
+      ``flush_every`` samples of a route.
+
+    Profilers run in async mode, so samples are attributed to the
+    profiled request's task only. Only add the middleware when profiling
+    is enabled; it is not free even when no request is sampled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        output_dir: str,
+        interval: float = 0.001,
+        header: str | None = None,
+        sample_rate: float = 0.0,
+        flush_every: int = 20,
+    ) -> None:
+        """Initialize profiling middleware.
+
+        Args:
+            app: Next ASGI app
+            output_dir: Directory the reports are written to
+            interval: Sampling interval in seconds
+            header: Header requesting a profile of a single request,
+                None to disable on-demand profiling
+            sample_rate: Fraction of requests profiled in sampling mode
+            flush_every: Samples aggregated into one report per route
+
+        """
+        self.app = app
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.header = header.lower().encode("latin-1") if header else None
+        self.sample_rate = sample_rate
+        self.flush_every = flush_every
+
+        self._sessions: dict[str, tuple[Session, int]] = {}
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Profile the request when requested or sampled."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.header and any(
+            key == self.header for key, _ in scope["headers"]
+        ):
+            await self._profile_request(scope, receive, send)
+        elif self.sample_rate and random.random() < self.sample_rate:  # noqa: S311
+            await self._sample_request(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def _profile_request(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Profile one request and point to its report in a header.
+
+        Messages are forwarded as they come, a streamed body is not
+        buffered, so the report path is chosen when the response starts.
+        """
+        path: Path | None = None
+
+        async def send_with_report(message: Message) -> None:
+            nonlocal path
+            if message["type"] == "http.response.start":
+                # the route is resolved by now
+                path = self._path(f"{_slug(_route(scope))}.{time.time_ns()}")
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REPORT_HEADER, str(path).encode("latin-1")),
+                ]
+            await send(message)
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_report)
+        finally:
+            session = profiler.stop()
+
+        if path is None:
+            path = self._path(f"{_slug(_route(scope))}.{time.time_ns()}")
+        await asyncio.to_thread(self._write, path, session)
+        logger.info("Profiled %s %s: %s", scope["method"], scope["path"], path)
+
+    async def _sample_request(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Profile a sampled request into its route's aggregate."""
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session = profiler.stop()
+
+        route = _route(scope)
+        aggregate, samples = self._sessions.get(route, (None, 0))
+        if aggregate is not None:
+            session = Session.combine(aggregate, session)
+
+        samples += 1
+        if samples < self.flush_every:
+            self._sessions[route] = (session, samples)
+            return
+
+        self._sessions.pop(route, None)
+        path = self._path(f"{_slug(route)}.{os.getpid()}.{time.time_ns()}")
+        await asyncio.to_thread(self._write, path, session)
+        logger.info(
+            "Wrote %s sampled profiles of %s: %s", samples, route, path
+        )
+
+    def _path(self, name: str) -> Path:
+        """Return the path of a speedscope report."""
+        return self.output_dir / f"{name}.speedscope.json"
+
+    def _write(self, path: Path, session: Session) -> None:
+        """Write a speedscope report."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(SpeedscopeRenderer().render(session))
+
+
+def _route(scope: Scope) -> str:
+    """Return the route template of a handled request."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def _slug(route: str) -> str:
+    """Turn a route template into a file name."""
+    return re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
@@ -0,0 +1,87 @@
+"""Public (unauthenticated) routes."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from starlette.routing import BaseRoute
+
+CallableT = TypeVar("CallableT", bound="Callable")
+
+PUBLIC_ATTRIBUTE = "__public__"
+
+_PARAM_PATTERN = re.compile(r"{([^}:]+)(?::([^}]+))?}")
+
+
+def public(endpoint: CallableT) -> CallableT:
+    """Mark an endpoint as public (no authentication).
+
+    Must be applied below the route decorator, e.g.::
+
+        @router.get("/ping")
+        @public
+        async def ping() -> dict: ...
+
+    """
+    setattr(endpoint, PUBLIC_ATTRIBUTE, True)
+    return endpoint
+
+
+def is_public(endpoint: object) -> bool:
+    """Check if an endpoint is marked as public."""
+    return getattr(endpoint, PUBLIC_ATTRIBUTE, False) is True
+
+
+def collect_public_paths(routes: Iterable[BaseRoute]) -> list[str]:
+    """Collect path templates of routes whose endpoint is public."""
+    return [
+        route.path  # type: ignore[attr-defined]
+        for route in routes
+        if is_public(getattr(route, "endpoint", None))
+    ]
+
+
+class PublicPathMatcher:
+    """Match request paths against public path templates.
+
+    All templates are compiled into a single anchored regex once. A path
+    matches when it equals a template or is one of its subpaths, so
+    ``/health`` matches ``/health`` and ``/health/live`` but not
+    ``/healthz``. Path parameters (``{user_id}``) match one segment,
+    ``{name:path}`` parameters match the rest of the path.
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        """Initialize the matcher."""
+        alternatives = sorted(
+            {self._compile(path) for path in paths if path},
+        )
+        self._pattern = (
+            re.compile(rf"(?:{'|'.join(alternatives)})(?:/|$)")
+            if alternatives
+            else None
+        )
+
+    def __call__(self, path: str) -> bool:
+        """Check if the path is public."""
+        return self._pattern is not None and (
+            self._pattern.match(path) is not None
+        )
+
+    @staticmethod
+    def _compile(path: str) -> str:
+        """Convert a path template to a regex fragment."""
+        fragments: list[str] = []
+        position = 0
+
+        for param in _PARAM_PATTERN.finditer(path):
+            fragments.append(re.escape(path[position : param.start()]))
+            fragments.append(".+" if param.group(2) == "path" else "[^/]+")
+            position = param.end()
+
+        fragments.append(re.escape(path[position:].rstrip("/")))
+        return "".join(fragments)
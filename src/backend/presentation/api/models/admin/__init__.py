@@ -0,0 +1 @@
+"""Admin API models."""
@@ -0,0 +1,80 @@
+"""Admin users API models."""
+
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from backend.domain.entities.user import User
+from backend.domain.repositories.user import UserPosition
+from backend.domain.value_objects.user import UserId
+
+
+class AdminUserResponse(BaseModel):
+    """User as listed to administrators."""
+
+    id: int
+    first_name: str
+    last_name: str | None = None
+    username: str | None = None
+    photo_url: str | None = None
+    language_code: str | None = None
+    created_at: datetime
+
+    @classmethod
+    def from_entity(
+        cls,
+        position: UserPosition,
+        user: User,
+    ) -> AdminUserResponse:
+        """Create an AdminUserResponse from a listed User entity."""
+        return cls(
+            id=user.id.value,
+            first_name=user.first_name.value,
+            last_name=user.last_name.value,
+            username=user.username.value,
+            photo_url=user.photo_url.value,
+            language_code=user.language_code.value,
+            created_at=position.created_at,
+        )
+
+
+class AdminUsersResponse(BaseModel):
+    """Page of users listed to administrators."""
+
+    users: list[AdminUserResponse]
+    # pass as ``cursor`` to get the next page, null on the last page
+    next_cursor: str | None = None
+
+
+def encode_cursor(position: UserPosition) -> str:
+    """Encode a position into an opaque page cursor."""
+    raw = f"{position.created_at.isoformat()}|{position.user_id.value}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> UserPosition:
+    """Decode a page cursor made by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    """
+    msg = "Invalid cursor"
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, _, user_id = raw.decode().partition("|")
+        position = UserPosition(
+            datetime.fromisoformat(created_at),
+            UserId(int(user_id)),
+        )
+    # binascii.Error and UnicodeDecodeError are ValueErrors too
+    except (ValueError, TypeError) as e:
+        raise ValueError(msg) from e
+
+    # created_at is stored naive, Postgres cannot compare it to an aware one
+    if position.created_at.tzinfo is not None:
+        raise ValueError(msg)
+    return position
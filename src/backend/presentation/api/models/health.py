@@ -1,10 +1,68 @@
 """Health check models."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from backend.application.dtos.health import HealthServiceStatus
+
 
 class HealthCheckResponse(BaseModel):
     """Health check response."""
 
     status: str
     timestamp: int
+
+
+class DatabasePoolResponse(BaseModel):
+    """Database connection pool usage."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
+class DatabaseHealthResponse(BaseModel):
+    """Database health."""
+
+    connected: bool
+    latency_ms: float | None = None
+    pool: DatabasePoolResponse | None = None
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness response."""
+
+    status: str
+    checked_at: int
+    is_stale: bool
+    database: DatabaseHealthResponse
+
+    @classmethod
+    def from_status(cls, health: HealthServiceStatus) -> ReadinessResponse:
+        """Create a ReadinessResponse from a health snapshot."""
+        database = health.database
+        pool = database.pool
+        return cls(
+            status="ok" if health.is_healthy else "unavailable",
+            checked_at=int(health.checked_at),
+            is_stale=health.is_stale,
+            database=DatabaseHealthResponse(
+                connected=database.connected,
+                latency_ms=database.latency_ms,
+                pool=(
+                    DatabasePoolResponse(
+                        size=pool.size,
+                        checked_in=pool.checked_in,
+                        checked_out=pool.checked_out,
+                        overflow=pool.overflow,
+                    )
+                    if pool
+                    else None
+                ),
+            ),
+        )
@@ -0,0 +1,42 @@
+"""Users API models."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from backend.domain.entities.user import User
+
+
+class UserProfileResponse(BaseModel):
+    """Public profile of a user."""
+
+    id: int
+    first_name: str
+    last_name: str | None = None
+    username: str | None = None
+    photo_url: str | None = None
+
+    @classmethod
+    def from_entity(cls, user: User) -> UserProfileResponse:
+        """Create a UserProfileResponse from a User entity."""
+        return cls(
+            id=user.id.value,
+            first_name=user.first_name.value,
+            last_name=user.last_name.value,
+            username=user.username.value,
+            photo_url=user.photo_url.value,
+        )
+
+
+class UsersResponse(BaseModel):
+    """Users response."""
+
+    users: list[UserProfileResponse]
+
+    @classmethod
+    def from_entities(cls, users: list[User]) -> UsersResponse:
+        """Create a UsersResponse from User entities."""
+        return cls(users=[UserProfileResponse.from_entity(u) for u in users])
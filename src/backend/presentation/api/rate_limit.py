@@ -0,0 +1,123 @@
+"""Rate limiting for API routes."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+from typing import TYPE_CHECKING
+
+from fastapi import Request
+from pydantic_core import to_json
+
+from backend.application.dtos.rate_limit import Rate
+from backend.presentation.api.middlewares.authentication import TOKEN_COOKIE
+from backend.presentation.api.responses import PreEncodedJSONResponse
+from backend.shared import config, jwt
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fastapi import Response
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceededError(Exception):
+    """Rate limit exceeded error."""
+
+    def __init__(self, rate: Rate, retry_after: float) -> None:
+        """Initialize the rate limit exceeded error."""
+        super().__init__(f"Rate limit exceeded: {rate}")
+        self.rate = rate
+        self.retry_after = retry_after
+
+
+def rate_limit(
+    rate: str,
+    scope: str | None = None,
+) -> Callable[[Request], Awaitable[None]]:
+    """Create a dependency limiting requests to ``rate`` per client.
+
+    Clients are identified by their user id when a valid JWT is present
+    and by their IP address otherwise. Buckets are kept per route, or per
+    ``scope`` when given so several routes can share one.
+
+    Example::
+
+        @router.get("/ping", dependencies=[Depends(rate_limit("5/second"))])
+
+    Args:
+        rate: Rate like ``1/second`` or ``100/minute``
+        scope: Bucket scope shared between routes
+
+    Returns:
+        FastAPI dependency
+
+    """
+    parsed = Rate.parse(rate)
+
+    if not config.rate_limit.enabled:
+        return _unlimited
+
+    async def dependency(request: Request) -> None:
+        bucket_scope = scope or request.scope["route"].path
+        key = f"{bucket_scope}:{get_client_key(request)}"
+
+        result = await request.app.state.limiter.hit(key, parsed)
+        if not result.allowed:
+            raise RateLimitExceededError(parsed, result.retry_after)
+
+    return dependency
+
+
+async def _unlimited(request: Request) -> None:  # noqa: ARG001
+    """Rate limiting is disabled."""
+
+
+def get_client_key(request: Request) -> str:
+    """Identify the client of a request."""
+    state = request.scope.get("state") or {}
+    user_id = state.get("user_id")
+    if user_id:
+        return f"user:{user_id}"
+
+    token = request.cookies.get(TOKEN_COOKIE)
+    if token:
+        try:
+            sub = jwt.verify_auth_token(token).get("sub")
+        except Exception:  # noqa: BLE001
+            sub = None
+        if sub:
+            return f"user:{sub}"
+
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+_INTERNAL_ERROR_BODY = to_json({"error": "Internal server error"})
+
+
+@functools.lru_cache(maxsize=64)
+def _rate_limit_body(rate: Rate) -> bytes:
+    """Encode the 429 body for a rate once."""
+    return to_json(
+        {
+            "error": "Too many requests",
+            "detail": str(RateLimitExceededError(rate, 0)),
+        },
+    )
+
+
+async def rate_limit_handler(
+    request: Request,  # noqa: ARG001
+    exc: Exception,
+) -> Response:
+    """Rate limit handler."""
+    if isinstance(exc, RateLimitExceededError):
+        return PreEncodedJSONResponse(
+            _rate_limit_body(exc.rate),
+            status_code=429,
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
+
+    return PreEncodedJSONResponse(_INTERNAL_ERROR_BODY, status_code=500)
@@ -0,0 +1,77 @@
+"""JSON responses."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core.
+
+    Models are serialized once through their compiled serializer. Return
+    an instance from an endpoint to skip FastAPI's ``response_model``
+    re-validation; keep ``response_model`` on the route for the schema.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Render content to JSON bytes."""
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+
+        return to_json(content)
+
+
+class PreEncodedJSONResponse(Response):
+    """JSON response with an already encoded body."""
+
+    media_type = "application/json"
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """JSON response whose body is encoded while it is sent."""
+
+    media_type = "application/json"
+
+
+@functools.lru_cache(maxsize=256)
+def encode_error(detail: str) -> bytes:
+    """Encode a constant ``{"detail": ...}`` error body once."""
+    return to_json({"detail": detail})
+
+
+UNAUTHORIZED_BODY = encode_error("Unauthorized")
+
+
+async def http_exception_handler(
+    request: Request,  # noqa: ARG001
+    exc: Exception,
+) -> Response:
+    """HTTP exception handler reusing pre-encoded error bodies."""
+    if not isinstance(exc, HTTPException):
+        return PreEncodedJSONResponse(
+            encode_error("Internal server error"),
+            status_code=500,
+        )
+
+    if exc.status_code < 200 or exc.status_code in {204, 304}:
+        return Response(status_code=exc.status_code, headers=exc.headers)
+
+    body = (
+        encode_error(exc.detail)
+        if isinstance(exc.detail, str)
+        else to_json({"detail": exc.detail})
+    )
+    return PreEncodedJSONResponse(
+        body,
+        status_code=exc.status_code,
+        headers=exc.headers,
+    )
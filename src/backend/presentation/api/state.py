@@ -7,11 +7,15 @@ from typing import TYPE_CHECKING
 from starlette.datastructures import State
 
 if TYPE_CHECKING:
-    from slowapi import Limiter
+    from backend.application.services.rate_limit import IRateLimiter
+    from backend.infrastructure.services.uow_scope import (
+        RequestScopedUnitOfWorkFactory,
+    )
 
 
 class AppState(State):
     """App state."""
 
-    limiter: Limiter
+    limiter: IRateLimiter
+    unit_of_work: RequestScopedUnitOfWorkFactory
     user_id: int | None
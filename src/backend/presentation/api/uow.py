@@ -0,0 +1,22 @@
+"""Request-scoped unit of work."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+# resolved at runtime by FastAPI to inject the request
+from fastapi import Request
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+async def request_unit_of_work(request: Request) -> AsyncIterator[None]:
+    """Share one unit of work between the use cases of a request.
+
+    Nothing is checked out until a use case queries the database. The
+    work is committed after the endpoint returns and before the response
+    is sent, so a failed commit is still answered with an error.
+    """
+    async with request.app.state.unit_of_work.scope():
+        yield
@@ -2,10 +2,14 @@
 
 from fastapi import APIRouter
 
+from .admin import router as admin_router
 from .auth import router as auth_router
 from .user import router as user_router
+from .users import router as users_router
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(auth_router)
 router.include_router(user_router)
+router.include_router(users_router)
+router.include_router(admin_router)
@@ -0,0 +1,14 @@
+"""Admin API endpoints."""
+
+from fastapi import APIRouter, Depends
+
+from backend.presentation.api.admin import require_admin
+
+from .users import router as users_router
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)],
+)
+router.include_router(users_router)
@@ -0,0 +1,129 @@
+"""Admin users endpoints."""
+
+import logging
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic_core import to_json
+
+from backend.application.use_cases.user.list_users import IListUsersUseCase
+from backend.containers.user.use_cases import UserUseCaseContainer
+from backend.domain.entities.user import User
+from backend.domain.repositories.user import UserFilter, UserPosition
+from backend.presentation.api.models.admin.users import (
+    AdminUserResponse,
+    AdminUsersResponse,
+    decode_cursor,
+    encode_cursor,
+)
+from backend.presentation.api.responses import StreamingJSONResponse
+from backend.shared import config
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+_SERIALIZER = AdminUserResponse.__pydantic_serializer__
+
+
+async def _encode_page(
+    first: tuple[UserPosition, User] | None,
+    rest: AsyncIterator[tuple[UserPosition, User]],
+    limit: int,
+) -> AsyncIterator[bytes]:
+    """Encode an ``AdminUsersResponse`` one user at a time."""
+    yield b'{"users":['
+    count = 0
+    last: UserPosition | None = None
+    if first is not None:
+        position, user = first
+        yield _SERIALIZER.to_json(
+            AdminUserResponse.from_entity(position, user)
+        )
+        count, last = 1, position
+        async for position, user in rest:
+            yield b"," + _SERIALIZER.to_json(
+                AdminUserResponse.from_entity(position, user),
+            )
+            count, last = count + 1, position
+
+    # a full page may be followed by more users
+    next_cursor = encode_cursor(last) if last and count == limit else None
+    yield b'],"next_cursor":' + to_json(next_cursor) + b"}"
+
+
+@router.get(
+    "/users",
+    response_model=AdminUsersResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List users",
+    description=(
+        "Browse users in creation order, optionally filtered by language "
+        "and username prefix. Pages are read by keyset: pass "
+        "`next_cursor` as `cursor` to get the next one."
+    ),
+    response_description="Page of users, streamed",
+    responses={
+        200: {
+            "description": "Users listed successfully",
+            "model": AdminUsersResponse,
+        },
+        401: {"description": "Unauthorized"},
+        403: {"description": "Not an administrator"},
+        422: {"description": "Invalid cursor or filters"},
+        500: {"description": "Internal server error"},
+    },
+)
+@inject
+async def list_users(
+    list_users_use_case: Annotated[
+        IListUsersUseCase,
+        Depends(
+            Provide[UserUseCaseContainer.list_users],
+        ),
+    ],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=config.app.admin_users_page_max_size),
+    ] = 100,
+    cursor: Annotated[str | None, Query(max_length=200)] = None,
+    language_code: Annotated[
+        str | None,
+        Query(min_length=2, max_length=2),
+    ] = None,
+    username_prefix: Annotated[
+        str | None,
+        Query(min_length=1, max_length=32),
+    ] = None,
+) -> StreamingJSONResponse:
+    """List users."""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor",
+        ) from e
+
+    users = list_users_use_case.execute(
+        UserFilter(
+            language_code=language_code,
+            username_prefix=username_prefix,
+        ),
+        after,
+        limit,
+    )
+    try:
+        # errors before anything is sent still get a proper status
+        first = await users.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        logger.exception("Error listing users")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        ) from e
+
+    return StreamingJSONResponse(_encode_page(first, users, limit))
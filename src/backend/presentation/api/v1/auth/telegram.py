@@ -4,17 +4,9 @@ import logging
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import (
-    APIRouter,
-    Depends,
-    HTTPException,
-    Request,
-    Response,
-    status,
-)
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from backend.application.use_cases.user.ensure import IEnsureUserUseCase
-from backend.containers.services import ServiceContainer
 from backend.containers.user.use_cases import UserUseCaseContainer
 from backend.domain.entities.user import User
 from backend.domain.value_objects.user import (
@@ -25,10 +17,13 @@ from backend.domain.value_objects.user import (
     UserId,
     Username,
 )
+from backend.presentation.api.middlewares import public
 from backend.presentation.api.models.authentication.telegram import (
     TelegramAuthRequest,
     TelegramAuthResponse,
 )
+from backend.presentation.api.rate_limit import rate_limit
+from backend.presentation.api.responses import PydanticJSONResponse
 from backend.shared import config
 from backend.shared.jwt import create_auth_token
 from backend.shared.validators.webapp import (
@@ -39,7 +34,6 @@ from backend.shared.validators.webapp import (
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-limiter = ServiceContainer.limiter()
 
 
 def set_auth_cookie(response: Response, token: str) -> None:
@@ -56,10 +50,12 @@ def set_auth_cookie(response: Response, token: str) -> None:
 
 @router.post(
     "/telegram",
+    response_model=TelegramAuthResponse,
     status_code=status.HTTP_200_OK,
     summary="Telegram authentication endpoint",
     description="Authenticate via Telegram Mini App init_data",
     response_description="Telegram authentication response",
+    dependencies=[Depends(rate_limit("1/second"))],
     responses={
         200: {
             "description": "Authentication successful",
@@ -70,11 +66,9 @@ def set_auth_cookie(response: Response, token: str) -> None:
         500: {"description": "Internal server error"},
     },
 )
-@limiter.limit("1/second")
+@public
 @inject
 async def telegram_auth(
-    request: Request,  # noqa: ARG001
-    response: Response,
     auth_request: TelegramAuthRequest,
     ensure_user_use_case: Annotated[
         IEnsureUserUseCase,
@@ -82,7 +76,7 @@ async def telegram_auth(
             Provide[UserUseCaseContainer.ensure],
         ),
     ],
-) -> TelegramAuthResponse:
+) -> PydanticJSONResponse:
     """Authenticate via Telegram Mini App init_data."""
     try:
         web_app_init_data = validate_init_data(auth_request.init_data)
@@ -114,15 +108,19 @@ async def telegram_auth(
             config.jwt.issuer,
         )
 
+        response = PydanticJSONResponse(
+            TelegramAuthResponse(
+                status="success",
+                message="Telegram authentication successful",
+                created_at=created_at,
+                expires_at=expires_at,
+            ),
+        )
+
         set_auth_cookie(response, jwt_token)
         logger.debug("Set token httpOnly cookie")
 
-        return TelegramAuthResponse(
-            status="success",
-            message="Telegram authentication successful",
-            created_at=created_at,
-            expires_at=expires_at,
-        )
+        return response
 
     except WebAppInitDataValidationError as e:
         logger.warning("Invalid Telegram init_data: %s", str(e))
@@ -11,6 +11,7 @@ from backend.containers.user.use_cases import UserUseCaseContainer
 from backend.domain.exceptions.user import UserNotFoundError
 from backend.domain.value_objects.user import UserId
 from backend.presentation.api.models.user.me import UserMeResponse
+from backend.presentation.api.responses import PydanticJSONResponse
 from backend.shared.validators.fastapi import (
     UserIdNotFoundInStateError,
     get_user_id_from_state,
@@ -22,6 +23,7 @@ router = APIRouter()
 
 @router.get(
     "/me",
+    response_model=UserMeResponse,
     status_code=status.HTTP_200_OK,
     summary="Get current user profile",
     description="Retrieve the profile information for the authenticated user",
@@ -45,12 +47,12 @@ async def get_me(
             Provide[UserUseCaseContainer.get],
         ),
     ],
-) -> UserMeResponse:
+) -> PydanticJSONResponse:
     """Get user profile."""
     try:
         user_id = get_user_id_from_state(request)
         user = await get_user_use_case.execute(UserId(user_id))
-        return UserMeResponse.from_entity(user)
+        return PydanticJSONResponse(UserMeResponse.from_entity(user))
 
     except UserNotFoundError as e:
         logger.exception("User not found")
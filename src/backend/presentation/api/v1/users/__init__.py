@@ -0,0 +1,8 @@
+"""Users API endpoints."""
+
+from fastapi import APIRouter
+
+from .batch import router as batch_router
+
+router = APIRouter(tags=["Users"])
+router.include_router(batch_router)
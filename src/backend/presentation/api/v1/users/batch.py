@@ -0,0 +1,67 @@
+"""Batch user lookup endpoints."""
+
+import logging
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import Field
+
+from backend.application.use_cases.user.get_many import IGetUsersUseCase
+from backend.containers.user.use_cases import UserUseCaseContainer
+from backend.domain.constants.user import MAX_USER_ID
+from backend.domain.value_objects.user import UserId
+from backend.presentation.api.models.user.users import UsersResponse
+from backend.presentation.api.responses import PydanticJSONResponse
+from backend.shared import config
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get(
+    "/users",
+    response_model=UsersResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get user profiles",
+    description=(
+        "Retrieve the public profiles of several users at once, e.g. for "
+        "leaderboards and friend lists. Unknown IDs are left out."
+    ),
+    response_description="User profiles in the order of the requested IDs",
+    responses={
+        200: {
+            "description": "User profiles retrieved successfully",
+            "model": UsersResponse,
+        },
+        401: {"description": "Unauthorized"},
+        422: {"description": "No IDs or too many IDs"},
+        500: {"description": "Internal server error"},
+    },
+)
+@inject
+async def get_users(
+    ids: Annotated[
+        list[Annotated[int, Field(ge=0, le=MAX_USER_ID)]],
+        Query(min_length=1, max_length=config.app.users_batch_max_size),
+    ],
+    get_users_use_case: Annotated[
+        IGetUsersUseCase,
+        Depends(
+            Provide[UserUseCaseContainer.get_many],
+        ),
+    ],
+) -> PydanticJSONResponse:
+    """Get user profiles."""
+    try:
+        users = await get_users_use_case.execute(
+            [UserId(user_id) for user_id in ids],
+        )
+        return PydanticJSONResponse(UsersResponse.from_entities(users))
+
+    except Exception as e:
+        logger.exception("Error getting user profiles")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        ) from e
@@ -0,0 +1,89 @@
+"""Application server."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import uvicorn
+from gunicorn.app.base import BaseApplication
+
+from backend.shared import config, metrics
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from gunicorn.arbiter import Arbiter
+    from gunicorn.workers.base import Worker
+
+logger = logging.getLogger(__name__)
+
+
+class GunicornApplication(BaseApplication):
+    """Gunicorn application serving a preloaded ASGI app.
+
+    The app is imported once in the master process and workers are forked
+    from it (``preload_app``), so code and read-only state are shared
+    copy-on-write. The master supervises workers: workers that die or
+    stop heartbeating for ``worker_timeout`` seconds are replaced, and
+    ``SIGHUP`` restarts all workers gracefully.
+    """
+
+    def __init__(self, app: FastAPI, options: dict[str, Any]) -> None:
+        """Initialize the gunicorn application."""
+        self.application = app
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Load gunicorn settings."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)  # type: ignore[union-attr]
+
+    def load(self) -> FastAPI:
+        """Return the preloaded app."""
+        return self.application
+
+
+def _child_exit(_: Arbiter, worker: Worker) -> None:
+    """Drop the live metrics of an exited worker."""
+    metrics.mark_process_dead(int(worker.pid))
+
+
+def run(app: FastAPI) -> None:
+    """Serve the app.
+
+    Runs a single uvicorn process when one worker is configured, otherwise
+    a gunicorn master with uvicorn workers. uvloop and httptools are used
+    when installed.
+
+    Args:
+        app: FastAPI app
+
+    """
+    workers = config.app.worker_count
+
+    if workers == 1:
+        uvicorn.run(
+            app,
+            host=config.app.host,
+            port=config.app.port,
+            loop="auto",
+            http="auto",
+        )
+        return
+
+    logger.info("Starting %s worker processes", workers)
+    GunicornApplication(
+        app,
+        {
+            "bind": f"{config.app.host}:{config.app.port}",
+            "workers": workers,
+            "worker_class": "uvicorn_worker.UvicornWorker",
+            "preload_app": True,
+            "timeout": config.app.worker_timeout,
+            "graceful_timeout": config.app.graceful_timeout,
+            "max_requests": config.app.max_requests,
+            "max_requests_jitter": config.app.max_requests_jitter,
+            "child_exit": _child_exit,
+        },
+    ).run()
@@ -1,10 +1,12 @@
 """Config module."""
 
+import math
+import os
 from enum import Enum
-from typing import ClassVar
+from typing import Annotated, ClassVar
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Environment(str, Enum):
@@ -26,8 +28,35 @@ class APPConfig(BaseConfig):
     host: str = "0.0.0.0"  # noqa: S104
     port: int = Field(default=5000, ge=1, le=65535)
     bot_token: str
+    # reject init_data signed longer ago than this, 0 = never
+    init_data_max_age_seconds: int = Field(default=86400, ge=0)
     allowed_origins: str
     environment: Environment = Environment.DEVELOPMENT
+    # worker processes, 0 = one per available CPU
+    workers: int = Field(default=1, ge=0)
+    worker_timeout: int = Field(default=30, ge=1)
+    graceful_timeout: int = Field(default=30, ge=1)
+    # restart a worker after this many requests, 0 = never
+    max_requests: int = Field(default=0, ge=0)
+    max_requests_jitter: int = Field(default=0, ge=0)
+    # most user IDs accepted by a single GET /api/v1/users
+    users_batch_max_size: int = Field(default=100, ge=1, le=1000)
+    # comma-separated Telegram user IDs allowed to use /api/v1/admin
+    admin_user_ids: Annotated[frozenset[int], NoDecode] = frozenset()
+    # most users per page of GET /api/v1/admin/users
+    admin_users_page_max_size: int = Field(default=1000, ge=1)
+
+    @field_validator("admin_user_ids", mode="before")
+    @classmethod
+    def split_admin_user_ids(cls, value: object) -> object:
+        """Split the comma-separated IDs, a bad one fails on startup."""
+        if isinstance(value, str):
+            return [
+                user_id.strip()
+                for user_id in value.split(",")
+                if user_id.strip()
+            ]
+        return value
 
     @property
     def is_production(self) -> bool:
@@ -39,6 +68,17 @@ class APPConfig(BaseConfig):
         """Check if the environment is development."""
         return self.environment == Environment.DEVELOPMENT
 
+    @property
+    def worker_count(self) -> int:
+        """Number of worker processes."""
+        if self.workers:
+            return self.workers
+
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+
+        return os.cpu_count() or 1
+
     @property
     def allowed_origins_list(self) -> list[str]:
         """Allowed origins list."""
@@ -56,6 +96,10 @@ class JWTConfig(BaseConfig):
     issuer: str = "backend"
     expiry_days: int = 1
     algorithm: str = "HS256"
+    # in-process cache of verified tokens (opt-in)
+    cache_enabled: bool = False
+    cache_max_size: int = Field(default=10_000, ge=1)
+    cache_ttl_seconds: int = Field(default=300, ge=1)
 
     model_config = SettingsConfigDict(
         env_prefix="JWT_",
@@ -64,6 +108,27 @@ class JWTConfig(BaseConfig):
     )
 
 
+class DatabaseBackend(str, Enum):
+    """Database access backend enum."""
+
+    SQLALCHEMY = "sqlalchemy"
+    ASYNCPG = "asyncpg"
+
+
+class ReplicaBalancing(str, Enum):
+    """Read replica balancing enum."""
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+class ReplicaStickyBackend(str, Enum):
+    """Read replica sticky keys backend enum."""
+
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
 class DBConfig(BaseConfig):
     """DB config class."""
 
@@ -72,6 +137,33 @@ class DBConfig(BaseConfig):
     user: str
     password: str
     name: str
+    backend: DatabaseBackend = DatabaseBackend.SQLALCHEMY
+    # connection cap shared by all worker processes
+    max_connections: int = Field(default=50, ge=1)
+    # wait for a free pooled connection before failing
+    pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    pool_recycle_seconds: int = Field(default=3600, ge=1)
+    # ping connections idle longer than this on checkout, 0 = every checkout
+    pre_ping_idle_seconds: float = Field(default=10.0, ge=0)
+    # connections opened per worker before serving, capped by the pool size
+    warmup_connections: int = Field(default=0, ge=0)
+    connect_timeout_seconds: float = Field(default=10.0, gt=0)
+    # per statement, 0 = no limit
+    command_timeout_seconds: float = Field(default=0, ge=0)
+    # compiled SQL cache of the engine, per worker
+    query_cache_size: int = Field(default=500, ge=0)
+    # prepared statements cached per connection, 0 = off (pgbouncer)
+    prepared_statement_cache_size: int = Field(default=100, ge=0)
+    # comma-separated read replica URLs, reads use the primary when empty
+    replica_urls: str = ""
+    replica_balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN
+    # an unreachable replica is skipped for this long
+    replica_retry_seconds: float = Field(default=30.0, gt=0)
+    # reads of just written rows go to the primary for this long, 0 = off
+    replica_sticky_seconds: float = Field(default=5.0, ge=0)
+    # "memory" only sees writes of its own worker, "redis" is shared
+    replica_sticky_backend: ReplicaStickyBackend = ReplicaStickyBackend.MEMORY
+    replica_sticky_max_size: int = Field(default=100_000, ge=1)
 
     model_config = SettingsConfigDict(
         env_prefix="DB_",
@@ -87,6 +179,228 @@ class DBConfig(BaseConfig):
             f"@{self.host}:{self.port}/{self.name}"
         )
 
+    @property
+    def dsn(self) -> str:
+        """DB URL for asyncpg."""
+        return (
+            f"postgresql://{self.user}:{self.password}"
+            f"@{self.host}:{self.port}/{self.name}"
+        )
+
+    @property
+    def replica_url_list(self) -> list[str]:
+        """Read replica URLs."""
+        return [
+            url.strip() for url in self.replica_urls.split(",") if url.strip()
+        ]
+
+    def check_replicas(self, workers: int) -> None:
+        """Refuse replica settings that cannot read the user's writes.
+
+        Raises:
+            ValueError: Sticky keys kept per process with several workers
+
+        """
+        if (
+            self.replica_url_list
+            and self.replica_sticky_seconds
+            and self.replica_sticky_backend == ReplicaStickyBackend.MEMORY
+            and workers > 1
+        ):
+            msg = (
+                "DB_REPLICA_STICKY_BACKEND=memory only tracks writes of "
+                "its own worker, use redis with several workers or set "
+                "DB_REPLICA_STICKY_SECONDS=0"
+            )
+            raise ValueError(msg)
+
+    def check_pool(self, workers: int) -> None:
+        """Refuse more workers than ``max_connections`` can serve.
+
+        Raises:
+            ValueError: Fewer connections than workers
+
+        """
+        if workers > self.max_connections:
+            msg = (
+                f"{workers} workers need at least one connection each, "
+                f"raise DB_MAX_CONNECTIONS from {self.max_connections} to "
+                f"at least {workers} or run fewer workers"
+            )
+            raise ValueError(msg)
+
+    def pool_limits(self, workers: int) -> tuple[int, int]:
+        """Per-worker pool size and overflow within ``max_connections``.
+
+        Two fifths of a worker's connections (rounded up) are kept open,
+        the other three fifths are overflow opened under load.
+
+        Returns:
+            tuple[int, int]: pool size, max overflow
+
+        """
+        per_worker = max(1, self.max_connections // max(1, workers))
+        pool_size = max(1, math.ceil(per_worker * 2 / 5))
+        return pool_size, per_worker - pool_size
+
+    @property
+    def connect_args(self) -> dict[str, float]:
+        """asyncpg connection arguments."""
+        connect_args = {
+            "timeout": self.connect_timeout_seconds,
+            "prepared_statement_cache_size": (
+                self.prepared_statement_cache_size
+            ),
+        }
+        if self.command_timeout_seconds:
+            connect_args["command_timeout"] = self.command_timeout_seconds
+
+        return connect_args
+
+
+class CacheBackend(str, Enum):
+    """Cache backend enum."""
+
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class CacheConfig(BaseConfig):
+    """Cache config class."""
+
+    backend: CacheBackend = CacheBackend.MEMORY
+    user_max_size: int = Field(default=100_000, ge=1)
+    user_ttl_seconds: int = Field(default=300, ge=1)
+    # skip writing unchanged profiles, unset = only with a single worker
+    user_fingerprint_enabled: bool | None = None
+    user_fingerprint_max_size: int = Field(default=100_000, ge=1)
+    user_fingerprint_ttl_seconds: int = Field(default=3600, ge=1)
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        extra="ignore",
+        frozen=True,
+    )
+
+    def fingerprints_enabled(self, workers: int) -> bool:
+        """Whether unchanged profile writes are skipped.
+
+        Fingerprints are kept per process: with several workers one of
+        them can skip a profile another has since overwritten, leaving
+        the row stale for up to ``user_fingerprint_ttl_seconds``.
+        """
+        if self.user_fingerprint_enabled is None:
+            return workers == 1
+        return self.user_fingerprint_enabled
+
+
+class RateLimitBackend(str, Enum):
+    """Rate limit backend enum."""
+
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class RateLimitConfig(BaseConfig):
+    """Rate limit config class."""
+
+    enabled: bool = True
+    backend: RateLimitBackend = RateLimitBackend.MEMORY
+    # buckets kept by the memory backend, idlest evicted first
+    max_keys: int = Field(default=100_000, ge=1)
+    # limit applied to every /api route, e.g. "20/second"
+    default: str | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="RATE_LIMIT_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class WriteDurability(str, Enum):
+    """Write-behind durability enum."""
+
+    BUFFERED = "buffered"
+    FLUSHED = "flushed"
+
+
+class WriteBehindConfig(BaseConfig):
+    """Write-behind config class."""
+
+    enabled: bool = False
+    flush_interval_ms: int = Field(default=50, ge=1)
+    max_batch_size: int = Field(default=500, ge=1, le=4000)
+    max_pending: int = Field(default=10_000, ge=1)
+    durability: WriteDurability = WriteDurability.FLUSHED
+
+    model_config = SettingsConfigDict(
+        env_prefix="WRITE_BEHIND_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class RedisConfig(BaseConfig):
+    """Redis config class."""
+
+    url: str = "redis://localhost:6379/0"
+
+    model_config = SettingsConfigDict(
+        env_prefix="REDIS_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class HealthConfig(BaseConfig):
+    """Health config class."""
+
+    probe_interval_seconds: float = Field(default=5.0, gt=0)
+    probe_timeout_seconds: float = Field(default=2.0, gt=0)
+    # snapshots older than this are reported as not ready
+    max_age_seconds: float = Field(default=30.0, gt=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="HEALTH_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class MetricsConfig(BaseConfig):
+    """Metrics config class."""
+
+    enabled: bool = False
+    path: str = "/metrics"
+    # bearer token scrapers must send, unset = no authentication
+    token: str | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="METRICS_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class ProfilingConfig(BaseConfig):
+    """Profiling config class."""
+
+    enabled: bool = False
+    # profiles a single request on demand, development only
+    header: str = "X-Profile"
+    # fraction of requests sampled and aggregated per route
+    sample_rate: float = Field(default=0.0, ge=0, le=1)
+    flush_every: int = Field(default=20, ge=1)
+    interval_ms: float = Field(default=1.0, gt=0)
+    output_dir: str = "profiles"
+
+    model_config = SettingsConfigDict(
+        env_prefix="PROFILING_",
+        extra="ignore",
+        frozen=True,
+    )
+
 
 class Config:
     """Global application config."""
@@ -94,6 +408,13 @@ class Config:
     app: ClassVar[APPConfig] = APPConfig()  # type: ignore[call-arg]
     jwt: ClassVar[JWTConfig] = JWTConfig()  # type: ignore[call-arg]
     db: ClassVar[DBConfig] = DBConfig()  # type: ignore[call-arg]
+    cache: ClassVar[CacheConfig] = CacheConfig()
+    redis: ClassVar[RedisConfig] = RedisConfig()
+    write_behind: ClassVar[WriteBehindConfig] = WriteBehindConfig()
+    rate_limit: ClassVar[RateLimitConfig] = RateLimitConfig()
+    health: ClassVar[HealthConfig] = HealthConfig()
+    metrics: ClassVar[MetricsConfig] = MetricsConfig()
+    profiling: ClassVar[ProfilingConfig] = ProfilingConfig()
 
 
 config = Config()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 from datetime import datetime, timedelta
+from typing import Any
 
 from jwt import (
     DecodeError,
@@ -13,10 +16,26 @@ from jwt import (
     encode,
 )
 
-from backend.shared import config
+from backend.shared import config, metrics
+from backend.shared.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+_CACHE_HIT = metrics.JWT_CACHE_EVENTS.labels("hit")
+_CACHE_MISS = metrics.JWT_CACHE_EVENTS.labels("miss")
+_CACHE_EXPIRATION = metrics.JWT_CACHE_EVENTS.labels("expiration")
+_CACHE_EVICTION = metrics.JWT_CACHE_EVENTS.labels("eviction")
+
+# verified claims keyed by the token digest, see verify_auth_token
+token_cache: LRUCache[bytes, dict[str, Any]] | None = (
+    LRUCache(
+        maxsize=config.jwt.cache_max_size,
+        ttl=config.jwt.cache_ttl_seconds,
+    )
+    if config.jwt.cache_enabled
+    else None
+)
+
 
 def create_auth_token(sub: str) -> tuple[str, datetime, datetime]:
     """Create a JWT token.
@@ -49,8 +68,49 @@ def create_auth_token(sub: str) -> tuple[str, datetime, datetime]:
         return jwt_token, created_at, expires_at
 
 
-def verify_auth_token(token: str) -> dict:
-    """Verify a JWT token and return its payload."""
+def verify_auth_token(token: str) -> dict[str, Any]:
+    """Verify a JWT token and return its payload.
+
+    When the token cache is enabled, verified claims are cached under the
+    token digest for at most ``JWT_CACHE_TTL_SECONDS`` and never past the
+    token's own ``exp``. Failed verifications are never cached. Hits,
+    misses, expirations and evictions are exported as
+    ``auth_jwt_cache_events_total``.
+    """
+    if token_cache is None:
+        return _decode_auth_token(token)
+
+    key = _token_digest(token)
+    stats = token_cache.stats
+    expirations = stats.expirations
+    claims = token_cache.get(key)
+    if claims is not None:
+        _CACHE_HIT.inc()
+        return claims.copy()
+
+    _CACHE_MISS.inc()
+    if stats.expirations > expirations:
+        _CACHE_EXPIRATION.inc()
+
+    claims = _decode_auth_token(token)
+    expires_in = claims.get("exp", 0) - time.time()
+    evictions = stats.evictions
+    token_cache.set(
+        key,
+        claims.copy(),
+        ttl=min(token_cache.ttl, expires_in),
+    )
+    _CACHE_EVICTION.inc(stats.evictions - evictions)
+    return claims
+
+
+def _token_digest(token: str) -> bytes:
+    """Return the cache key of a token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _decode_auth_token(token: str) -> dict[str, Any]:
+    """Decode a JWT token and verify its signature and claims."""
     try:
         return decode(
             token,
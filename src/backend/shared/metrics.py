@@ -0,0 +1,126 @@
+"""Prometheus metrics.
+
+Metrics are recorded through label children bound once and reused, so the
+hot path is a dict lookup plus an uncontended lock per update.
+
+With more than one worker the metrics are kept in
+``PROMETHEUS_MULTIPROC_DIR`` and aggregated across workers on scrape. The
+directory is created automatically when the variable is not set; it has
+to be set before ``prometheus_client`` is imported.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from backend.shared._config import config
+
+if (
+    config.app.worker_count > 1
+    and "PROMETHEUS_MULTIPROC_DIR" not in os.environ
+):
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(
+        prefix="prometheus-",
+    )
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=(
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+    ),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections currently open beyond the pool size.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+DB_COMPILED_CACHE_LOOKUPS = Counter(
+    "db_compiled_cache_lookups",
+    "Statements executed by compiled SQL cache outcome.",
+    ["result"],
+)
+
+JWT_VERIFICATIONS = Counter(
+    "auth_jwt_verifications",
+    "JWT verifications by outcome.",
+    ["outcome"],
+)
+JWT_CACHE_EVENTS = Counter(
+    "auth_jwt_cache_events",
+    "Verified JWT cache lookups and removals by event.",
+    ["event"],
+)
+INIT_DATA_VALIDATIONS = Counter(
+    "auth_init_data_validations",
+    "Telegram init_data validations by outcome.",
+    ["outcome"],
+)
+
+ENSURE_USER_WRITES = Counter(
+    "ensure_user_writes",
+    "Profiles ensured on login by what happened to the write.",
+    ["result"],
+)
+
+
+def render() -> tuple[bytes, str]:
+    """Render all metrics in the Prometheus text format.
+
+    Returns:
+        tuple[bytes, str]: Exposition body and its content type
+
+    """
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop the live gauges of a dead worker process."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
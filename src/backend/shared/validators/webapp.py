@@ -1,52 +1,255 @@
-"""Web App init data validation."""
+"""Web App init data validation.
 
-import logging
-from datetime import datetime
+Implements the check described in
+https://core.telegram.org/bots/webapps#validating-data-received-via-the-web-app
+and parses only the ``user`` fields the application uses.
+"""
 
-from aiogram.utils.web_app import (
-    WebAppInitData,
-    WebAppUser,
-    safe_parse_webapp_init_data,
-)
+from __future__ import annotations
+
+import codecs
+import hmac
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import unquote_plus
 
-from backend.shared import config
+from backend.shared import config, metrics
 
 logger = logging.getLogger(__name__)
 
+_INIT_DATA_VALID = metrics.INIT_DATA_VALIDATIONS.labels("valid")
+_INIT_DATA_INVALID = metrics.INIT_DATA_VALIDATIONS.labels("invalid")
+_INIT_DATA_EXPIRED = metrics.INIT_DATA_VALIDATIONS.labels("expired")
+_INIT_DATA_SKIPPED = metrics.INIT_DATA_VALIDATIONS.labels("skipped")
+_INIT_DATA_NO_USER = metrics.INIT_DATA_VALIDATIONS.labels("missing_user")
+
 
 class WebAppInitDataValidationError(Exception):
     """Web App init data validation error."""
 
 
+class WebAppInitDataExpiredError(WebAppInitDataValidationError):
+    """Web App init data is older than the allowed age."""
+
+
+@dataclass(frozen=True, slots=True)
+class WebAppUser:
+    """Web App user fields used by the application."""
+
+    id: int
+    first_name: str
+    last_name: str | None = None
+    username: str | None = None
+    language_code: str | None = None
+    photo_url: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WebAppInitData:
+    """Validated Web App init data."""
+
+    auth_date: int
+    hash: str
+    user: WebAppUser | None = None
+
+
+class InitDataValidator:
+    """Validate init_data signed for one bot.
+
+    The secret key is derived from the bot token once. Stale ``auth_date``
+    is rejected before any HMAC work, the data-check-string is built and
+    hashed once, and only the ``user`` field is decoded.
+    """
+
+    def __init__(self, bot_token: str, max_age: int = 0) -> None:
+        """Initialize the validator.
+
+        Args:
+            bot_token: Token of the bot the init_data is signed for
+            max_age: Maximum age of ``auth_date`` in seconds, 0 = no limit
+
+        """
+        self.max_age = max_age
+        self._secret_key = hmac.digest(
+            b"WebAppData",
+            bot_token.encode(),
+            "sha256",
+        )
+
+    def validate(
+        self,
+        init_data: str,
+        now: float | None = None,
+    ) -> WebAppInitData:
+        """Validate init_data and return its parsed fields.
+
+        Raises:
+            WebAppInitDataExpiredError: If ``auth_date`` is too old
+            WebAppInitDataValidationError: If init_data is malformed or
+                its hash does not match
+
+        """
+        fields = _parse_query(init_data)
+
+        received_hash = fields.pop("hash", None)
+        if received_hash is None:
+            msg = "Hash is not found in init_data"
+            raise WebAppInitDataValidationError(msg)
+
+        auth_date = _parse_auth_date(fields.get("auth_date"))
+        if self.max_age and (
+            (time.time() if now is None else now) - auth_date > self.max_age
+        ):
+            msg = "init_data is expired"
+            raise WebAppInitDataExpiredError(msg)
+
+        data_check_string = "\n".join(
+            f"{key}={value}" for key, value in sorted(fields.items())
+        )
+        expected_hash = hmac.digest(
+            self._secret_key,
+            data_check_string.encode(),
+            "sha256",
+        ).hex()
+        if not hmac.compare_digest(
+            expected_hash.encode(),
+            received_hash.encode(),
+        ):
+            msg = "Invalid init_data signature"
+            raise WebAppInitDataValidationError(msg)
+
+        user = fields.get("user")
+        return WebAppInitData(
+            auth_date=auth_date,
+            hash=received_hash,
+            user=_parse_user(user) if user is not None else None,
+        )
+
+
+def _parse_query(init_data: str) -> dict[str, str]:
+    """Decode a query string like ``parse_qsl(strict_parsing=True)``.
+
+    Blank values are dropped and the last of repeated keys wins, as the
+    data-check-string is built from the same mapping.
+    """
+    fields: dict[str, str] = {}
+    if not init_data:
+        return fields
+
+    for pair in init_data.split("&"):
+        key, separator, value = pair.partition("=")
+        if not separator:
+            msg = "Invalid init_data query string"
+            raise WebAppInitDataValidationError(msg)
+        if value:
+            fields[_unquote(key)] = _unquote(value)
+
+    return fields
+
+
+def _unquote(value: str) -> str:
+    """Decode like ``unquote_plus``, several times faster on JSON values.
+
+    ``%XX`` escapes are rewritten to ``\\xXX`` and decoded in C; malformed
+    escapes fall back to ``unquote_plus``, which leaves them as they are.
+    """
+    if "%" not in value:
+        return value.replace("+", " ")
+
+    try:
+        decoded, _ = codecs.escape_decode(
+            value.replace("\\", "\\\\")
+            .replace("+", " ")
+            .replace("%", "\\x")
+            .encode(),
+        )
+    except ValueError:
+        return unquote_plus(value)
+
+    # typeshed declares str, escape_decode returns bytes
+    return decoded.decode("utf-8", "replace")  # type: ignore[attr-defined]
+
+
+def _parse_auth_date(value: str | None) -> int:
+    """Parse ``auth_date`` as Unix time."""
+    if value is None or not (value.isascii() and value.isdigit()):
+        msg = "Invalid auth_date in init_data"
+        raise WebAppInitDataValidationError(msg)
+
+    return int(value)
+
+
+def _parse_user(value: str) -> WebAppUser:
+    """Parse the ``user`` field of init_data."""
+    try:
+        user: Any = json.loads(value)
+    except ValueError:
+        user = None
+
+    if (
+        not isinstance(user, dict)
+        or type(user.get("id")) is not int
+        or not isinstance(user.get("first_name"), str)
+    ):
+        msg = "Invalid user in init_data"
+        raise WebAppInitDataValidationError(msg)
+
+    optional = {
+        name: user.get(name)
+        for name in ("last_name", "username", "language_code", "photo_url")
+    }
+    if any(
+        field is not None and not isinstance(field, str)
+        for field in optional.values()
+    ):
+        msg = "Invalid user in init_data"
+        raise WebAppInitDataValidationError(msg)
+
+    return WebAppUser(id=user["id"], first_name=user["first_name"], **optional)
+
+
+init_data_validator = InitDataValidator(
+    config.app.bot_token,
+    config.app.init_data_max_age_seconds,
+)
+
+
 def validate_init_data(init_data: str) -> WebAppInitData:
     """Validate Web App init data request."""
     if not config.app.is_production:
         logger.debug("Skipping validation in development environment")
+        _INIT_DATA_SKIPPED.inc()
         return WebAppInitData(
             user=WebAppUser(
                 id=1,
                 first_name="developer",
             ),
-            auth_date=datetime.now().astimezone(),
+            auth_date=int(time.time()),
             hash="developer",
         )
 
     try:
-        return safe_parse_webapp_init_data(
-            config.app.bot_token,
-            init_data,
-        )
+        web_app_init_data = init_data_validator.validate(init_data)
+
+    except WebAppInitDataExpiredError:
+        _INIT_DATA_EXPIRED.inc()
+        raise
+
+    except WebAppInitDataValidationError:
+        _INIT_DATA_INVALID.inc()
+        raise
 
-    except Exception as e:
-        msg = "Invalid init_data"
-        raise WebAppInitDataValidationError(
-            msg,
-        ) from e
+    _INIT_DATA_VALID.inc()
+    return web_app_init_data
 
 
 def validate_user_presence(web_app_init_data: WebAppInitData) -> WebAppUser:
     """Validate that user is present in init_data."""
     if not web_app_init_data.user:
+        _INIT_DATA_NO_USER.inc()
         msg = "User is not found in init_data"
         logger.error(msg)
         raise WebAppInitDataValidationError(msg) from None
@@ -0,0 +1,389 @@
+"""Bulk export and import of the users table.
+
+Streams users to and from NDJSON or CSV files with PostgreSQL ``COPY``,
+memory stays bounded by one batch whatever the size of the table::
+
+    python -m backend.tools.users export users.ndjson
+    python -m backend.tools.users export - --format csv > users.csv
+    python -m backend.tools.users import users.ndjson --batch-size 20000
+    python -m backend.tools.users import users.ndjson --resume
+
+Imports upsert: new users are inserted, changed profiles updated and the
+original ``created_at`` kept. Every batch is committed on its own and
+recorded in a checkpoint file, so an interrupted import continues after
+the last committed batch with ``--resume``. Records are validated by the
+user value objects; invalid ones are logged and skipped, the import
+stops once more than ``--max-errors`` are found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import csv
+import io
+import json
+import logging
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+from backend.infrastructure.database.adapters.user import UserAdapter
+from backend.infrastructure.database.user_copy import UserCopy, UserFileFormat
+from backend.infrastructure.database.user_sql import COLUMNS
+from backend.shared import config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO, TextIO
+
+logger = logging.getLogger(__name__)
+
+STDIO = "-"
+
+
+class ImportAbortedError(Exception):
+    """Raised when an import finds more invalid records than allowed."""
+
+
+class Checkpoint:
+    """Number of input records an import has committed, kept in a file."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the checkpoint."""
+        self.path = path
+
+    def load(self) -> int:
+        """Return the committed record count, 0 without a checkpoint."""
+        try:
+            return json.loads(self.path.read_text())["records"]
+        except FileNotFoundError:
+            return 0
+
+    def save(self, records: int) -> None:
+        """Record ``records`` as committed, atomically."""
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        temporary.write_text(json.dumps({"records": records}))
+        temporary.replace(self.path)
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the import is complete."""
+        self.path.unlink(missing_ok=True)
+
+
+def read_records(
+    file: TextIO,
+    file_format: UserFileFormat,
+) -> Iterator[dict[str, Any] | str]:
+    """Yield the raw records of a file, or an error for unreadable ones.
+
+    CSV fields are strings, empty ones are read as ``None`` and IDs are
+    converted to integers when they are numeric.
+    """
+    if file_format == UserFileFormat.CSV:
+        for row in csv.DictReader(file):
+            record: dict[str, Any] = {
+                name: value or None for name, value in row.items()
+            }
+            user_id = record.get("id")
+            if isinstance(user_id, str) and user_id.isdigit():
+                record["id"] = int(user_id)
+            yield record
+        return
+
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield f"invalid JSON: {e}"
+            continue
+        yield record if isinstance(record, dict) else "not a JSON object"
+
+
+def prepare_batch(
+    records: list[dict[str, Any] | str],
+    created_at: datetime,
+) -> tuple[list[tuple[Any, ...]], dict[int, str]]:
+    """Validate a batch and turn it into ``COPY`` records.
+
+    Records are validated column by column; later records win over
+    earlier ones with the same ID.
+
+    Args:
+        records: Raw records, or errors for unreadable ones
+        created_at: Creation time of records without one
+
+    Returns:
+        tuple: unique valid records in ``COLUMNS`` order, errors of the
+            invalid ones by index in ``records``
+
+    """
+    errors = {
+        index: record
+        for index, record in enumerate(records)
+        if isinstance(record, str)
+    }
+    rows = [{} if isinstance(record, str) else record for record in records]
+    columns = {name: [row.get(name) for row in rows] for name in COLUMNS}
+
+    timestamps: list[datetime] = []
+    for index, value in enumerate(columns["created_at"]):
+        if isinstance(value, datetime):
+            timestamps.append(value)
+            continue
+        try:
+            timestamps.append(
+                datetime.fromisoformat(value) if value else created_at,
+            )
+        except (TypeError, ValueError):
+            errors.setdefault(index, f"created_at: invalid timestamp {value}")
+            timestamps.append(created_at)
+    columns["created_at"] = timestamps
+
+    for index, error in UserAdapter.validate_columns(columns).items():
+        errors.setdefault(index, error)
+
+    unique: dict[int, tuple[Any, ...]] = {}
+    for index, values in enumerate(zip(*columns.values(), strict=True)):
+        if index not in errors:
+            unique[values[0]] = values
+
+    return list(unique.values()), errors
+
+
+def batched(
+    records: Iterable[dict[str, Any] | str],
+    size: int,
+) -> Iterator[list[dict[str, Any] | str]]:
+    """Split records into lists of ``size``."""
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def detect_format(
+    path: str,
+    file_format: UserFileFormat | None,
+) -> UserFileFormat:
+    """Return the given format, or the one matching the file extension."""
+    if file_format is not None:
+        return file_format
+    if path.lower().endswith(".csv"):
+        return UserFileFormat.CSV
+    return UserFileFormat.NDJSON
+
+
+@contextlib.contextmanager
+def open_output(path: str) -> Iterator[BinaryIO]:
+    """Open the export destination, ``-`` for stdout."""
+    if path == STDIO:
+        yield sys.stdout.buffer
+        return
+    with Path(path).open("wb") as file:
+        yield file
+
+
+@contextlib.contextmanager
+def open_input(path: str) -> Iterator[TextIO]:
+    """Open the import source, ``-`` for stdin."""
+    if path == STDIO:
+        yield io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+        return
+    with Path(path).open(encoding="utf-8", newline="") as file:
+        yield file
+
+
+async def export_users(path: str, file_format: UserFileFormat) -> None:
+    """Write the users table to ``path``."""
+    started = time.perf_counter()
+    connection = await asyncpg.connect(config.db.dsn)
+    try:
+        with open_output(path) as output:
+            rows = await UserCopy(connection).export(output, file_format)
+    finally:
+        await connection.close()
+
+    logger.info(
+        "Exported %s users in %.1fs",
+        rows,
+        time.perf_counter() - started,
+    )
+
+
+async def import_users(
+    path: str,
+    file_format: UserFileFormat,
+    batch_size: int,
+    max_errors: int,
+    checkpoint: Checkpoint | None,
+) -> None:
+    """Upsert the users of ``path`` in batches of ``batch_size``.
+
+    Raises:
+        ImportAbortedError: More than ``max_errors`` invalid records
+
+    """
+    skipped = checkpoint.load() if checkpoint else 0
+    if skipped:
+        logger.info("Resuming after %s committed records", skipped)
+
+    started = time.perf_counter()
+    position, written, invalid = skipped, 0, 0
+    created_at = datetime.now()
+
+    connection = await asyncpg.connect(config.db.dsn)
+    try:
+        copier = UserCopy(connection)
+        with open_input(path) as file:
+            records = read_records(file, file_format)
+            collections.deque(islice(records, skipped), maxlen=0)
+
+            for batch in batched(records, batch_size):
+                values, errors = prepare_batch(batch, created_at)
+                for index, error in sorted(errors.items()):
+                    logger.warning(
+                        "Record %s: %s", position + index + 1, error
+                    )
+
+                invalid += len(errors)
+                if invalid > max_errors:
+                    msg = (
+                        f"{invalid} invalid records, more than "
+                        f"--max-errors={max_errors}"
+                    )
+                    raise ImportAbortedError(msg)
+
+                written += await copier.import_batch(values)
+                position += len(batch)
+                if checkpoint:
+                    checkpoint.save(position)
+
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    "%s records read, %s users written, %.0f records/s",
+                    position,
+                    written,
+                    (position - skipped) / elapsed,
+                )
+    finally:
+        await connection.close()
+
+    if checkpoint:
+        checkpoint.clear()
+
+    logger.info(
+        "Imported %s records (%s users written, %s invalid) in %.1fs",
+        position - skipped,
+        written,
+        invalid,
+        time.perf_counter() - started,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line tool."""
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.tools.users",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    formats = [file_format.value for file_format in UserFileFormat]
+
+    export_parser = commands.add_parser("export", help="write users to a file")
+    export_parser.add_argument("path", help="output file, - for stdout")
+    export_parser.add_argument(
+        "--format",
+        choices=formats,
+        help="defaults to the file extension, ndjson for stdout",
+    )
+
+    import_parser = commands.add_parser(
+        "import", help="upsert users from a file"
+    )
+    import_parser.add_argument("path", help="input file, - for stdin")
+    import_parser.add_argument(
+        "--format",
+        choices=formats,
+        help="defaults to the file extension, ndjson for stdin",
+    )
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10_000,
+        help="records committed per transaction (default: %(default)s)",
+    )
+    import_parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=0,
+        help="invalid records skipped before aborting (default: %(default)s)",
+    )
+    import_parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="progress file, defaults to PATH.checkpoint (none for stdin)",
+    )
+    import_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip the records committed by a previous run",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        stream=sys.stderr,
+    )
+
+    file_format = detect_format(
+        args.path,
+        UserFileFormat(args.format) if args.format else None,
+    )
+    if args.command == "export":
+        asyncio.run(export_users(args.path, file_format))
+        return 0
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    checkpoint_path = args.checkpoint or (
+        Path(f"{args.path}.checkpoint") if args.path != STDIO else None
+    )
+    if args.resume and checkpoint_path is None:
+        parser.error("--resume from stdin needs --checkpoint")
+
+    checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+    if checkpoint and not args.resume:
+        checkpoint.clear()
+
+    try:
+        asyncio.run(
+            import_users(
+                args.path,
+                file_format,
+                args.batch_size,
+                args.max_errors,
+                checkpoint,
+            ),
+        )
+    except ImportAbortedError as e:
+        logger.error("Import aborted: %s", e)  # noqa: TRY400
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())